@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark the analysis file inventory on a synthetic JS monorepo.
+
+Generates (once, under ``--workdir``) a git repository shaped like a
+pnpm workspace: ``packages/*/src`` sources and tests, per-package
+``dist/`` build output, and a large ``node_modules/`` tree, with build
+output and dependencies gitignored. Then compares, best of ``--rounds``:
+
+    rglob x2         the two tree-wide ``rglob`` calls the detectors made
+                     before RepoSnapshot (``*.py`` for LOC, ``*test*``)
+    walk inventory   ``RepoSnapshot(use_git=False).files`` — pruned walk
+    git inventory    ``RepoSnapshot().files`` — one ``git ls-files`` spawn
+    health (walk)    ``compute_health_score`` on a walked snapshot
+    health (git)     ``compute_health_score`` on a git-indexed snapshot
+    loc serial       the old line-by-line read of every source file
+    loc              ``count_loc`` on a thread pool, cache disabled
+    loc (cached)     ``count_loc`` served from the per-tree cache
+
+Usage:
+    python scripts/bench_inventory.py
+    python scripts/bench_inventory.py --packages 400 --deps 2000 --rounds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Allow running from scripts/ without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from git_repo_agent.tools.health_check import compute_health_score  # noqa: E402
+from git_repo_agent.tools.loc_counter import count_loc, language_of  # noqa: E402
+from git_repo_agent.tools.repo_snapshot import RepoSnapshot  # noqa: E402
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _make_monorepo(root: Path, packages: int, deps: int, dep_files: int) -> None:
+    _write(root / "package.json", '{"private": true, "workspaces": ["packages/*"]}\n')
+    _write(root / "pnpm-lock.yaml", "lockfileVersion: '9.0'\n")
+    _write(root / "tsconfig.json", "{}\n")
+    _write(root / "biome.json", "{}\n")
+    _write(root / ".gitignore", "node_modules/\ndist/\n.turbo/\ncoverage/\n")
+    _write(root / "README.md", "# Monorepo\n" + "Synthetic fixture. " * 20)
+    _write(
+        root / ".github" / "workflows" / "ci.yml",
+        "on: [push, pull_request]\njobs:\n  test:\n    steps:\n      - run: pnpm test\n",
+    )
+    for p in range(packages):
+        pkg = root / "packages" / f"pkg-{p:04d}"
+        _write(pkg / "package.json", f'{{"name": "@mono/pkg-{p:04d}"}}\n')
+        for i in range(20):
+            _write(pkg / "src" / f"module{i}.ts", "export const x = 1;\n" * 40)
+        for i in range(5):
+            _write(pkg / "src" / f"module{i}.test.ts", "test('x', () => {});\n")
+        for i in range(20):
+            _write(pkg / "dist" / f"module{i}.js", "exports.x = 1;\n" * 40)
+    for d in range(deps):
+        dep = root / "node_modules" / f"dep-{d:05d}"
+        _write(dep / "package.json", "{}\n")
+        for i in range(dep_files):
+            _write(dep / "lib" / f"file{i}.js", "module.exports = 1;\n")
+        _write(dep / "test" / "index.test.js", "\n")
+    git = ["git", "-c", "user.name=bench", "-c", "user.email=bench@localhost"]
+    for args in (["init", "-q"], ["add", "-A"], ["commit", "-q", "-m", "fixture"]):
+        subprocess.run([*git, *args], cwd=root, check=True, capture_output=True)
+
+
+def _fixture(workdir: Path, packages: int, deps: int, dep_files: int) -> Path:
+    root = workdir / f"monorepo-{packages}-{deps}-{dep_files}"
+    if (root / ".git").is_dir():
+        return root
+    shutil.rmtree(root, ignore_errors=True)
+    start = time.perf_counter()
+    _make_monorepo(root, packages, deps, dep_files)
+    print(f"generated fixture in {time.perf_counter() - start:.1f}s → {root}")
+    return root
+
+
+def _best(fn: Callable[[], object], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _serial_loc(root: Path) -> int:
+    total = 0
+    for rel in sorted(RepoSnapshot.scan(root).files):
+        if language_of(rel) is None:
+            continue
+        with open(root / rel, encoding="utf-8", errors="replace") as f:
+            total += sum(1 for line in f if line.strip())
+    return total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packages", type=int, default=200)
+    parser.add_argument("--deps", type=int, default=1000)
+    parser.add_argument("--dep-files", type=int, default=30)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "git-repo-agent-bench",
+        help="Where the generated fixture is kept between runs.",
+    )
+    args = parser.parse_args()
+
+    root = _fixture(args.workdir, args.packages, args.deps, args.dep_files)
+    on_disk = sum(1 for p in root.rglob("*") if p.is_file())
+    git_files = len(RepoSnapshot.scan(root).files)
+    walk_files = len(RepoSnapshot.scan(root, use_git=False).files)
+    print(
+        f"{on_disk} files on disk, {walk_files} in the pruned walk, "
+        f"{git_files} in git; best of {args.rounds} rounds"
+    )
+
+    cases: dict[str, Callable[[], object]] = {
+        "rglob x2": lambda: (list(root.rglob("*.py")), list(root.rglob("*test*"))),
+        "walk inventory": lambda: RepoSnapshot.scan(root, use_git=False).files,
+        "git inventory": lambda: RepoSnapshot.scan(root).files,
+        "health (walk)": lambda: compute_health_score(
+            root, snapshot=RepoSnapshot.scan(root, use_git=False)
+        ),
+        "health (git)": lambda: compute_health_score(
+            root, snapshot=RepoSnapshot.scan(root)
+        ),
+        "loc serial": lambda: _serial_loc(root),
+        "loc": lambda: count_loc(RepoSnapshot.scan(root), use_cache=False),
+        "loc (cached)": lambda: count_loc(RepoSnapshot.scan(root)),
+    }
+    for name, fn in cases.items():
+        print(f"  {name:<16} {_best(fn, args.rounds) * 1000:9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark the prompt compiler's section parser on the whole skill corpus.
+
+Times ``prompts.sections.parse_sections`` against the previous per-line
+``re.match`` splitter over every ``*-plugin/skills/*/SKILL.md`` in the
+monorepo, and lists the skills whose sections differ — those are the ones
+with ``#`` lines inside fenced code blocks.
+
+Usage:
+    python scripts/bench_sections.py             # 20 rounds
+    python scripts/bench_sections.py --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Allow running from scripts/ without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from git_repo_agent.prompts.compiler import strip_frontmatter  # noqa: E402
+from git_repo_agent.prompts.sections import parse_sections  # noqa: E402
+
+PLUGINS_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def _legacy_parse_sections(content: str) -> list[tuple[str, str, str]]:
+    """The splitter ``parse_sections`` replaced, kept for comparison."""
+    sections: list[tuple[str, str, str]] = []
+    current_heading = ""
+    current_marker = ""
+    current_lines: list[str] = []
+    for line in content.splitlines(keepends=True):
+        heading_match = re.match(r"^(#{1,3})\s+(.+?)(\s*#*)?\s*$", line)
+        if heading_match:
+            sections.append((current_heading, current_marker, "".join(current_lines)))
+            current_marker = heading_match.group(1)
+            current_heading = heading_match.group(2).strip()
+            current_lines = []
+        else:
+            current_lines.append(line)
+    sections.append((current_heading, current_marker, "".join(current_lines)))
+    return sections
+
+
+def _time(parse, corpus: list[str], rounds: int) -> float:
+    """Best-of-``rounds`` seconds to parse the whole corpus once."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for content in corpus:
+            parse(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    paths = sorted(PLUGINS_ROOT.glob("*-plugin/skills/*/SKILL.md"))
+    if not paths:
+        print(f"No skills found under {PLUGINS_ROOT}", file=sys.stderr)
+        return 1
+    corpus = [strip_frontmatter(p.read_text(encoding="utf-8")) for p in paths]
+    total_lines = sum(c.count("\n") for c in corpus)
+
+    legacy = _time(_legacy_parse_sections, corpus, args.rounds)
+    current = _time(parse_sections, corpus, args.rounds)
+    print(f"{len(paths)} skills, {total_lines} lines, best of {args.rounds} rounds")
+    print(f"  legacy  re.match per line: {legacy * 1000:8.2f} ms")
+    print(f"  sections.parse_sections:   {current * 1000:8.2f} ms")
+    print(f"  speedup: {legacy / current:.2f}x")
+
+    changed = [
+        p.relative_to(PLUGINS_ROOT)
+        for p, content in zip(paths, corpus)
+        if _legacy_parse_sections(content)
+        != [tuple(s) for s in parse_sections(content)]
+    ]
+    print(f"{len(changed)} skills split differently (headings inside fences):")
+    for rel in changed:
+        print(f"  {rel}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
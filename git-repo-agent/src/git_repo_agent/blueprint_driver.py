@@ -27,7 +27,6 @@ Related:
 from __future__ import annotations
 
 import json
-import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -42,6 +41,7 @@ from claude_agent_sdk import (
 from rich.console import Console
 
 from .prompts.compiler import get_compiled_skill
+from .tools.git_metadata import collect_git_metadata
 
 _console = Console()
 
@@ -80,29 +80,6 @@ _SKIP_PHASES_TINY_SINGLE_FEAT: frozenset[str] = frozenset(
 )
 
 
-def _git_commit_count(repo_path: Path, *grep_args: str) -> int | None:
-    """Count git commits matching ``grep_args``. ``None`` on git failure.
-
-    Used to sniff project size without paying the cost of full ``git log``
-    parsing. Returns ``None`` (not 0) on failure so the caller can treat
-    "unknown" as "don't gate" — never silently strip phases because of a
-    broken git invocation.
-    """
-    try:
-        result = subprocess.run(
-            ["git", "log", "--pretty=oneline", *grep_args],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-    except (subprocess.SubprocessError, OSError):
-        return None
-    if result.returncode != 0:
-        return None
-    return sum(1 for line in result.stdout.splitlines() if line.strip())
-
-
 @dataclass(frozen=True)
 class ProjectSize:
     """Result of the project-size sniff.
@@ -149,12 +126,22 @@ def sniff_project_size(repo_path: Path) -> ProjectSize:
 
     Returns a :class:`ProjectSize` with ``None`` fields if git is
     unavailable or the repo has no commits yet — callers should treat
-    unknown as "don't gate" and run every phase.
+    unknown as "don't gate" and run every phase. Never returns ``0``
+    for "unknown": a broken git invocation must not silently strip
+    phases.
+
+    Counts come from :func:`collect_git_metadata`, one ``git log`` pass
+    shared with ``repo_analyze``. ``feat``/``fix`` are conventional-commit
+    types parsed from each subject line.
     """
-    total = _git_commit_count(repo_path)
-    feat = _git_commit_count(repo_path, "--grep=^feat", "-E")
-    fix = _git_commit_count(repo_path, "--grep=^fix", "-E")
-    return ProjectSize(total_commits=total, feat_commits=feat, fix_commits=fix)
+    meta = collect_git_metadata(repo_path)
+    if meta is None or meta.head is None:
+        return ProjectSize(total_commits=None, feat_commits=None, fix_commits=None)
+    return ProjectSize(
+        total_commits=meta.commit_count,
+        feat_commits=meta.type_count("feat"),
+        fix_commits=meta.type_count("fix"),
+    )
 
 
 # --------------------------------------------------------------------------
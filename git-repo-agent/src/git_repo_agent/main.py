@@ -642,6 +642,11 @@ def diagnose(
         "--app",
         help="ArgoCD application name.",
     ),
+    fresh: bool = typer.Option(
+        False,
+        "--fresh",
+        help="Ignore cached diagnostics from recent runs and query every source again.",
+    ),
     non_interactive: bool = typer.Option(
         False,
         "--non-interactive",
@@ -691,6 +696,7 @@ def diagnose(
             namespace=namespace,
             app_name=app_name,
             non_interactive=ni,
+            fresh=fresh,
         )
     )
 
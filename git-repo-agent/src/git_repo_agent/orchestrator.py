@@ -93,11 +93,12 @@ from .agents.docs import definition as docs_definition
 from .agents.quality import definition as quality_definition
 from .agents.security import definition as security_definition
 from .agents.test_runner import definition as test_runner_definition
+from .tools.analysis_context import AnalysisContext
 from .tools.attributes import (
-    collect_attributes,
     format_routing_instructions,
     route_from_attributes,
 )
+from .tools.git_metadata import CONVENTIONAL_SHARE_MIN, collect_git_metadata
 from .tools.health_check import compute_health_score
 from .tools.pipeline_collector import collect_pipeline_diagnostics
 from .tools.repo_analyzer import analyze_repo
@@ -135,11 +136,15 @@ def _pre_compute_context(repo_path: Path) -> str:
     """Pre-compute repository analysis, health score, and structured attributes.
 
     Returns a formatted string to embed in the agent prompt.
-    See ADR-001 for why this replaces SDK MCP servers.
+    See ADR-001 for why this replaces SDK MCP servers. One
+    :class:`AnalysisContext` serves all three results: the tree is walked
+    once, and the attributes reuse the health score instead of computing
+    it again.
     """
-    analysis = analyze_repo(repo_path)
-    health = compute_health_score(repo_path)
-    attr_data = collect_attributes(repo_path)
+    context = AnalysisContext(repo_path)
+    analysis = context.analysis
+    health = context.health
+    attr_data = context.attributes
 
     # Compute routing priorities from attributes
     priorities = route_from_attributes(attr_data["attributes"])
@@ -356,7 +361,7 @@ async def _auto_handle_pr(
         # "append" / "new" both fall through to creating a new PR on the
         # timestamped branch; "append" semantics are left for a future pass.
 
-    pr_title, pr_body = _build_pr_content(workflow, agent_output)
+    pr_title, pr_body = _build_pr_content(workflow, agent_output, repo_path)
     console.print(f"[dim]Pushing {branch} and creating PR...[/dim]")
     pr_url = push_and_create_pr(worktree_path, branch, base_branch, pr_title, pr_body)
     if pr_url:
@@ -879,6 +884,7 @@ async def run_diagnose(
     namespace: str | None = None,
     app_name: str | None = None,
     non_interactive: NonInteractiveConfig | None = None,
+    fresh: bool = False,
 ) -> None:
     """Run the pipeline diagnostics workflow for a repository."""
     console.print(f"[bold]Git Repo Agent[/bold] — Diagnosing [cyan]{repo_path}[/cyan]")
@@ -896,11 +902,12 @@ async def run_diagnose(
 
     console.print("[dim]Collecting pipeline diagnostics...[/dim]")
     source_list = [s.strip() for s in sources.split(",")] if sources else None
-    diagnostics = collect_pipeline_diagnostics(
+    diagnostics = await collect_pipeline_diagnostics(
         repo_path,
         sources=source_list,
         namespace=namespace,
         app_name=app_name,
+        fresh=fresh,
     )
 
     # Report available/unavailable sources
@@ -1540,28 +1547,60 @@ def _normalize_subject(text: str) -> str:
     return subject
 
 
-def _build_pr_title(workflow: str, fixed_items: list[str]) -> str:
-    """Build a conventional-commit PR title from fixed items when available."""
+def _build_pr_title(
+    workflow: str, fixed_items: list[str], *, conventional: bool = True
+) -> str:
+    """Build a PR title from fixed items when available.
+
+    Titles use the ``chore:`` conventional-commit prefix unless
+    ``conventional`` is False, for repositories whose history doesn't
+    follow the convention.
+    """
     if len(fixed_items) == 1:
-        return f"chore: {_normalize_subject(fixed_items[0])}"
-    if fixed_items:
-        return f"chore: apply {len(fixed_items)} automated {workflow} fixes"
-    return f"chore: automated {workflow} run"
+        subject = _normalize_subject(fixed_items[0])
+    elif fixed_items:
+        subject = f"apply {len(fixed_items)} automated {workflow} fixes"
+    else:
+        subject = f"automated {workflow} run"
+    if conventional:
+        return f"chore: {subject}"
+    return subject[:1].upper() + subject[1:]
+
 
+def _repo_uses_conventional_commits(repo_path: Path | None) -> bool:
+    """Whether recent history is mostly conventional commits.
 
-def _build_pr_content(workflow: str, agent_output: str) -> tuple[str, str]:
+    Read from the persistent commit-type index. Defaults to True when
+    the history is unknown or empty.
+    """
+    if repo_path is None:
+        return True
+    meta = collect_git_metadata(repo_path)
+    share = meta.history.typed_share() if meta is not None else None
+    return share is None or share >= CONVENTIONAL_SHARE_MIN
+
+
+def _build_pr_content(
+    workflow: str, agent_output: str, repo_path: Path | None = None
+) -> tuple[str, str]:
     """Build PR title and body from workflow type and agent output.
 
     The title summarises the actual changes when the agent's report lists
-    fixed items; otherwise it falls back to a generic scoped title. The
-    body heading is chosen per workflow so non-maintenance runs aren't
-    mislabelled as "Maintenance Report".
+    fixed items; otherwise it falls back to a generic scoped title. When
+    ``repo_path`` is given, the title follows the repository's commit
+    style (see :func:`_repo_uses_conventional_commits`). The body heading
+    is chosen per workflow so non-maintenance runs aren't mislabelled as
+    "Maintenance Report".
 
     Returns (title, body) tuple.
     """
     report = _extract_report_section(agent_output)
     fixed_items = _extract_fixed_items(report)
-    pr_title = _build_pr_title(workflow, fixed_items)
+    pr_title = _build_pr_title(
+        workflow,
+        fixed_items,
+        conventional=_repo_uses_conventional_commits(repo_path),
+    )
     heading = _WORKFLOW_REPORT_HEADINGS.get(workflow, f"{workflow.capitalize()} Report")
 
     if report:
@@ -1625,7 +1664,7 @@ async def _prompt_pr_creation(
     )
 
     if create_pr in ("yes", "y"):
-        pr_title, pr_body = _build_pr_content(workflow, agent_output)
+        pr_title, pr_body = _build_pr_content(workflow, agent_output, repo_path)
         console.print("[dim]Pushing branch and creating PR...[/dim]")
         pr_url = push_and_create_pr(
             worktree_path,
@@ -0,0 +1,78 @@
+"""On-disk cache for compiled skill prompts, shared across runs and agents.
+
+``compiler.get_compiled_prompt`` is ``lru_cache``-d, which only helps
+within one process: every CLI invocation that opens an SDK session used to
+re-parse every SKILL.md it needs. This module persists compiled fragments
+under a content-addressed key so later runs read them back instead.
+
+The key is a hash of the compiler's own source plus the bytes of every
+input file, so an edited SKILL.md or an edited compiler simply misses and
+recompiles — there is no invalidation step. Because keys are content
+hashes, git-repo-agent and vault-agent share one directory without
+clashing (their compilers hash differently):
+
+    $CLAUDE_PLUGINS_PROMPT_CACHE            (explicit; "off" disables)
+    $XDG_CACHE_HOME/claude-plugins/compiled-prompts
+    ~/.cache/claude-plugins/compiled-prompts
+
+Same module as vault-agent's ``prompts/cache.py``. Cache I/O failures
+are never fatal: a read-only or missing cache just means compiling live.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV_VAR = "CLAUDE_PLUGINS_PROMPT_CACHE"
+_DISABLED_VALUES = frozenset({"", "0", "off", "false", "no"})
+
+
+def cache_dir() -> Path | None:
+    """Directory holding cached prompts, or None when caching is disabled."""
+    explicit = os.environ.get(CACHE_ENV_VAR)
+    if explicit is not None:
+        if explicit.strip().lower() in _DISABLED_VALUES:
+            return None
+        return Path(explicit).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base).expanduser() if base else Path.home() / ".cache"
+    return root / "claude-plugins" / "compiled-prompts"
+
+
+def make_key(*parts: bytes) -> str:
+    """Hash ``parts`` into a cache key. Length-prefixed so parts can't run together."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def load(key: str) -> str | None:
+    """Return the cached prompt for ``key``, or None on a miss."""
+    directory = cache_dir()
+    if directory is None:
+        return None
+    try:
+        return (directory / f"{key}.md").read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def store(key: str, text: str) -> None:
+    """Persist ``text`` under ``key`` (write + rename, so readers never see a partial file)."""
+    directory = cache_dir()
+    if directory is None:
+        return
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = directory / f"{key}.{os.getpid()}.tmp"
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(directory / f"{key}.md")
+    except OSError as exc:
+        logger.debug("Prompt cache write to %s failed: %s", directory, exc)
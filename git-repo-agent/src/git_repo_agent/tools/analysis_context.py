@@ -0,0 +1,53 @@
+"""AnalysisContext — the static analysis of one repository, computed once per run.
+
+``_pre_compute_context`` needs three views of the repository: the
+``repo_analyze`` metadata, the health score and the structured
+attributes. The attributes are derived from the health score, so
+computing them independently ran ``compute_health_score`` (including
+``profile_stack`` and the Python LOC count) twice on every ``onboard``
+and ``maintain`` startup.
+
+An :class:`AnalysisContext` computes each view lazily, on first access,
+and keeps it for the rest of the run. Every view reads from the same
+:class:`RepoSnapshot`. Pass the context (or just its ``health``) to
+:func:`collect_attributes` to reuse work that has already been done.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from .attributes import collect_attributes
+from .health_check import compute_health_score
+from .repo_analyzer import analyze_repo
+from .repo_snapshot import RepoSnapshot
+
+
+class AnalysisContext:
+    """Memoized per-run analysis of ``repo_path``."""
+
+    def __init__(self, repo_path: Path, snapshot: RepoSnapshot | None = None) -> None:
+        self.repo_path = repo_path
+        if snapshot is not None:
+            self.snapshot = snapshot
+
+    @cached_property
+    def snapshot(self) -> RepoSnapshot:
+        return RepoSnapshot.scan(self.repo_path)
+
+    @cached_property
+    def analysis(self) -> dict[str, Any]:
+        """``analyze_repo`` result."""
+        return analyze_repo(self.repo_path, snapshot=self.snapshot)
+
+    @cached_property
+    def health(self) -> dict[str, Any]:
+        """``compute_health_score`` result."""
+        return compute_health_score(self.repo_path, snapshot=self.snapshot)
+
+    @cached_property
+    def attributes(self) -> dict[str, Any]:
+        """``collect_attributes`` result, derived from :attr:`health`."""
+        return collect_attributes(self.repo_path, health=self.health)
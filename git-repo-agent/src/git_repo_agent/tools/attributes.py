@@ -11,11 +11,15 @@ import json
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from claude_agent_sdk import tool
 
 from .health_check import compute_health_score
+from .repo_snapshot import RepoSnapshot
+
+if TYPE_CHECKING:
+    from .analysis_context import AnalysisContext
 
 
 @dataclass
@@ -259,11 +263,20 @@ _SEVERITY_WEIGHTS = {
 }
 
 
-def collect_attributes(repo_path: Path) -> dict[str, Any]:
+def collect_attributes(
+    repo_path: Path,
+    snapshot: RepoSnapshot | None = None,
+    *,
+    health: dict[str, Any] | None = None,
+    context: AnalysisContext | None = None,
+) -> dict[str, Any]:
     """Collect structured codebase attributes from health score findings.
 
-    Calls compute_health_score() and converts each finding string into a
-    structured Attribute with severity and remediation actions.
+    Converts each compute_health_score() finding string into a
+    structured Attribute with severity and remediation actions. The
+    health result is taken from ``health`` when given, else from
+    ``context`` (an AnalysisContext computes it at most once per run),
+    else computed here, reading from ``snapshot`` if given.
 
     Returns a dict matching the attribute schema:
     {
@@ -274,7 +287,11 @@ def collect_attributes(repo_path: Path) -> dict[str, Any]:
         "scores": { backward-compatible health score data }
     }
     """
-    health = compute_health_score(repo_path)
+    if health is None:
+        if context is not None:
+            health = context.health
+        else:
+            health = compute_health_score(repo_path, snapshot=snapshot)
 
     attributes: list[dict[str, Any]] = []
     for _category, findings in health.get("findings", {}).items():
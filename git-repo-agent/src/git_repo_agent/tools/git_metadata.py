@@ -0,0 +1,302 @@
+"""Git metadata — branch, remotes and commit history counts, collected once.
+
+``repo_analyzer._get_git_info`` spawned three git processes (current
+branch, ``origin`` URL, ``rev-list --count``) and
+``blueprint_driver.sniff_project_size`` walked the full history three
+more times with ``git log --grep`` to count all, ``feat`` and ``fix``
+commits. :func:`collect_git_metadata` answers all of that from:
+
+* one ``git rev-parse`` for the common git dir, ``HEAD`` sha and branch;
+* the commit-type index (below) for the commit count and the
+  conventional-commit type counts;
+* one ``git config --get-regexp`` for every remote URL.
+
+Results are cached in-process per ``(git dir, HEAD sha, branch)``, so
+every later call for the same checkout costs only the ``rev-parse``.
+
+The commit-type index persists across runs in
+``.git/git-repo-agent/commit-types.json`` of the main repository (the
+common dir, so a linked worktree shares it and removing the worktree
+does not drop it): commit counts per month and
+per conventional type, plus the last indexed sha. Merge commits
+("Merge pull request #…") count towards the commit count but carry no
+type, and are left out of the typed share. When ``HEAD`` moves
+forward only ``<last sha>..HEAD`` is read, so a 100k-commit history is
+walked once, not on every driver run. A rewritten history (the indexed
+sha is no longer an ancestor of ``HEAD``) is re-indexed from scratch.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+# ``type(scope)!: subject`` — the type is lower-cased before counting.
+_CONVENTIONAL_RE = re.compile(r"^([A-Za-z]+)(?:\([^)]*\))?!?:")
+
+_INDEX_DIR = "git-repo-agent"
+_INDEX_FILE = "commit-types.json"
+_INDEX_VERSION = 2
+# Per-month keys for all commits (typed or not) and for merge commits.
+# Neither is ever a commit type.
+_ALL = "*"
+_MERGES = "^"
+# Months of history that count as "recent" for type shares.
+RECENT_MONTHS = 12
+# A history is "conventional" when at least this share of recent commits
+# carries a type. Health scoring and PR titles use the same cut-off.
+CONVENTIONAL_SHARE_MIN = 0.5
+
+
+@dataclass
+class CommitTypeIndex:
+    """Commit counts per ``YYYY-MM`` month, for history up to ``head``.
+
+    ``months[month]`` maps each conventional type seen that month to its
+    commit count, plus ``"*"`` to the number of all commits that month
+    and ``"^"`` to the merges among them (when there are any).
+    """
+
+    head: str | None = None
+    months: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def add(self, month: str, subject: str, *, merge: bool = False) -> None:
+        counts = self.months.setdefault(month, {})
+        counts[_ALL] = counts.get(_ALL, 0) + 1
+        if merge:
+            # Merges repeat the work they bring in; they have no type.
+            counts[_MERGES] = counts.get(_MERGES, 0) + 1
+            return
+        kind = commit_type(subject)
+        if kind is not None:
+            counts[kind] = counts.get(kind, 0) + 1
+
+    def _window(self, months: int | None) -> list[dict[str, int]]:
+        keys = sorted(self.months, reverse=True)
+        if months is not None:
+            keys = keys[:months]
+        return [self.months[k] for k in keys]
+
+    @property
+    def commit_count(self) -> int:
+        return sum(counts.get(_ALL, 0) for counts in self.months.values())
+
+    def type_counts(self, months: int | None = None) -> dict[str, int]:
+        """Commits per conventional type, over the ``months`` newest months.
+
+        ``None`` covers the whole history. Only months with commits count
+        towards the window, so a dormant repository is judged by its last
+        active year rather than by an empty one.
+        """
+        totals: Counter[str] = Counter()
+        for counts in self._window(months):
+            totals.update(counts)
+        del totals[_ALL], totals[_MERGES]
+        return dict(totals)
+
+    def typed_share(self, months: int = RECENT_MONTHS) -> float | None:
+        """Fraction of recent non-merge commits with a conventional type, or None."""
+        window = self._window(months)
+        total = sum(counts.get(_ALL, 0) - counts.get(_MERGES, 0) for counts in window)
+        if not total:
+            return None
+        typed = sum(
+            n
+            for counts in window
+            for k, n in counts.items()
+            if k not in (_ALL, _MERGES)
+        )
+        return typed / total
+
+
+@dataclass(frozen=True)
+class GitMetadata:
+    """What the analysis needs to know about a repository's git state."""
+
+    git_dir: Path  # common dir: shared by all worktrees of the repository
+    head: str | None  # None on an unborn branch
+    branch: str  # "HEAD" when detached
+    remotes: dict[str, str] = field(default_factory=dict)
+    history: CommitTypeIndex = field(default_factory=CommitTypeIndex)
+
+    @property
+    def remote(self) -> str:
+        """URL of ``origin``, or ``"none"``."""
+        return self.remotes.get("origin", "none")
+
+    @property
+    def commit_count(self) -> int:
+        return self.history.commit_count
+
+    @property
+    def commit_types(self) -> dict[str, int]:
+        """Commits per conventional type over the whole history."""
+        return self.history.type_counts()
+
+    def type_count(self, commit_type: str) -> int:
+        """Number of commits whose subject has conventional type ``commit_type``."""
+        return self.commit_types.get(commit_type, 0)
+
+
+def commit_type(subject: str) -> str | None:
+    """Conventional-commit type of ``subject`` (``feat``, ``fix``, ...) or None."""
+    match = _CONVENTIONAL_RE.match(subject)
+    return match.group(1).lower() if match else None
+
+
+def _git(
+    cwd: Path, *args: str, timeout: float = 5
+) -> subprocess.CompletedProcess | None:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=timeout,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+
+
+def _remotes(git_dir: Path) -> dict[str, str]:
+    result = _git(git_dir, "config", "-z", "--get-regexp", r"^remote\..*\.url$")
+    if result is None or result.returncode != 0:
+        return {}
+    remotes: dict[str, str] = {}
+    for entry in result.stdout.split("\0"):
+        key, _, url = entry.partition("\n")
+        if key:
+            remotes[key.removeprefix("remote.").removesuffix(".url")] = url
+    return remotes
+
+
+def _index_path(git_dir: Path) -> Path:
+    return git_dir / _INDEX_DIR / _INDEX_FILE
+
+
+def load_commit_index(git_dir: Path) -> CommitTypeIndex | None:
+    """The persisted commit-type index of ``git_dir``, or None."""
+    try:
+        data = json.loads(_index_path(git_dir).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+        return None
+    months = data.get("months")
+    if not isinstance(months, dict):
+        return None
+    return CommitTypeIndex(head=data.get("head"), months=months)
+
+
+def _store_commit_index(git_dir: Path, index: CommitTypeIndex) -> None:
+    path = _index_path(git_dir)
+    payload = {"version": _INDEX_VERSION, "head": index.head, "months": index.months}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def _read_log(git_dir: Path, revs: str) -> list[tuple[str, str, bool]] | None:
+    """``(YYYY-MM, subject, is merge)`` per commit in ``revs``; None on failure."""
+    result = _git(
+        git_dir,
+        "log",
+        "--format=%ad%x1f%P%x1f%s",
+        "--date=format:%Y-%m",
+        revs,
+        timeout=120,
+    )
+    if result is None or result.returncode != 0:
+        return None
+    entries: list[tuple[str, str, bool]] = []
+    for line in result.stdout.split("\n"):
+        fields = line.split("\x1f", 2)
+        if len(fields) == 3:
+            month, parents, subject = fields
+            entries.append((month, subject, len(parents.split()) > 1))
+    return entries
+
+
+def _is_ancestor(git_dir: Path, old: str, new: str) -> bool:
+    result = _git(git_dir, "merge-base", "--is-ancestor", old, new)
+    return result is not None and result.returncode == 0
+
+
+def update_commit_index(git_dir: Path, head: str) -> CommitTypeIndex | None:
+    """Bring the persisted index up to ``head`` and return it.
+
+    Reads only ``<indexed sha>..head`` when the indexed sha is an
+    ancestor of ``head``; otherwise re-indexes the whole history. Returns
+    None when ``git log`` fails. A failed write leaves a valid index in
+    memory, it is just recomputed next time.
+    """
+    index = load_commit_index(git_dir)
+    if index is not None and index.head == head:
+        return index
+    if index is not None and index.head and _is_ancestor(git_dir, index.head, head):
+        revs = f"{index.head}..{head}"
+    else:
+        index, revs = CommitTypeIndex(), head
+    entries = _read_log(git_dir, revs)
+    if entries is None:
+        return None
+    for month, subject, merge in entries:
+        index.add(month, subject, merge=merge)
+    index.head = head
+    _store_commit_index(git_dir, index)
+    return index
+
+
+@lru_cache(maxsize=32)
+def _collect(git_dir: Path, head: str | None, branch: str) -> GitMetadata | None:
+    history = CommitTypeIndex()
+    if head is not None:
+        indexed = update_commit_index(git_dir, head)
+        if indexed is None:
+            return None
+        history = indexed
+    return GitMetadata(
+        git_dir=git_dir,
+        head=head,
+        branch=branch,
+        remotes=_remotes(git_dir),
+        history=history,
+    )
+
+
+def collect_git_metadata(repo_path: Path) -> GitMetadata | None:
+    """Git metadata for ``repo_path``, or None when git is unavailable.
+
+    An unborn branch (no commits yet) yields ``head=None`` and zero
+    counts. Repeated calls on the same checkout are served from cache.
+    """
+    result = _git(
+        repo_path, "rev-parse", "--git-common-dir", "HEAD", "--abbrev-ref", "HEAD"
+    )
+    if result is None:
+        return None
+    lines = result.stdout.splitlines()
+    if result.returncode == 0 and len(lines) == 3:
+        git_dir, head, branch = lines
+    elif lines:
+        # rev-parse prints the git dir before failing on an unborn HEAD.
+        git_dir, head = lines[0], None
+        symbolic = _git(repo_path, "symbolic-ref", "--short", "-q", "HEAD")
+        branch = symbolic.stdout.strip() if symbolic is not None else ""
+        branch = branch or "HEAD"
+    else:
+        return None
+    # Relative (e.g. ".git") when run from the main work tree's root.
+    return _collect((repo_path / git_dir).resolve(), head, branch)
@@ -8,16 +8,22 @@ from typing import Any
 
 from claude_agent_sdk import tool
 
+from .git_metadata import CONVENTIONAL_SHARE_MIN, GitMetadata, collect_git_metadata
+from .repo_snapshot import RepoSnapshot, snapshot_for
 from .stack_profile import StackProfile, profile_stack
 
 
-def _score_docs(repo: Path) -> tuple[int, list[str]]:
+def _score_docs(
+    repo: Path,
+    snapshot: RepoSnapshot | None = None,
+) -> tuple[int, list[str]]:
     """Score documentation health (0-20)."""
+    snap = snapshot_for(repo, snapshot)
     score = 0
     findings: list[str] = []
 
-    if (repo / "README.md").exists():
-        readme = (repo / "README.md").read_text(encoding="utf-8", errors="replace")
+    if snap.exists("README.md"):
+        readme = snap.text("README.md")
         score += 5
         if len(readme) > 200:
             score += 3
@@ -26,20 +32,20 @@ def _score_docs(repo: Path) -> tuple[int, list[str]]:
     else:
         findings.append("Missing README.md")
 
-    if (repo / "CLAUDE.md").exists():
+    if snap.exists("CLAUDE.md"):
         score += 4
     else:
         findings.append("Missing CLAUDE.md")
 
-    if (repo / "docs").is_dir():
+    if snap.is_dir("docs"):
         score += 3
     else:
         findings.append("No docs/ directory")
 
-    if (repo / "docs" / "blueprint").is_dir():
+    if snap.is_dir("docs/blueprint"):
         score += 3
 
-    if (repo / "LICENSE").exists() or (repo / "LICENSE.md").exists():
+    if snap.exists("LICENSE") or snap.exists("LICENSE.md"):
         score += 2
     else:
         findings.append("Missing LICENSE file")
@@ -47,21 +53,22 @@ def _score_docs(repo: Path) -> tuple[int, list[str]]:
     return min(score, 20), findings
 
 
-def _score_tests(repo: Path) -> tuple[int, list[str]]:
+def _score_tests(
+    repo: Path,
+    snapshot: RepoSnapshot | None = None,
+) -> tuple[int, list[str]]:
     """Score testing health (0-20)."""
+    snap = snapshot_for(repo, snapshot)
     score = 0
     findings: list[str] = []
 
-    test_dirs = [repo / "tests", repo / "test", repo / "src" / "tests"]
-    has_tests = any(d.is_dir() for d in test_dirs)
+    has_tests = any(snap.is_dir(d) for d in ("tests", "test", "src/tests"))
 
     if has_tests:
         score += 8
     else:
-        # Check for inline test files
-        test_files = list(repo.rglob("*test*"))
-        test_files = [f for f in test_files if f.is_file() and ".venv" not in str(f)]
-        if test_files:
+        # Check for inline test files; the walk stops at the first one.
+        if snap.find_file(lambda rel: "test" in rel.rsplit("/", 1)[-1]):
             score += 5
         else:
             findings.append("No test directory or test files found")
@@ -76,22 +83,17 @@ def _score_tests(repo: Path) -> tuple[int, list[str]]:
         "conftest.py",
         "playwright.config.ts",
     ]
-    if any((repo / cfg).exists() for cfg in test_configs):
+    if any(snap.exists(cfg) for cfg in test_configs):
         score += 4
     elif has_tests:
         findings.append("Tests exist but no test configuration file found")
 
     # Check for CI test step (look in workflows)
-    workflows_dir = repo / ".github" / "workflows"
-    if workflows_dir.is_dir():
-        for wf in workflows_dir.glob("*.yml"):
-            try:
-                content = wf.read_text(encoding="utf-8", errors="replace")
-                if "test" in content.lower():
-                    score += 5
-                    break
-            except OSError:
-                pass
+    if snap.is_dir(".github/workflows"):
+        for wf in snap.children(".github/workflows", ".yml"):
+            if "test" in snap.text(wf).lower():
+                score += 5
+                break
         else:
             findings.append("No CI workflow runs tests")
 
@@ -102,7 +104,7 @@ def _score_tests(repo: Path) -> tuple[int, list[str]]:
         "codecov.yml",
         ".codecov.yml",
     ]
-    if any((repo / f).exists() for f in coverage_indicators):
+    if any(snap.exists(f) for f in coverage_indicators):
         score += 3
 
     return min(score, 20), findings
@@ -111,6 +113,7 @@ def _score_tests(repo: Path) -> tuple[int, list[str]]:
 def _score_security(
     repo: Path,
     profile: StackProfile | None = None,
+    snapshot: RepoSnapshot | None = None,
 ) -> tuple[int, list[str]]:
     """Score security health (0-20).
 
@@ -119,12 +122,13 @@ def _score_security(
     omit the "no security scanning" finding even if the substring
     heuristic below would have missed it.
     """
+    snap = snapshot_for(repo, snapshot)
     score = 0
     findings: list[str] = []
 
     # .gitignore
-    if (repo / ".gitignore").exists():
-        gitignore = (repo / ".gitignore").read_text(encoding="utf-8", errors="replace")
+    if snap.exists(".gitignore"):
+        gitignore = snap.text(".gitignore")
         score += 4
         # Check for common sensitive patterns
         sensitive_patterns = [".env", "*.pem", "*.key", "credentials"]
@@ -136,41 +140,38 @@ def _score_security(
         findings.append("Missing .gitignore")
 
     # No .env committed
-    if (repo / ".env").exists():
+    if snap.exists(".env"):
         findings.append(".env file exists in repository (should be gitignored)")
     else:
         score += 4
 
     # Pre-commit hooks
-    if (repo / ".pre-commit-config.yaml").exists():
+    if snap.exists(".pre-commit-config.yaml"):
         score += 4
     else:
         findings.append("No pre-commit hooks configured")
 
     # Security-related CI checks
-    workflows_dir = repo / ".github" / "workflows"
+    has_workflows = snap.is_dir(".github/workflows")
     security_found = False
     if profile is not None and profile.ci_has_security_scanning:
         security_found = True
         score += 4
-    elif workflows_dir.is_dir():
-        for wf in workflows_dir.glob("*.yml"):
-            try:
-                content = wf.read_text(encoding="utf-8", errors="replace").lower()
-                if any(
-                    kw in content
-                    for kw in ["security", "audit", "dependabot", "codeql", "snyk"]
-                ):
-                    score += 4
-                    security_found = True
-                    break
-            except OSError:
-                pass
-    if not security_found and workflows_dir.is_dir():
+    elif has_workflows:
+        for wf in snap.children(".github/workflows", ".yml"):
+            content = snap.text(wf).lower()
+            if any(
+                kw in content
+                for kw in ["security", "audit", "dependabot", "codeql", "snyk"]
+            ):
+                score += 4
+                security_found = True
+                break
+    if not security_found and has_workflows:
         findings.append("No security scanning in CI")
 
     # Dependabot
-    if (repo / ".github" / "dependabot.yml").exists():
+    if snap.exists(".github/dependabot.yml"):
         score += 3
     else:
         findings.append("No Dependabot configuration")
@@ -181,6 +182,7 @@ def _score_security(
 def _score_quality(
     repo: Path,
     profile: StackProfile | None = None,
+    snapshot: RepoSnapshot | None = None,
 ) -> tuple[int, list[str]]:
     """Score code quality health (0-20).
 
@@ -199,6 +201,7 @@ def _score_quality(
         checker, the finding wording prefers Astral's ``ty`` over
         mypy/pyright to match the project's tool family.
     """
+    snap = snapshot_for(repo, snapshot)
     score = 0
     findings: list[str] = []
 
@@ -213,18 +216,13 @@ def _score_quality(
         ".ruff.toml",
         "ruff.toml",
     ]
-    if any((repo / f).exists() for f in linter_configs):
+    if any(snap.exists(f) for f in linter_configs):
         score += 6
     else:
         # Check pyproject.toml for ruff config
-        pyproject = repo / "pyproject.toml"
-        if pyproject.exists():
-            try:
-                content = pyproject.read_text(encoding="utf-8")
-                if "tool.ruff" in content or "tool.pylint" in content:
-                    score += 6
-            except OSError:
-                pass
+        content = snap.text("pyproject.toml")
+        if "tool.ruff" in content or "tool.pylint" in content:
+            score += 6
         if score == 0:
             findings.append("No linter configured")
 
@@ -246,21 +244,18 @@ def _score_quality(
         "rustfmt.toml",
         ".scalafmt.conf",
     ]
-    if any((repo / f).exists() for f in formatter_configs):
+    if any(snap.exists(f) for f in formatter_configs):
         score += 5
     else:
         formatter_found = False
         if profile is not None and profile.has_ruff_format:
             score += 5
             formatter_found = True
-        elif (repo / "pyproject.toml").exists():
-            try:
-                content = (repo / "pyproject.toml").read_text(encoding="utf-8")
-                if "tool.ruff" in content or "tool.black" in content:
-                    score += 5
-                    formatter_found = True
-            except OSError:
-                pass
+        else:
+            content = snap.text("pyproject.toml")
+            if "tool.ruff" in content or "tool.black" in content:
+                score += 5
+                formatter_found = True
         if not formatter_found:
             findings.append("No formatter configured")
 
@@ -272,7 +267,7 @@ def _score_quality(
         "mypy.ini",
         ".mypy.ini",
     ]
-    if any((repo / f).exists() for f in type_configs):
+    if any(snap.exists(f) for f in type_configs):
         score += 5
     else:
         typechecker_found = False
@@ -280,42 +275,29 @@ def _score_quality(
             score += 5
             typechecker_found = True
         # Check pyproject.toml
-        if not typechecker_found and (repo / "pyproject.toml").exists():
-            try:
-                content = (repo / "pyproject.toml").read_text(encoding="utf-8")
-                if any(
-                    t in content
-                    for t in [
-                        "tool.pyright",
-                        "tool.basedpyright",
-                        "tool.mypy",
-                        "tool.ty",
-                    ]
-                ):
-                    score += 5
-                    typechecker_found = True
-            except OSError:
-                pass
+        if not typechecker_found:
+            content = snap.text("pyproject.toml")
+            if any(
+                t in content
+                for t in [
+                    "tool.pyright",
+                    "tool.basedpyright",
+                    "tool.mypy",
+                    "tool.ty",
+                ]
+            ):
+                score += 5
+                typechecker_found = True
         # Check setup.cfg for [mypy]
-        if not typechecker_found and (repo / "setup.cfg").exists():
-            try:
-                content = (repo / "setup.cfg").read_text(encoding="utf-8")
-                if "[mypy" in content:
-                    score += 5
-                    typechecker_found = True
-            except OSError:
-                pass
+        if not typechecker_found and "[mypy" in snap.text("setup.cfg"):
+            score += 5
+            typechecker_found = True
         # Check pre-commit for type checker hooks
         if not typechecker_found:
-            pre_commit = repo / ".pre-commit-config.yaml"
-            if pre_commit.exists():
-                try:
-                    content = pre_commit.read_text(encoding="utf-8")
-                    if "mypy" in content or "pyright" in content:
-                        score += 5
-                        typechecker_found = True
-                except OSError:
-                    pass
+            content = snap.text(".pre-commit-config.yaml")
+            if "mypy" in content or "pyright" in content:
+                score += 5
+                typechecker_found = True
         if not typechecker_found:
             # Stack-aware suppression: don't recommend type checking for
             # projects that have essentially no Python to check.
@@ -338,34 +320,64 @@ def _score_quality(
                     findings.append("No type checking configured")
 
     # Editor config
-    if (repo / ".editorconfig").exists():
+    if snap.exists(".editorconfig"):
         score += 2
 
     # Justfile or Makefile for task running
-    if (repo / "justfile").exists() or (repo / "Makefile").exists():
+    if snap.exists("justfile") or snap.exists("Makefile"):
         score += 2
 
     return min(score, 20), findings
 
 
-def _score_ci(repo: Path) -> tuple[int, list[str]]:
+def _git_metadata(snap: RepoSnapshot) -> GitMetadata | None:
+    """Git metadata for the snapshot's root, when it is a repository root."""
+    if not snap.exists(".git"):
+        return None
+    return collect_git_metadata(snap.root)
+
+
+def _recent_conventional_share(snap: RepoSnapshot) -> float | None:
+    meta = _git_metadata(snap)
+    return meta.history.typed_share() if meta is not None else None
+
+
+def _commit_history(snap: RepoSnapshot) -> dict[str, Any] | None:
+    """Commit-type summary from the persistent index, or None outside git."""
+    meta = _git_metadata(snap)
+    if meta is None or meta.head is None:
+        return None
+    share = meta.history.typed_share()
+    return {
+        "commits": meta.commit_count,
+        "types": meta.commit_types,
+        "recent_conventional_share": None if share is None else round(share, 2),
+        "last_active_month": max(meta.history.months, default=None),
+    }
+
+
+def _score_ci(
+    repo: Path,
+    snapshot: RepoSnapshot | None = None,
+) -> tuple[int, list[str]]:
     """Score CI/CD health (0-20)."""
+    snap = snapshot_for(repo, snapshot)
     score = 0
     findings: list[str] = []
 
-    workflows_dir = repo / ".github" / "workflows"
-    if not workflows_dir.is_dir():
+    has_workflows = snap.is_dir(".github/workflows")
+    if not has_workflows:
         # Check for other CI systems
-        if (repo / ".gitlab-ci.yml").exists():
+        if snap.exists(".gitlab-ci.yml"):
             score += 10
-        elif (repo / "Jenkinsfile").exists():
+        elif snap.exists("Jenkinsfile"):
             score += 8
         else:
             findings.append("No CI/CD configuration found")
             return 0, findings
 
-    if workflows_dir.is_dir():
-        workflow_files = list(workflows_dir.glob("*.yml"))
+    if has_workflows:
+        workflow_files = snap.children(".github/workflows", ".yml")
         if workflow_files:
             score += 8
 
@@ -374,29 +386,35 @@ def _score_ci(repo: Path) -> tuple[int, list[str]]:
             found_push = False
             found_release = False
             found_cache = False
+            uses_release_please = False
 
             for wf in workflow_files:
-                try:
-                    content = wf.read_text(encoding="utf-8", errors="replace").lower()
-
-                    if not found_pr and "pull_request" in content:
-                        found_pr = True
-                    if (
-                        not found_push
-                        and "push" in content
-                        and ("main" in content or "master" in content)
-                    ):
-                        found_push = True
-                    if not found_release and "release" in content:
-                        found_release = True
-                    if not found_cache and "cache" in content:
-                        found_cache = True
-
-                    # Early exit if all features found
-                    if found_pr and found_push and found_release and found_cache:
-                        break
-                except OSError:
-                    pass
+                content = snap.text(wf).lower()
+
+                if not found_pr and "pull_request" in content:
+                    found_pr = True
+                if (
+                    not found_push
+                    and "push" in content
+                    and ("main" in content or "master" in content)
+                ):
+                    found_push = True
+                if not found_release and "release" in content:
+                    found_release = True
+                if not uses_release_please and "release-please" in content:
+                    uses_release_please = True
+                if not found_cache and "cache" in content:
+                    found_cache = True
+
+                # Early exit if all features found
+                if (
+                    found_pr
+                    and found_push
+                    and found_release
+                    and found_cache
+                    and uses_release_please
+                ):
+                    break
 
             if found_pr:
                 score += 3
@@ -406,6 +424,16 @@ def _score_ci(repo: Path) -> tuple[int, list[str]]:
                 score += 3
             if found_cache:
                 score += 3
+            if uses_release_please:
+                # release-please derives versions and changelogs from
+                # conventional commit types; untyped commits are dropped.
+                share = _recent_conventional_share(snap)
+                if share is not None and share < CONVENTIONAL_SHARE_MIN:
+                    findings.append(
+                        "release-please is configured but only "
+                        f"{share:.0%} of recent commits use conventional "
+                        "commit types"
+                    )
         else:
             findings.append(".github/workflows/ exists but has no workflow files")
 
@@ -425,7 +453,9 @@ def _grade(overall_score: int) -> str:
     return "F"
 
 
-def compute_health_score(repo_path: Path) -> dict[str, Any]:
+def compute_health_score(
+    repo_path: Path, snapshot: RepoSnapshot | None = None
+) -> dict[str, Any]:
     """Compute repository health score with category breakdown.
 
     Computes a :class:`StackProfile` once and passes it to scorers that
@@ -433,8 +463,12 @@ def compute_health_score(repo_path: Path) -> dict[str, Any]:
     stack (issue #1359). The profile is also surfaced under the
     ``stack_profile`` key in the result so downstream consumers (and
     the agent prompt) can see what was detected.
+
+    The profile and every scorer read from one :class:`RepoSnapshot`
+    (``snapshot``, or one built here), so each file is read at most once.
     """
-    profile = profile_stack(repo_path)
+    snap = snapshot_for(repo_path, snapshot)
+    profile = profile_stack(repo_path, snapshot=snap)
 
     # The profile-aware scorers accept an optional second argument; the
     # plain ones ignore it. Pass the profile uniformly so future scorers
@@ -456,9 +490,9 @@ def compute_health_score(repo_path: Path) -> dict[str, Any]:
         # scorer here is called with profile as keyword arg when its
         # signature supports it.
         try:
-            cat_score, cat_findings = scorer(repo_path, profile=profile)  # type: ignore[call-arg]
+            cat_score, cat_findings = scorer(repo_path, profile=profile, snapshot=snap)  # type: ignore[call-arg]
         except TypeError:
-            cat_score, cat_findings = scorer(repo_path)
+            cat_score, cat_findings = scorer(repo_path, snapshot=snap)
         category_scores[cat_name] = cat_score
         if cat_findings:
             all_findings[cat_name] = cat_findings
@@ -486,7 +520,9 @@ def compute_health_score(repo_path: Path) -> dict[str, Any]:
             "is_comfyui_pack": profile.is_comfyui_pack,
             "is_python_incidental": profile.is_python_incidental,
             "python_loc_outside_tests": profile.python_loc_outside_tests,
+            "loc_by_language": dict(profile.loc_by_language),
         },
+        "commit_history": _commit_history(snap),
     }
 
 
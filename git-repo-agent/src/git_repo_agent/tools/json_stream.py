@@ -0,0 +1,162 @@
+"""Incremental JSON reader that hands selected values to callbacks.
+
+``kubectl get pods -o json`` for a large namespace is tens of MB. Loading
+it with ``json.loads`` keeps the whole document in memory when the
+diagnostics only need a handful of fields per pod. :class:`JsonStream`
+is fed the output chunk by chunk. It walks only the containers on the
+way to the registered paths and passes each value at a registered path
+to its callback as soon as that value is complete. Everything else is
+decoded one value at a time and dropped, so memory stays bounded by the
+largest single value (one pod) instead of the document.
+
+Paths are tuples of object keys, with ``"[]"`` standing for every
+element of an array::
+
+    JsonStream({("items", "[]"): pods.append})        # {"items": [...]}
+    JsonStream({("[]",): apps.append})                 # [...]
+    JsonStream({("status", "health"): set_health})    # {"status": {...}}
+
+Values are decoded with the C-accelerated ``json`` decoder. An incomplete
+value is retried only once the buffered text has doubled, so a value that
+spans many chunks is not re-parsed on every chunk.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable, Generator
+from typing import Any
+
+ITEMS = "[]"
+
+_DECODER = json.JSONDecoder()
+_WS_RE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(",]} \t\n\r")
+
+# Suspends the walk until more text is fed.
+_Walk = Generator[None, None, Any]
+
+
+class JsonStream:
+    """Feed JSON text with :meth:`feed`; finish with :meth:`close`.
+
+    Raises ``ValueError`` (from :meth:`feed` or :meth:`close`) on invalid
+    or truncated JSON. Callbacks already called keep their values.
+    """
+
+    def __init__(self, handlers: dict[tuple[str, ...], Callable[[Any], None]]):
+        self._handlers = handlers
+        self._prefixes = {path[:i] for path in handlers for i in range(len(path))}
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self.done = False
+        self._walk = self._document()
+        next(self._walk)
+
+    def feed(self, text: str) -> None:
+        if self.done or not text:
+            return
+        # Drop consumed text; what is left is at most one partial value.
+        self._buf = self._buf[self._pos :] + text
+        self._pos = 0
+        self._resume()
+
+    def close(self) -> None:
+        if self.done:
+            return
+        self._eof = True
+        self._resume()
+
+    def _resume(self) -> None:
+        try:
+            self._walk.send(None)
+        except StopIteration:
+            self.done = True
+
+    def _document(self) -> _Walk:
+        yield
+        yield from self._child(())
+        if (yield from self._peek()) is not None:
+            raise ValueError("extra data after JSON document")
+
+    def _peek(self) -> _Walk:
+        """Next non-whitespace character, or None at end of input."""
+        while True:
+            self._pos = _WS_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if self._eof:
+                return None
+            yield
+
+    def _expect(self, chars: str) -> _Walk:
+        char = yield from self._peek()
+        if char is None:
+            raise ValueError("truncated JSON")
+        if char not in chars:
+            raise ValueError(f"expected one of {chars!r} at offset {self._pos}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> _Walk:
+        """Decode one complete value at the current position."""
+        if (yield from self._peek()) is None:
+            raise ValueError("truncated JSON")
+        retry_at = 0
+        while True:
+            pending = len(self._buf) - self._pos
+            if pending >= retry_at or self._eof:
+                try:
+                    value, end = _DECODER.raw_decode(self._buf, self._pos)
+                except json.JSONDecodeError:
+                    if self._eof:
+                        raise
+                else:
+                    # A number is complete only once a delimiter follows it:
+                    # "12" or "1." may continue in the next chunk.
+                    is_number = isinstance(value, (int, float)) and not isinstance(
+                        value, bool
+                    )
+                    if (
+                        not is_number
+                        or self._eof
+                        or self._buf[end : end + 1] in _DELIMITERS
+                    ):
+                        self._pos = end
+                        return value
+                retry_at = 2 * pending
+            yield
+
+    def _child(self, path: tuple[str, ...]) -> _Walk:
+        handler = self._handlers.get(path)
+        if handler is not None:
+            handler((yield from self._value()))
+        elif path in self._prefixes:
+            yield from self._container(path)
+        else:
+            yield from self._value()
+
+    def _container(self, path: tuple[str, ...]) -> _Walk:
+        char = yield from self._peek()
+        if char not in ("{", "["):
+            # Not the container the path expects; nothing to report.
+            yield from self._value()
+            return
+        self._pos += 1
+        close = "}" if char == "{" else "]"
+        if (yield from self._peek()) == close:
+            self._pos += 1
+            return
+        while True:
+            if char == "{":
+                key = yield from self._value()
+                if not isinstance(key, str):
+                    raise ValueError(f"object key is not a string: {key!r}")
+                yield from self._expect(":")
+                yield from self._child((*path, key))
+            else:
+                yield from self._child((*path, ITEMS))
+            if (yield from self._expect("," + close)) == close:
+                return
@@ -0,0 +1,247 @@
+"""Language-aware LOC counting over a :class:`RepoSnapshot` inventory.
+
+``profile_stack`` used to count Python LOC by reading each ``.py`` file
+line by line, serially, and bailed out at 500 lines because the only
+question was "is Python incidental here?". Sizing a project needs the
+real number per language, so this module counts every source file in
+the inventory:
+
+* each file is read as bytes in one call and counted with C-level bytes
+  operations — strip non-newline whitespace, split on ``\\n``, drop the
+  empty pieces — instead of decoding and iterating line by line;
+* reads run in batches on a thread pool, so file I/O overlaps;
+* results are cached under ``.git/git-repo-agent/`` keyed by the tree
+  hash of ``HEAD``. A second run on the same commit reads one small JSON
+  file instead of the tree. Linked worktrees use the main repository's
+  ``.git`` (the common dir), so the cache outlives them.
+
+The cache is used only when the inventory came from git and the work
+tree is clean: then the tree hash determines exactly which files exist
+and what they contain. A dirty tree, or a directory outside git, is
+counted afresh every time.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .repo_snapshot import RepoSnapshot
+
+# File extension → language. Files with other extensions are not counted.
+LANGUAGES: dict[str, str] = {
+    ".py": "Python",
+    ".pyi": "Python",
+    ".js": "JavaScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".jsx": "JavaScript",
+    ".ts": "TypeScript",
+    ".mts": "TypeScript",
+    ".cts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".vue": "Vue",
+    ".svelte": "Svelte",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".kts": "Kotlin",
+    ".swift": "Swift",
+    ".c": "C",
+    ".h": "C",
+    ".cc": "C++",
+    ".cpp": "C++",
+    ".cxx": "C++",
+    ".hh": "C++",
+    ".hpp": "C++",
+    ".cs": "C#",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".lua": "Lua",
+    ".sh": "Shell",
+    ".bash": "Shell",
+    ".zsh": "Shell",
+    ".nix": "Nix",
+    ".tf": "HCL",
+}
+
+# Directory names and file names that mark Python test code, excluded
+# from ``python_outside_tests``.
+_TEST_DIR_NAMES = frozenset(
+    {".venv", "venv", "node_modules", "tests", "test", "__pycache__"}
+)
+
+_BLANK_CHARS = b" \t\r\f\v"
+
+_CACHE_DIR = "git-repo-agent"
+_CACHE_FILE = "loc.json"
+_CACHE_VERSION = 1
+
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# Files per pool task. One future per file costs more than counting a
+# typical source file, so workers take batches.
+_BATCH = 256
+
+
+@dataclass(frozen=True)
+class LocCount:
+    """Non-blank lines of code per language."""
+
+    by_language: dict[str, int] = field(default_factory=dict)
+    python_outside_tests: int = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.by_language.values())
+
+
+def count_lines(data: bytes) -> int:
+    """Number of lines in ``data`` with at least one non-whitespace byte."""
+    pieces = data.translate(None, _BLANK_CHARS).split(b"\n")
+    return len(pieces) - pieces.count(b"")
+
+
+def language_of(rel: str) -> str | None:
+    """Language of the file at ``rel``, by extension, or None."""
+    name = rel.rsplit("/", 1)[-1]
+    dot = name.rfind(".")
+    if dot <= 0:
+        return None
+    return LANGUAGES.get(name[dot:].lower())
+
+
+def is_python_test_path(rel: str) -> bool:
+    """True for ``.py`` files under a test/venv directory or named like a test."""
+    *dirs, name = rel.split("/")
+    if any(part in _TEST_DIR_NAMES for part in dirs):
+        return True
+    return name.startswith("test_") or name.endswith("_test.py")
+
+
+def _count_file(path: Path) -> int:
+    try:
+        with open(path, "rb") as f:
+            return count_lines(f.read())
+    except OSError:
+        return 0
+
+
+def _count_batch(paths: list[Path]) -> list[int]:
+    return [_count_file(path) for path in paths]
+
+
+def _count(snap: RepoSnapshot) -> LocCount:
+    sources = [
+        (rel, lang)
+        for rel in sorted(snap.files)
+        if (lang := language_of(rel)) is not None
+    ]
+    if not sources:
+        return LocCount()
+    paths = [snap.root / rel for rel, _ in sources]
+    batches = [paths[i : i + _BATCH] for i in range(0, len(paths), _BATCH)]
+    if len(batches) == 1:
+        counts = _count_batch(paths)
+    else:
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+            counts = [n for batch in pool.map(_count_batch, batches) for n in batch]
+    by_language: dict[str, int] = {}
+    python_outside_tests = 0
+    for (rel, lang), loc in zip(sources, counts):
+        by_language[lang] = by_language.get(lang, 0) + loc
+        if lang == "Python" and not is_python_test_path(rel):
+            python_outside_tests += loc
+    return LocCount(
+        by_language=dict(sorted(by_language.items(), key=lambda kv: (-kv[1], kv[0]))),
+        python_outside_tests=python_outside_tests,
+    )
+
+
+def _git(root: Path, *args: str) -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=30,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _clean_tree_key(root: Path) -> tuple[Path, str] | None:
+    """``(common git dir, HEAD tree hash)`` when the work tree is clean, else None."""
+    rev = _git(root, "rev-parse", "--git-common-dir", "HEAD^{tree}")
+    if rev is None:
+        return None
+    git_dir, tree = rev.splitlines()
+    status = _git(root, "status", "--porcelain", "--untracked-files=normal")
+    if status is None or status.strip():
+        return None
+    # Relative (e.g. ".git") when run from the main work tree's root.
+    return (root / git_dir).resolve(), tree
+
+
+def _load(cache_path: Path, tree: str) -> LocCount | None:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != _CACHE_VERSION
+        or data.get("tree") != tree
+    ):
+        return None
+    return LocCount(
+        by_language=dict(data.get("by_language", {})),
+        python_outside_tests=int(data.get("python_outside_tests", 0)),
+    )
+
+
+def _store(cache_path: Path, tree: str, loc: LocCount) -> None:
+    payload = {
+        "version": _CACHE_VERSION,
+        "tree": tree,
+        "by_language": loc.by_language,
+        "python_outside_tests": loc.python_outside_tests,
+    }
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        tmp.replace(cache_path)
+    except OSError:
+        pass
+
+
+def count_loc(snap: RepoSnapshot, *, use_cache: bool = True) -> LocCount:
+    """Count non-blank LOC per language across the snapshot's inventory.
+
+    With ``use_cache`` (the default), a clean git work tree whose
+    inventory came from git is looked up in, and stored to, the per-tree
+    cache under ``.git/git-repo-agent/``.
+    """
+    key = None
+    if use_cache and snap.use_git and snap.exists(".git"):
+        key = _clean_tree_key(snap.root)
+    if key is None:
+        return _count(snap)
+    git_dir, tree = key
+    cache_path = git_dir / _CACHE_DIR / _CACHE_FILE
+    cached = _load(cache_path, tree)
+    if cached is not None:
+        return cached
+    loc = _count(snap)
+    # Only a git inventory is a function of the tree hash alone.
+    if snap.inventory_source == "git":
+        _store(cache_path, tree, loc)
+    return loc
@@ -0,0 +1,112 @@
+"""On-disk TTL cache for pipeline diagnostics, shared between diagnose runs.
+
+Debugging a failing deployment usually means running ``git-repo-agent
+diagnose`` several times in a few minutes. Without a cache every run
+repeats each ``kubectl get``, ``argocd app get`` and ``gh run list``
+against the cluster and the GitHub API. This module keeps each source's
+successful result for a short, per-source time (:data:`SOURCE_TTLS`).
+
+Entries are keyed by source, namespace, ArgoCD app, the repository's
+``HEAD`` sha and, for kubectl and argocd, the current kube context or
+ArgoCD server. A new commit or a switch to another cluster re-collects. ``diagnose --fresh``
+skips the lookup (and still refreshes the cache). Only results with
+``"status": "ok"`` and no failed command (a ``*_error`` key in ``data``)
+are stored; errors and timeouts are retried next run.
+
+    $GIT_REPO_AGENT_PIPELINE_CACHE          (explicit; "off" disables)
+    $XDG_CACHE_HOME/git-repo-agent/pipeline
+    ~/.cache/git-repo-agent/pipeline
+
+Cache I/O failures are never fatal: they just mean collecting live.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV_VAR = "GIT_REPO_AGENT_PIPELINE_CACHE"
+_DISABLED_VALUES = frozenset({"", "0", "off", "false", "no"})
+
+# Seconds a cached result stays valid. Cluster state moves fastest;
+# package listings hardly at all.
+SOURCE_TTLS: dict[str, float] = {
+    "kubectl": 60,
+    "argocd": 60,
+    "actions": 120,
+    "packages": 900,
+}
+
+
+def cache_dir() -> Path | None:
+    """Directory holding cached results, or None when caching is disabled."""
+    explicit = os.environ.get(CACHE_ENV_VAR)
+    if explicit is not None:
+        if explicit.strip().lower() in _DISABLED_VALUES:
+            return None
+        return Path(explicit).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base).expanduser() if base else Path.home() / ".cache"
+    return root / "git-repo-agent" / "pipeline"
+
+
+def make_key(
+    source: str,
+    namespace: str | None,
+    app_name: str | None,
+    revision: str,
+    target: str | None = None,
+) -> str:
+    """Hash the cache key parts.
+
+    ``revision`` is the repo's HEAD sha; ``target`` the kube context or
+    ArgoCD server the source queries.
+    """
+    parts = json.dumps([source, namespace, app_name, revision, target])
+    return hashlib.sha256(parts.encode("utf-8")).hexdigest()
+
+
+def load(source: str, key: str) -> tuple[dict[str, Any], float] | None:
+    """Return ``(result, age in seconds)`` for a live entry, or None."""
+    directory = cache_dir()
+    if directory is None:
+        return None
+    try:
+        entry = json.loads((directory / f"{key}.json").read_text(encoding="utf-8"))
+        age = time.time() - float(entry["stored_at"])
+        result = entry["result"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not 0 <= age <= SOURCE_TTLS.get(source, 0) or not isinstance(result, dict):
+        return None
+    return result, age
+
+
+def _cacheable(result: dict[str, Any]) -> bool:
+    """``ok``, and none of the source's commands failed."""
+    if result.get("status") != "ok":
+        return False
+    data = result.get("data")
+    return not (isinstance(data, dict) and any(k.endswith("_error") for k in data))
+
+
+def store(key: str, result: dict[str, Any]) -> None:
+    """Persist a fully successful result under ``key`` (write + rename)."""
+    directory = cache_dir()
+    if directory is None or not _cacheable(result):
+        return
+    payload = json.dumps({"stored_at": time.time(), "result": result})
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = directory / f"{key}.{os.getpid()}.tmp"
+        tmp.write_text(payload, encoding="utf-8")
+        tmp.replace(directory / f"{key}.json")
+    except OSError as exc:
+        logger.debug("Pipeline cache write to %s failed: %s", directory, exc)
@@ -1,24 +1,98 @@
 """pipeline_collector — pre-compute GitOps pipeline diagnostics from CLI sources.
 
 Collects read-only diagnostic snapshots from kubectl, argocd, and GitHub CLI
-before the agent session starts. Each collector runs a subprocess with a timeout,
-returns structured data, and handles missing tools gracefully.
+before the agent session starts. Each collector runs subprocesses with a
+timeout, returns structured data, and handles missing tools gracefully.
+
+Sources run concurrently on asyncio subprocesses: the ``gh auth status``
+probe, every source's commands and, within a source, independent commands
+(pods and events, app status and history, failed-run details) all overlap.
+Each source has its own timeout (:data:`_SOURCE_TIMEOUTS`) and the whole
+collection an overall deadline, so ``diagnose`` startup is bounded by the
+slowest source rather than the sum of all of them. A source that runs out
+of time is reported with ``"status": "timeout"``; its subprocesses are
+killed.
+
+Successful results are kept in an on-disk TTL cache between runs (see
+:mod:`.pipeline_cache`); a cached source is neither probed nor collected
+again until its TTL runs out, ``HEAD`` moves, or (for kubectl and argocd)
+the current kube context or ArgoCD server changes. ``fresh=True``
+bypasses the lookup.
+
+kubectl and ArgoCD output can run to tens of MB for a large namespace.
+It is parsed as it streams in (:mod:`.json_stream`): each pod, event or
+resource is projected to the few fields the diagnose prompt uses as soon
+as it is complete, and the rest is dropped. Values passed through
+verbatim (ArgoCD conditions and history) are redacted while projecting.
+Each of these sources reads at most :data:`_SOURCE_BYTE_BUDGETS` bytes of
+output; past that its commands are killed and the partial result is
+marked truncated.
 """
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import contextlib
 import json
+import os
 import re
-import subprocess
+import shutil
+import signal
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from . import pipeline_cache
+from .git_metadata import collect_git_metadata
+from .json_stream import ITEMS, JsonStream
+
 # Maximum items to include per source to keep prompt size reasonable
 _MAX_EVENTS = 20
 _MAX_WORKFLOW_RUNS = 10
 _MAX_LOG_LINES = 50
+_MAX_ARGOCD_HISTORY = 5
 _SUBPROCESS_TIMEOUT = 10  # seconds
 
+# Diagnostic sources in result order, with their result keys.
+_SOURCES = ("kubectl", "argocd", "actions", "packages")
+_RESULT_KEYS = {
+    "kubectl": "kubectl",
+    "argocd": "argocd",
+    "actions": "github_actions",
+    "packages": "github_packages",
+}
+_UNAVAILABLE_MESSAGES = {
+    "kubectl": "kubectl not found",
+    "argocd": "argocd not found",
+    "actions": "gh CLI not authenticated",
+    "packages": "gh CLI not authenticated",
+}
+
+# Wall-clock budget per source, covering all of its commands, and for the
+# whole collection. Commands inside a source keep their own timeouts.
+_SOURCE_TIMEOUTS: dict[str, float] = {
+    "kubectl": 20,
+    "argocd": 20,
+    "actions": 35,
+    "packages": 30,
+}
+_COLLECTION_DEADLINE = 40.0  # seconds
+# Local config reads that name the cluster / server a source talks to.
+_TARGET_TIMEOUT = 5  # seconds
+
+# Bytes of CLI output a streamed source may read, shared by its commands.
+# Output is projected as it arrives, so this bounds parsing work; memory
+# is bounded by the projection regardless.
+_SOURCE_BYTE_BUDGETS: dict[str, int] = {
+    "kubectl": 64 * 1024 * 1024,
+    "argocd": 32 * 1024 * 1024,
+}
+_STREAM_CHUNK = 64 * 1024
+
 # Patterns for values that should be redacted
 _SECRET_KEY_PATTERNS = re.compile(
     r"(password|token|secret|key|credential|auth)(?!_?name|_?type|_?id|_?path)",
@@ -26,30 +100,164 @@ _SECRET_KEY_PATTERNS = re.compile(
 )
 
 
-def _run_cmd(
+def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill ``proc`` and, on POSIX, every process in its group."""
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+
+
+async def _reap(proc: asyncio.subprocess.Process) -> None:
+    """Kill ``proc`` and drain its pipes, so their transports close now
+    rather than when garbage-collected after the event loop is gone."""
+    _kill(proc)
+    await proc.communicate()
+
+
+async def _gather(*aws: Awaitable[Any]) -> list[Any]:
+    """``asyncio.gather`` that, when cancelled, waits for every child.
+
+    A cancelled ``gather`` cancels its children but returns as soon as one
+    of them has stopped, while the others may still be killing and reaping
+    their processes. If the event loop then shuts down, their pipes are
+    left open.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except asyncio.CancelledError:
+        await asyncio.wait(tasks)
+        raise
+
+
+async def _run_cmd(
     cmd: list[str],
     *,
-    timeout: int = _SUBPROCESS_TIMEOUT,
+    timeout: float = _SUBPROCESS_TIMEOUT,
     cwd: Path | None = None,
 ) -> tuple[bool, str]:
-    """Run a command and return (success, output)."""
+    """Run a command and return (success, output).
+
+    The process is killed when it times out or the awaiting task is
+    cancelled. It runs in its own session so that its whole process group
+    can be killed: a child left holding the output pipes would otherwise
+    keep the wait open.
+    """
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
             cwd=cwd,
+            start_new_session=True,
+        )
+    except FileNotFoundError:
+        return False, "command not found"
+    except OSError as exc:
+        return False, str(exc)
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        return False, f"timed out after {timeout:g}s"
+    finally:
+        if proc.returncode is None:
+            await _reap(proc)
+    if proc.returncode == 0:
+        return True, stdout.decode("utf-8", errors="replace").strip()
+    return False, (
+        stderr.decode("utf-8", errors="replace").strip()
+        or f"exit code {proc.returncode}"
+    )
+
+
+@dataclass
+class _ByteBudget:
+    """Output bytes a source may still read, shared by its commands."""
+
+    limit: int
+    used: int = 0
+
+    def spend(self, n: int) -> bool:
+        """Charge ``n`` bytes; False once the budget is exceeded."""
+        self.used += n
+        return self.used <= self.limit
+
+
+async def _stream_json_cmd(
+    cmd: list[str],
+    handlers: dict[tuple[str, ...], Callable[[Any], None]],
+    budget: _ByteBudget,
+    *,
+    timeout: float = _SUBPROCESS_TIMEOUT,
+) -> tuple[bool, str]:
+    """Run a command, feeding its JSON output to ``handlers`` as it arrives.
+
+    Returns (success, message). On success the message is empty, or says
+    the output was truncated: once ``budget`` is exceeded the process is
+    killed and the handlers keep what was parsed up to that point. The
+    process is killed the same way as in :func:`_run_cmd` on timeout,
+    cancellation or invalid JSON.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
         )
-        if result.returncode == 0:
-            return True, result.stdout.strip()
-        return False, result.stderr.strip() or f"exit code {result.returncode}"
     except FileNotFoundError:
         return False, "command not found"
-    except subprocess.TimeoutExpired:
-        return False, f"timed out after {timeout}s"
     except OSError as exc:
         return False, str(exc)
+    assert proc.stdout is not None and proc.stderr is not None
+    stream = JsonStream(handlers)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    truncated = False
+
+    async def communicate() -> bytes:
+        nonlocal truncated
+        stderr_read = asyncio.ensure_future(proc.stderr.read())
+        try:
+            while chunk := await proc.stdout.read(_STREAM_CHUNK):
+                if not budget.spend(len(chunk)):
+                    truncated = True
+                    _kill(proc)
+                    await proc.stdout.read()
+                    break
+                stream.feed(decoder.decode(chunk))
+            else:
+                stream.feed(decoder.decode(b"", final=True))
+            stderr = await stderr_read
+            await proc.wait()
+            return stderr
+        finally:
+            stderr_read.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await stderr_read
+
+    try:
+        stderr = await asyncio.wait_for(communicate(), timeout)
+    except asyncio.TimeoutError:
+        return False, f"timed out after {timeout:g}s"
+    except ValueError as exc:
+        return False, f"invalid JSON output: {exc}"
+    finally:
+        if proc.returncode is None:
+            await _reap(proc)
+    if truncated:
+        return True, f"output exceeded {budget.limit} bytes; truncated"
+    if proc.returncode != 0:
+        return False, (
+            stderr.decode("utf-8", errors="replace").strip()
+            or f"exit code {proc.returncode}"
+        )
+    try:
+        stream.close()
+    except ValueError as exc:
+        return False, f"invalid JSON output: {exc}"
+    return True, ""
 
 
 def _redact_secrets(data: Any) -> Any:
@@ -74,202 +282,218 @@ def _parse_json_output(output: str) -> Any:
         return None
 
 
-def _detect_available_sources() -> list[str]:
-    """Detect which diagnostic CLI tools are available."""
-    available = []
+async def _probe_source(
+    source: str, gh_auth: Awaitable[tuple[bool, str]] | None
+) -> bool:
+    """Whether ``source`` can be collected: its CLI is on PATH / gh is authed."""
+    if source in ("kubectl", "argocd"):
+        return shutil.which(source) is not None
+    if gh_auth is None:
+        return False
+    ok, _ = await gh_auth
+    return ok
+
+
+def _project_pod(pod: dict[str, Any]) -> dict[str, Any]:
+    """Name, namespace, phase, restarts, readiness and non-True conditions."""
+    metadata = pod.get("metadata", {})
+    status = pod.get("status", {})
+    containers = status.get("containerStatuses", [])
+    return {
+        "name": metadata.get("name"),
+        "namespace": metadata.get("namespace"),
+        "phase": status.get("phase"),
+        "restart_count": sum(c.get("restartCount", 0) for c in containers),
+        "ready": all(c.get("ready", False) for c in containers)
+        if containers
+        else False,
+        "conditions": [
+            {"type": c.get("type"), "status": c.get("status")}
+            for c in status.get("conditions", [])
+            if c.get("status") != "True"
+        ],
+    }
 
-    ok, _ = _run_cmd(["which", "kubectl"])
-    if ok:
-        available.append("kubectl")
 
-    ok, _ = _run_cmd(["which", "argocd"])
-    if ok:
-        available.append("argocd")
+def _project_event(event: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "type": event.get("type"),
+        "reason": event.get("reason"),
+        "message": (event.get("message") or "")[:200],
+        "involved_object": event.get("involvedObject", {}).get("name"),
+        "last_timestamp": event.get("lastTimestamp"),
+        "count": event.get("count"),
+    }
 
-    ok, _ = _run_cmd(["gh", "auth", "status"])
-    if ok:
-        available.extend(["actions", "packages"])
 
-    return available
+def _if_dict(handler: Callable[[dict[str, Any]], None]) -> Callable[[Any], None]:
+    """Wrap ``handler`` to skip array elements that are not objects."""
+    return lambda value: handler(value) if isinstance(value, dict) else None
+
+
+def _record_stream(
+    data: dict[str, Any], name: str, outcome: tuple[bool, str], value: Any
+) -> None:
+    """Store a streamed command's ``value``, truncation note or error."""
+    ok, message = outcome
+    if not ok:
+        data[f"{name}_error"] = message
+        return
+    data[name] = value
+    if message:
+        data[f"{name}_truncated"] = message
 
 
-def _collect_kubectl(namespace: str | None) -> dict[str, Any]:
+async def _collect_kubectl(namespace: str | None) -> dict[str, Any]:
     """Collect pod status and recent events from kubectl."""
     ns_args = ["--namespace", namespace] if namespace else ["--all-namespaces"]
-    result: dict[str, Any] = {"status": "ok", "data": {}}
-
-    # Pod status
-    ok, output = _run_cmd(
-        ["kubectl", "get", "pods", *ns_args, "-o", "json"],
-        timeout=15,
+    budget = _ByteBudget(_SOURCE_BYTE_BUDGETS["kubectl"])
+    pods: list[dict[str, Any]] = []
+    # Events are sorted oldest first; keep the newest.
+    events: deque[dict[str, Any]] = deque(maxlen=_MAX_EVENTS)
+
+    pods_outcome, events_outcome = await _gather(
+        # Pod status
+        _stream_json_cmd(
+            ["kubectl", "get", "pods", *ns_args, "-o", "json"],
+            {("items", ITEMS): _if_dict(lambda p: pods.append(_project_pod(p)))},
+            budget,
+            timeout=15,
+        ),
+        # Recent events (errors and warnings only)
+        _stream_json_cmd(
+            [
+                "kubectl",
+                "get",
+                "events",
+                *ns_args,
+                "--sort-by=.lastTimestamp",
+                "--field-selector=type!=Normal",
+                "-o",
+                "json",
+            ],
+            {("items", ITEMS): _if_dict(lambda e: events.append(_project_event(e)))},
+            budget,
+            timeout=15,
+        ),
     )
-    if ok:
-        parsed = _parse_json_output(output)
-        if parsed:
-            pods = parsed.get("items", [])
-            # Summarise: name, namespace, phase, restarts, conditions
-            pod_summaries = []
-            for pod in pods:
-                metadata = pod.get("metadata", {})
-                status = pod.get("status", {})
-                containers = status.get("containerStatuses", [])
-                restart_count = sum(c.get("restartCount", 0) for c in containers)
-                pod_summaries.append(
-                    {
-                        "name": metadata.get("name"),
-                        "namespace": metadata.get("namespace"),
-                        "phase": status.get("phase"),
-                        "restart_count": restart_count,
-                        "ready": all(c.get("ready", False) for c in containers)
-                        if containers
-                        else False,
-                        "conditions": [
-                            {"type": c.get("type"), "status": c.get("status")}
-                            for c in status.get("conditions", [])
-                            if c.get("status") != "True"
-                        ],
-                    }
-                )
-            result["data"]["pods"] = pod_summaries
-    else:
-        result["data"]["pods_error"] = output
+    data: dict[str, Any] = {}
+    _record_stream(data, "pods", pods_outcome, pods)
+    _record_stream(data, "events", events_outcome, list(events))
+    return {"status": "ok", "data": data}
 
-    # Recent events (errors and warnings only)
-    ok, output = _run_cmd(
-        [
-            "kubectl",
-            "get",
-            "events",
-            *ns_args,
-            "--sort-by=.lastTimestamp",
-            "--field-selector=type!=Normal",
-            "-o",
-            "json",
-        ],
-        timeout=15,
-    )
-    if ok:
-        parsed = _parse_json_output(output)
-        if parsed:
-            events = parsed.get("items", [])[-_MAX_EVENTS:]
-            result["data"]["events"] = [
-                {
-                    "type": e.get("type"),
-                    "reason": e.get("reason"),
-                    "message": e.get("message", "")[:200],
-                    "involved_object": e.get("involvedObject", {}).get("name"),
-                    "last_timestamp": e.get("lastTimestamp"),
-                    "count": e.get("count"),
-                }
-                for e in events
-            ]
-    else:
-        result["data"]["events_error"] = output
 
-    return _redact_secrets(result)
-
-
-def _collect_argocd(app_name: str | None, namespace: str | None) -> dict[str, Any]:
+async def _collect_argocd(
+    app_name: str | None, namespace: str | None
+) -> dict[str, Any]:
     """Collect ArgoCD application status and history."""
-    result: dict[str, Any] = {"status": "ok", "data": {}}
+    budget = _ByteBudget(_SOURCE_BYTE_BUDGETS["argocd"])
+    data: dict[str, Any] = {}
 
     if app_name:
-        # Specific app status
-        ok, output = _run_cmd(
-            ["argocd", "app", "get", app_name, "-o", "json"],
-            timeout=15,
-        )
-        if ok:
-            parsed = _parse_json_output(output)
-            if parsed:
-                status = parsed.get("status", {})
-                result["data"]["app"] = {
-                    "name": parsed.get("metadata", {}).get("name"),
-                    "sync_status": status.get("sync", {}).get("status"),
-                    "health_status": status.get("health", {}).get("status"),
-                    "sync_revision": status.get("sync", {}).get("revision"),
-                    "conditions": status.get("conditions", []),
-                    "resources_summary": _summarise_argocd_resources(
-                        status.get("resources", [])
+        # Specific app status and deployment history
+        fields: dict[str, Any] = {}
+        resources = _new_resource_summary()
+        history: deque[Any] = deque(maxlen=_MAX_ARGOCD_HISTORY)
+        app_outcome, history_outcome = await _gather(
+            _stream_json_cmd(
+                ["argocd", "app", "get", app_name, "-o", "json"],
+                {
+                    ("metadata", "name"): partial(fields.__setitem__, "name"),
+                    ("status", "sync"): partial(fields.__setitem__, "sync"),
+                    ("status", "health"): partial(fields.__setitem__, "health"),
+                    ("status", "conditions"): partial(fields.__setitem__, "conditions"),
+                    ("status", "resources", ITEMS): _if_dict(
+                        partial(_count_argocd_resource, resources)
                     ),
-                }
-        else:
-            result["data"]["app_error"] = output
-
-        # App history
-        ok, output = _run_cmd(
-            ["argocd", "app", "history", app_name, "-o", "json"],
-            timeout=15,
+                },
+                budget,
+                timeout=15,
+            ),
+            _stream_json_cmd(
+                ["argocd", "app", "history", app_name, "-o", "json"],
+                {(ITEMS,): lambda entry: history.append(_redact_secrets(entry))},
+                budget,
+                timeout=15,
+            ),
         )
-        if ok:
-            parsed = _parse_json_output(output)
-            if parsed and isinstance(parsed, list):
-                result["data"]["history"] = parsed[-5:]  # last 5 deployments
-        else:
-            result["data"]["history_error"] = output
+        sync = fields.get("sync") or {}
+        health = fields.get("health") or {}
+        app = {
+            "name": fields.get("name"),
+            "sync_status": sync.get("status"),
+            "health_status": health.get("status"),
+            "sync_revision": sync.get("revision"),
+            "conditions": _redact_secrets(fields.get("conditions") or []),
+            "resources_summary": resources,
+        }
+        _record_stream(data, "app", app_outcome, app)
+        # The last few deployments
+        _record_stream(data, "history", history_outcome, list(history))
     else:
         # List all apps
-        ok, output = _run_cmd(
+        apps: list[dict[str, Any]] = []
+        outcome = await _stream_json_cmd(
             ["argocd", "app", "list", "-o", "json"],
+            {
+                (ITEMS,): _if_dict(
+                    lambda a: apps.append(
+                        {
+                            "name": a.get("metadata", {}).get("name"),
+                            "sync_status": a.get("status", {})
+                            .get("sync", {})
+                            .get("status"),
+                            "health_status": a.get("status", {})
+                            .get("health", {})
+                            .get("status"),
+                        }
+                    )
+                )
+            },
+            budget,
             timeout=15,
         )
-        if ok:
-            parsed = _parse_json_output(output)
-            if parsed and isinstance(parsed, list):
-                result["data"]["apps"] = [
-                    {
-                        "name": a.get("metadata", {}).get("name"),
-                        "sync_status": a.get("status", {})
-                        .get("sync", {})
-                        .get("status"),
-                        "health_status": a.get("status", {})
-                        .get("health", {})
-                        .get("status"),
-                    }
-                    for a in parsed
-                ]
-        else:
-            result["data"]["apps_error"] = output
+        _record_stream(data, "apps", outcome, apps)
 
-    return _redact_secrets(result)
+    return {"status": "ok", "data": data}
 
 
-def _summarise_argocd_resources(resources: list[dict]) -> dict[str, int]:
-    """Summarise ArgoCD resource sync/health counts."""
-    summary: dict[str, int] = {
-        "total": len(resources),
+def _new_resource_summary() -> dict[str, int]:
+    return {
+        "total": 0,
         "synced": 0,
         "out_of_sync": 0,
         "healthy": 0,
         "degraded": 0,
         "missing": 0,
     }
-    for r in resources:
-        sync = r.get("status")
-        health = (
-            r.get("health", {}).get("status")
-            if isinstance(r.get("health"), dict)
-            else None
-        )
-        if sync == "Synced":
-            summary["synced"] += 1
-        elif sync == "OutOfSync":
-            summary["out_of_sync"] += 1
-        if health == "Healthy":
-            summary["healthy"] += 1
-        elif health == "Degraded":
-            summary["degraded"] += 1
-        elif health == "Missing":
-            summary["missing"] += 1
-    return summary
-
-
-def _collect_gh_actions(repo_path: Path) -> dict[str, Any]:
+
+
+def _count_argocd_resource(summary: dict[str, int], r: dict[str, Any]) -> None:
+    """Add one ArgoCD resource to the sync/health ``summary`` counts."""
+    summary["total"] += 1
+    sync = r.get("status")
+    health = (
+        r.get("health", {}).get("status") if isinstance(r.get("health"), dict) else None
+    )
+    if sync == "Synced":
+        summary["synced"] += 1
+    elif sync == "OutOfSync":
+        summary["out_of_sync"] += 1
+    if health == "Healthy":
+        summary["healthy"] += 1
+    elif health == "Degraded":
+        summary["degraded"] += 1
+    elif health == "Missing":
+        summary["missing"] += 1
+
+
+async def _collect_gh_actions(repo_path: Path) -> dict[str, Any]:
     """Collect recent GitHub Actions workflow runs and failure details."""
     result: dict[str, Any] = {"status": "ok", "data": {}}
 
     # Recent runs
-    ok, output = _run_cmd(
+    ok, output = await _run_cmd(
         [
             "gh",
             "run",
@@ -291,18 +515,22 @@ def _collect_gh_actions(repo_path: Path) -> dict[str, Any]:
 
     result["data"]["runs"] = runs
 
-    # Get details for failed runs
-    failed_runs = [r for r in runs if r.get("conclusion") == "failure"]
-    failed_details = []
-    for run in failed_runs[:3]:  # limit to 3 most recent failures
-        run_id = run.get("databaseId")
-        if not run_id:
-            continue
-        ok, detail_output = _run_cmd(
-            ["gh", "run", "view", str(run_id), "--json", "jobs"],
-            cwd=repo_path,
-            timeout=15,
+    # Get details for failed runs, concurrently
+    failed_runs = [
+        r for r in runs if r.get("conclusion") == "failure" and r.get("databaseId")
+    ][:3]  # limit to 3 most recent failures
+    details = await _gather(
+        *(
+            _run_cmd(
+                ["gh", "run", "view", str(run["databaseId"]), "--json", "jobs"],
+                cwd=repo_path,
+                timeout=15,
+            )
+            for run in failed_runs
         )
+    )
+    failed_details = []
+    for run, (ok, detail_output) in zip(failed_runs, details):
         if ok:
             detail = _parse_json_output(detail_output)
             if detail:
@@ -326,7 +554,7 @@ def _collect_gh_actions(repo_path: Path) -> dict[str, Any]:
                 if failed_jobs:
                     failed_details.append(
                         {
-                            "run_id": run_id,
+                            "run_id": run["databaseId"],
                             "name": run.get("name"),
                             "url": run.get("url"),
                             "failed_jobs": failed_jobs,
@@ -337,12 +565,12 @@ def _collect_gh_actions(repo_path: Path) -> dict[str, Any]:
     return result
 
 
-def _collect_gh_packages(repo_path: Path) -> dict[str, Any]:
+async def _collect_gh_packages(repo_path: Path) -> dict[str, Any]:
     """Collect GitHub Packages information."""
     result: dict[str, Any] = {"status": "ok", "data": {}}
 
     # Get repo info for the API call
-    ok, output = _run_cmd(
+    ok, output = await _run_cmd(
         ["gh", "repo", "view", "--json", "owner,name"],
         cwd=repo_path,
         timeout=10,
@@ -358,7 +586,7 @@ def _collect_gh_packages(repo_path: Path) -> dict[str, Any]:
     repo_name = repo_info.get("name", "")
 
     # List packages
-    ok, output = _run_cmd(
+    ok, output = await _run_cmd(
         ["gh", "api", f"/repos/{owner}/{repo_name}/packages?package_type=container"],
         cwd=repo_path,
         timeout=15,
@@ -384,54 +612,182 @@ def _collect_gh_packages(repo_path: Path) -> dict[str, Any]:
     return result
 
 
-def collect_pipeline_diagnostics(
+async def _collect_source(
+    source: str,
+    probe: Awaitable[bool],
+    collect: Callable[[], Awaitable[dict[str, Any]]],
+    *,
+    explicit: bool,
+    cache_key: str,
+) -> dict[str, Any] | None:
+    """Probe and collect one source within its timeout.
+
+    Returns None for an unavailable source that was only auto-detected,
+    so it is left out of the results. A successful result is cached
+    under ``cache_key``.
+    """
+    if not await probe:
+        if not explicit:
+            return None
+        return {"status": "unavailable", "message": _UNAVAILABLE_MESSAGES[source]}
+    timeout = _SOURCE_TIMEOUTS[source]
+    try:
+        result = await asyncio.wait_for(collect(), timeout)
+    except asyncio.TimeoutError:
+        return {"status": "timeout", "message": f"timed out after {timeout:g}s"}
+    pipeline_cache.store(cache_key, result)
+    return result
+
+
+def _current_argocd_server(output: str) -> str | None:
+    """Server of the ``*`` row in ``argocd context`` output."""
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) >= 2 and fields[0] == "*":
+            return fields[-1]
+    return None
+
+
+async def _cli_target(source: str) -> str | None:
+    """The kube context / ArgoCD server ``source`` would query, if known.
+
+    Both come from local CLI config, so neither touches the network.
+    """
+    if source == "kubectl" and shutil.which("kubectl"):
+        ok, output = await _run_cmd(
+            ["kubectl", "config", "current-context"], timeout=_TARGET_TIMEOUT
+        )
+        return output if ok else None
+    if source == "argocd":
+        server = os.environ.get("ARGOCD_SERVER")
+        if server or not shutil.which("argocd"):
+            return server or None
+        ok, output = await _run_cmd(["argocd", "context"], timeout=_TARGET_TIMEOUT)
+        return _current_argocd_server(output) if ok else None
+    return None
+
+
+async def _cache_keys(
+    repo_path: Path,
+    requested: list[str],
+    namespace: str | None,
+    app_name: str | None,
+) -> dict[str, str]:
+    """Cache key per source, from the parameters that source depends on."""
+    targets: dict[str, str | None] = dict.fromkeys(_SOURCES)
+    lookups = [s for s in ("kubectl", "argocd") if s in requested]
+    if lookups and pipeline_cache.cache_dir() is not None:
+        found = await asyncio.gather(*(_cli_target(s) for s in lookups))
+        targets.update(zip(lookups, found))
+    meta = collect_git_metadata(repo_path)
+    revision = meta.head if meta is not None and meta.head else None
+    # Outside git (or before the first commit) the path stands in for HEAD.
+    revision = revision or f"path:{repo_path.resolve()}"
+    scoped = {
+        "kubectl": (namespace, None),
+        "argocd": (namespace, app_name),
+        "actions": (None, None),
+        "packages": (None, None),
+    }
+    return {
+        s: pipeline_cache.make_key(s, ns, app, revision, targets[s])
+        for s, (ns, app) in scoped.items()
+    }
+
+
+async def collect_pipeline_diagnostics(
     repo_path: Path,
     sources: list[str] | None = None,
     namespace: str | None = None,
     app_name: str | None = None,
+    *,
+    deadline: float = _COLLECTION_DEADLINE,
+    fresh: bool = False,
 ) -> dict[str, Any]:
     """Pre-compute pipeline diagnostics from available CLI sources.
 
+    Requested sources are probed and collected concurrently; sources
+    that were not requested are never probed, so ``available_sources``
+    only lists requested sources. Sources still running when
+    ``deadline`` seconds have passed are cancelled and reported as timed
+    out. Sources with a live cache entry are served from it, with
+    ``cached_age_s`` added to their result.
+
     Args:
         repo_path: Path to the repository.
         sources: Requested diagnostic sources (None = auto-detect).
         namespace: Kubernetes namespace for kubectl/argocd.
         app_name: ArgoCD application name.
+        deadline: Overall time budget in seconds.
+        fresh: Ignore cached results (new results are still cached).
 
     Returns:
         Dictionary with per-source diagnostic data.
     """
-    available = _detect_available_sources()
-    requested = sources or available
+    collectors: dict[str, Callable[[], Awaitable[dict[str, Any]]]] = {
+        "kubectl": lambda: _collect_kubectl(namespace),
+        "argocd": lambda: _collect_argocd(app_name, namespace),
+        "actions": lambda: _collect_gh_actions(repo_path),
+        "packages": lambda: _collect_gh_packages(repo_path),
+    }
+    requested = [s for s in _SOURCES if sources is None or s in sources]
+    keys = await _cache_keys(repo_path, requested, namespace, app_name)
+    cached: dict[str, dict[str, Any]] = {}
+    for source in requested if not fresh else ():
+        hit = pipeline_cache.load(source, keys[source])
+        if hit is not None:
+            result, age = hit
+            cached[source] = {**result, "cached_age_s": round(age)}
+
+    to_probe = [s for s in requested if s not in cached]
+    gh_auth: asyncio.Future[tuple[bool, str]] | None = None
+    if "actions" in to_probe or "packages" in to_probe:
+        gh_auth = asyncio.ensure_future(_run_cmd(["gh", "auth", "status"]))
+    probes = {s: asyncio.ensure_future(_probe_source(s, gh_auth)) for s in to_probe}
+    tasks = {
+        s: asyncio.ensure_future(
+            _collect_source(
+                s,
+                probes[s],
+                collectors[s],
+                explicit=sources is not None,
+                cache_key=keys[s],
+            )
+        )
+        for s in to_probe
+    }
+
+    pending: set[asyncio.Future[Any]] = set()
+    if tasks:
+        _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+    leftovers = [*pending, *probes.values()]
+    if gh_auth is not None:
+        leftovers.append(gh_auth)
+    for future in leftovers:
+        future.cancel()
+    # Let cancelled commands kill and reap their processes.
+    await asyncio.gather(*leftovers, return_exceptions=True)
+
+    probed = {
+        s for s, p in probes.items() if p.done() and not p.cancelled() and p.result()
+    }
+    available = [s for s in _SOURCES if s in cached or s in probed]
     results: dict[str, Any] = {
         "available_sources": available,
         "requested_sources": sources,
     }
-
-    if "kubectl" in requested and "kubectl" in available:
-        results["kubectl"] = _collect_kubectl(namespace)
-    elif "kubectl" in requested:
-        results["kubectl"] = {"status": "unavailable", "message": "kubectl not found"}
-
-    if "argocd" in requested and "argocd" in available:
-        results["argocd"] = _collect_argocd(app_name, namespace)
-    elif "argocd" in requested:
-        results["argocd"] = {"status": "unavailable", "message": "argocd not found"}
-
-    if "actions" in requested and "actions" in available:
-        results["github_actions"] = _collect_gh_actions(repo_path)
-    elif "actions" in requested:
-        results["github_actions"] = {
-            "status": "unavailable",
-            "message": "gh CLI not authenticated",
-        }
-
-    if "packages" in requested and "packages" in available:
-        results["github_packages"] = _collect_gh_packages(repo_path)
-    elif "packages" in requested:
-        results["github_packages"] = {
-            "status": "unavailable",
-            "message": "gh CLI not authenticated",
-        }
-
+    for source in requested:
+        if source in cached:
+            results[_RESULT_KEYS[source]] = cached[source]
+            continue
+        task = tasks[source]
+        if task.cancelled():
+            outcome: dict[str, Any] | None = {
+                "status": "timeout",
+                "message": f"collection deadline of {deadline:g}s exceeded",
+            }
+        else:
+            outcome = task.result()
+        if outcome is not None:
+            results[_RESULT_KEYS[source]] = outcome
     return results
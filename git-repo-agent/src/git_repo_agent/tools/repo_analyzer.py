@@ -1,55 +1,34 @@
 """repo_analyze MCP tool — detects repository technology stack and structure."""
 
 import json
-import subprocess
 from pathlib import Path
 from typing import Any
 
 from claude_agent_sdk import tool
 
+from .git_metadata import collect_git_metadata
+from .repo_snapshot import RepoSnapshot, snapshot_for
 
-def _read_json(path: Path) -> dict[str, Any] | None:
-    """Read and parse a JSON file, returning None on failure."""
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
-        return None
 
-
-def _read_toml(path: Path) -> dict[str, Any] | None:
-    """Read and parse a TOML file, returning None on failure."""
-    try:
-        import tomllib
-    except ImportError:
-        try:
-            import tomli as tomllib  # type: ignore[no-redef]
-        except ImportError:
-            return None
-    try:
-        return tomllib.loads(path.read_text(encoding="utf-8"))
-    except (OSError, Exception):
-        return None
-
-
-def _detect_language(repo: Path) -> str:
+def _detect_language(snap: RepoSnapshot) -> str:
     """Detect primary language from manifest files."""
-    if (repo / "package.json").exists():
-        return "typescript" if (repo / "tsconfig.json").exists() else "javascript"
-    if (repo / "pyproject.toml").exists() or (repo / "setup.py").exists():
+    if snap.exists("package.json"):
+        return "typescript" if snap.exists("tsconfig.json") else "javascript"
+    if snap.exists("pyproject.toml") or snap.exists("setup.py"):
         return "python"
-    if (repo / "Cargo.toml").exists():
+    if snap.exists("Cargo.toml"):
         return "rust"
-    if (repo / "go.mod").exists():
+    if snap.exists("go.mod"):
         return "go"
-    if (repo / "build.gradle").exists() or (repo / "pom.xml").exists():
+    if snap.exists("build.gradle") or snap.exists("pom.xml"):
         return "java"
     return "unknown"
 
 
-def _detect_framework(repo: Path, language: str) -> str:
+def _detect_framework(snap: RepoSnapshot, language: str) -> str:
     """Detect framework from dependencies."""
     if language in ("javascript", "typescript"):
-        pkg = _read_json(repo / "package.json")
+        pkg = snap.json("package.json")
         if pkg:
             all_deps = {
                 **pkg.get("dependencies", {}),
@@ -69,7 +48,7 @@ def _detect_framework(repo: Path, language: str) -> str:
                 if fw in all_deps:
                     return name
     elif language == "python":
-        pyproject = _read_toml(repo / "pyproject.toml")
+        pyproject = snap.toml("pyproject.toml")
         if pyproject:
             deps = pyproject.get("project", {}).get("dependencies", [])
             deps_str = " ".join(deps) if isinstance(deps, list) else str(deps)
@@ -82,7 +61,7 @@ def _detect_framework(repo: Path, language: str) -> str:
                 if fw in deps_str.lower():
                     return name
     elif language == "rust":
-        cargo = _read_toml(repo / "Cargo.toml")
+        cargo = snap.toml("Cargo.toml")
         if cargo:
             deps = cargo.get("dependencies", {})
             for fw, name in [
@@ -96,24 +75,24 @@ def _detect_framework(repo: Path, language: str) -> str:
     return "none"
 
 
-def _detect_package_manager(repo: Path, language: str) -> str:
+def _detect_package_manager(snap: RepoSnapshot, language: str) -> str:
     """Detect package manager."""
     if language in ("javascript", "typescript"):
-        if (repo / "bun.lockb").exists() or (repo / "bun.lock").exists():
+        if snap.exists("bun.lockb") or snap.exists("bun.lock"):
             return "bun"
-        if (repo / "pnpm-lock.yaml").exists():
+        if snap.exists("pnpm-lock.yaml"):
             return "pnpm"
-        if (repo / "yarn.lock").exists():
+        if snap.exists("yarn.lock"):
             return "yarn"
-        if (repo / "package-lock.json").exists():
+        if snap.exists("package-lock.json"):
             return "npm"
         return "npm"
     if language == "python":
-        if (repo / "uv.lock").exists():
+        if snap.exists("uv.lock"):
             return "uv"
-        if (repo / "Pipfile").exists():
+        if snap.exists("Pipfile"):
             return "pipenv"
-        if (repo / "poetry.lock").exists():
+        if snap.exists("poetry.lock"):
             return "poetry"
         return "pip"
     if language == "rust":
@@ -123,10 +102,10 @@ def _detect_package_manager(repo: Path, language: str) -> str:
     return "unknown"
 
 
-def _detect_test_framework(repo: Path, language: str) -> str:
+def _detect_test_framework(snap: RepoSnapshot, language: str) -> str:
     """Detect test framework."""
     if language in ("javascript", "typescript"):
-        pkg = _read_json(repo / "package.json")
+        pkg = snap.json("package.json")
         if pkg:
             dev_deps = pkg.get("devDependencies", {})
             if "vitest" in dev_deps:
@@ -135,10 +114,10 @@ def _detect_test_framework(repo: Path, language: str) -> str:
                 return "jest"
             if "@playwright/test" in dev_deps:
                 return "playwright"
-        if (repo / "vitest.config.ts").exists() or (repo / "vitest.config.js").exists():
+        if snap.exists("vitest.config.ts") or snap.exists("vitest.config.js"):
             return "vitest"
     elif language == "python":
-        pyproject = _read_toml(repo / "pyproject.toml")
+        pyproject = snap.toml("pyproject.toml")
         if pyproject:
             deps = pyproject.get("project", {}).get("dependencies", [])
             optional = pyproject.get("project", {}).get("optional-dependencies", {})
@@ -146,7 +125,7 @@ def _detect_test_framework(repo: Path, language: str) -> str:
             all_deps_str = " ".join(deps + dev_deps).lower()
             if "pytest" in all_deps_str:
                 return "pytest"
-        if (repo / "tests").is_dir() or (repo / "test").is_dir():
+        if snap.is_dir("tests") or snap.is_dir("test"):
             return "pytest"
     elif language == "rust":
         return "cargo-test"
@@ -155,10 +134,10 @@ def _detect_test_framework(repo: Path, language: str) -> str:
     return "none"
 
 
-def _detect_linter(repo: Path, language: str) -> str:
+def _detect_linter(snap: RepoSnapshot, language: str) -> str:
     """Detect linter configuration."""
     if language in ("javascript", "typescript"):
-        if (repo / "biome.json").exists() or (repo / "biome.jsonc").exists():
+        if snap.exists("biome.json") or snap.exists("biome.jsonc"):
             return "biome"
         for eslint in [
             ".eslintrc.json",
@@ -167,10 +146,10 @@ def _detect_linter(repo: Path, language: str) -> str:
             "eslint.config.js",
             "eslint.config.mjs",
         ]:
-            if (repo / eslint).exists():
+            if snap.exists(eslint):
                 return "eslint"
     elif language == "python":
-        pyproject = _read_toml(repo / "pyproject.toml")
+        pyproject = snap.toml("pyproject.toml")
         if pyproject and "tool" in pyproject:
             if "ruff" in pyproject["tool"]:
                 return "ruff"
@@ -178,44 +157,44 @@ def _detect_linter(repo: Path, language: str) -> str:
                 return "pylint"
             if "flake8" in pyproject["tool"]:
                 return "flake8"
-        if (repo / ".ruff.toml").exists() or (repo / "ruff.toml").exists():
+        if snap.exists(".ruff.toml") or snap.exists("ruff.toml"):
             return "ruff"
     elif language == "rust":
         return "clippy"
     return "none"
 
 
-def _detect_formatter(repo: Path, language: str) -> str:
+def _detect_formatter(snap: RepoSnapshot, language: str) -> str:
     """Detect formatter configuration."""
     if language in ("javascript", "typescript"):
-        if (repo / "biome.json").exists() or (repo / "biome.jsonc").exists():
+        if snap.exists("biome.json") or snap.exists("biome.jsonc"):
             return "biome"
-        if (repo / ".prettierrc").exists() or (repo / ".prettierrc.json").exists():
+        if snap.exists(".prettierrc") or snap.exists(".prettierrc.json"):
             return "prettier"
     elif language == "python":
-        pyproject = _read_toml(repo / "pyproject.toml")
+        pyproject = snap.toml("pyproject.toml")
         if pyproject and "tool" in pyproject:
             ruff_cfg = pyproject["tool"].get("ruff", {})
             if "format" in ruff_cfg:
                 return "ruff"
             if "black" in pyproject["tool"]:
                 return "black"
-        if (repo / ".ruff.toml").exists() or (repo / "ruff.toml").exists():
+        if snap.exists(".ruff.toml") or snap.exists("ruff.toml"):
             return "ruff"
     elif language == "rust":
         return "rustfmt"
     return "none"
 
 
-def _detect_ci(repo: Path) -> str:
+def _detect_ci(snap: RepoSnapshot) -> str:
     """Detect CI system."""
-    if (repo / ".github" / "workflows").is_dir():
+    if snap.is_dir(".github/workflows"):
         return "github-actions"
-    if (repo / ".gitlab-ci.yml").exists():
+    if snap.exists(".gitlab-ci.yml"):
         return "gitlab-ci"
-    if (repo / ".circleci").is_dir():
+    if snap.is_dir(".circleci"):
         return "circleci"
-    if (repo / "Jenkinsfile").exists():
+    if snap.exists("Jenkinsfile"):
         return "jenkins"
     return "none"
 
@@ -231,63 +210,37 @@ def _get_git_info(repo: Path) -> dict[str, Any]:
     if not info["is_repo"]:
         return info
 
-    try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info["branch"] = result.stdout.strip() or "HEAD"
-    except (subprocess.SubprocessError, OSError):
-        pass
-
-    try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            info["remote"] = result.stdout.strip()
-    except (subprocess.SubprocessError, OSError):
-        pass
-
-    try:
-        result = subprocess.run(
-            ["git", "rev-list", "--count", "HEAD"],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            info["commit_count"] = int(result.stdout.strip())
-    except (subprocess.SubprocessError, OSError, ValueError):
-        pass
+    meta = collect_git_metadata(repo)
+    if meta is not None:
+        info["branch"] = meta.branch
+        info["remote"] = meta.remote
+        info["commit_count"] = meta.commit_count
 
     return info
 
 
-def analyze_repo(repo_path: Path) -> dict[str, Any]:
-    """Analyze a repository and return structured metadata."""
-    language = _detect_language(repo_path)
+def analyze_repo(
+    repo_path: Path, snapshot: RepoSnapshot | None = None
+) -> dict[str, Any]:
+    """Analyze a repository and return structured metadata.
+
+    ``snapshot`` lets callers share one :class:`RepoSnapshot` with the
+    health scorers; one is built when omitted.
+    """
+    snap = snapshot_for(repo_path, snapshot)
+    language = _detect_language(snap)
     return {
         "language": language,
-        "framework": _detect_framework(repo_path, language),
-        "package_manager": _detect_package_manager(repo_path, language),
-        "test_framework": _detect_test_framework(repo_path, language),
-        "linter": _detect_linter(repo_path, language),
-        "formatter": _detect_formatter(repo_path, language),
-        "ci_system": _detect_ci(repo_path),
-        "has_claude_md": (repo_path / "CLAUDE.md").exists(),
-        "has_blueprint": (repo_path / "docs" / "blueprint").is_dir(),
-        "has_readme": (repo_path / "README.md").exists(),
-        "has_pre_commit": (repo_path / ".pre-commit-config.yaml").exists(),
+        "framework": _detect_framework(snap, language),
+        "package_manager": _detect_package_manager(snap, language),
+        "test_framework": _detect_test_framework(snap, language),
+        "linter": _detect_linter(snap, language),
+        "formatter": _detect_formatter(snap, language),
+        "ci_system": _detect_ci(snap),
+        "has_claude_md": snap.exists("CLAUDE.md"),
+        "has_blueprint": snap.is_dir("docs/blueprint"),
+        "has_readme": snap.exists("README.md"),
+        "has_pre_commit": snap.exists(".pre-commit-config.yaml"),
         "git_info": _get_git_info(repo_path),
     }
 
@@ -0,0 +1,432 @@
+"""RepoSnapshot — one pruned walk of a repository, shared by every detector.
+
+``analyze_repo``, ``profile_stack`` and the ``_score_*`` functions in
+``health_check`` used to probe the filesystem independently: dozens of
+``exists()`` calls, ``pyproject.toml`` and ``.pre-commit-config.yaml``
+read three or four times, every ``.github/workflows/*.yml`` read by
+three different scorers, plus ``rglob`` walks of the whole tree.
+
+A :class:`RepoSnapshot` answers all of those from one place:
+
+* presence checks (``exists``/``is_file``/``is_dir``) are cached per path;
+* file contents are read lazily, at most once each, and parsed JSON/TOML
+  is cached alongside;
+* tree-wide questions are answered by a single :func:`walk_repo`
+  generator that is advanced only as far as needed. ``find_file`` stops
+  at the first match — the "is there any test file?" probe no longer
+  lists the whole tree — while ``files`` runs the walk to completion
+  once and keeps the result.
+
+In a git repository the inventory comes from the index instead: one
+``git ls-files -z --cached --others --exclude-standard`` spawn lists the
+tracked files plus untracked files that are not ignored, honouring every
+``.gitignore`` level, ``.git/info/exclude`` and the global excludes. Build
+output, dependency trees and caches are never listed, so nothing under
+them is read. Outside git (or when git fails) :func:`walk_repo` is the
+fallback. It never descends into build output, caches, virtualenvs or
+``.git`` (:data:`PRUNE_DIRS`), nor into directories the root
+``.gitignore`` ignores. Pruned directories are still reported; their
+contents are not. ``_pre_compute_context`` builds one snapshot and
+passes it to all the detectors and scorers. Callers that pass only a
+path still work: each function builds its own snapshot when none is
+given.
+
+The snapshot is a point-in-time view. Build a new one after the working
+tree changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..hooks.safety import SAFE_RM_DIRS
+
+# Directories the walk reports but never descends into: the build
+# artifact directories ``rm -rf`` is allowed on, plus git's own store.
+PRUNE_DIRS = SAFE_RM_DIRS | {".git"}
+
+# Larger files are treated as empty by text(); configs and workflows are
+# far smaller, and the cap keeps a stray data file from being cached.
+_MAX_TEXT_BYTES = 1024 * 1024
+
+_MISSING = object()
+
+
+def _toml_loads(text: str) -> dict[str, Any] | None:
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib  # type: ignore[no-redef]
+        except ImportError:
+            return None
+    try:
+        return tomllib.loads(text)
+    except Exception:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# .gitignore
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _IgnoreRule:
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _glob_to_regex(pattern: str) -> str:
+    out: list[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            out.append("[^" + body[1:] + "]" if body.startswith("!") else f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+class GitIgnore:
+    """The subset of ``.gitignore`` semantics needed to prune a walk.
+
+    Supports comments, ``!`` negation, trailing-``/`` directory rules,
+    anchored (``/build``, ``a/b``) and unanchored (``*.log``) patterns,
+    and ``*``/``?``/``**``/``[...]`` globs; the last matching rule wins.
+    Only the repository's root ``.gitignore`` is read.
+    """
+
+    def __init__(self, lines: list[str]) -> None:
+        self.rules: list[_IgnoreRule] = []
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            if dir_only:
+                line = line.rstrip("/")
+            # A leading or interior slash anchors; a trailing one does not.
+            anchored = "/" in line
+            body = _glob_to_regex(line.lstrip("/"))
+            regex = f"^{body}$" if anchored else f"^(?:.*/)?{body}$"
+            self.rules.append(_IgnoreRule(re.compile(regex), negate, dir_only))
+
+    def ignored(self, rel: str, is_dir: bool) -> bool:
+        result = False
+        for rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(rel):
+                result = not rule.negate
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Walk
+# ---------------------------------------------------------------------------
+
+
+def walk_repo(
+    root: Path,
+    *,
+    prune: frozenset[str] = PRUNE_DIRS,
+    gitignore: GitIgnore | None = None,
+) -> Iterator[tuple[str, bool, bool]]:
+    """Yield ``(rel_path, is_dir, pruned)`` for the tree under ``root``.
+
+    Depth-first, directory entries sorted by name. Directories named in
+    ``prune`` or ignored by ``gitignore`` are yielded with
+    ``pruned=True`` and not entered. Symlinked directories are not
+    followed. Being a generator, the walk costs only as much as the
+    caller consumes.
+    """
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            with os.scandir(root / rel_dir if rel_dir else root) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs: list[str] = []
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if not is_dir:
+                yield rel, False, False
+                continue
+            pruned = entry.name in prune or (
+                gitignore is not None and gitignore.ignored(rel, True)
+            )
+            yield rel, True, pruned
+            if not pruned:
+                subdirs.append(rel)
+        stack.extend(reversed(subdirs))
+
+
+def git_ls_files(root: Path) -> list[str] | None:
+    """Tracked and untracked-but-not-ignored files under ``root``, sorted.
+
+    Paths are relative to ``root``. Returns None when git is missing or
+    ``root`` is not inside a work tree.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+            check=False,
+            timeout=30,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    names = result.stdout.decode("utf-8", errors="surrogateescape").split("\0")
+    # Unmerged paths are listed once per stage.
+    return sorted(dict.fromkeys(n for n in names if n))
+
+
+def _git_entries(files: list[str]) -> Iterator[tuple[str, bool, bool]]:
+    """``walk_repo``-shaped entries for a file list: parents, then each file."""
+    seen: set[str] = set()
+    for rel in files:
+        parts = rel.split("/")
+        for i in range(1, len(parts)):
+            parent = "/".join(parts[:i])
+            if parent not in seen:
+                seen.add(parent)
+                yield parent, True, False
+        yield rel, False, False
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+
+class RepoSnapshot:
+    """Presence, contents and a lazily built file inventory of ``root``.
+
+    ``use_git=False`` forces the pruned walk even in a git repository.
+    ``inventory_source`` records which one was used (``"git"`` or
+    ``"walk"``) once the inventory has been needed.
+    """
+
+    def __init__(self, root: Path, *, use_git: bool = True) -> None:
+        self.root = root
+        self.use_git = use_git
+        self.inventory_source: str | None = None
+        self._walk: Iterator[tuple[str, bool, bool]] | None = None
+        self._complete = False
+        self._files: list[str] = []
+        self._file_set: set[str] = set()
+        self._dirs: set[str] = set()
+        self._listings: dict[str, list[str]] = {}
+        self._stats: dict[str, tuple[bool, bool]] = {}
+        self._texts: dict[str, str] = {}
+        self._parsed: dict[tuple[str, str], Any] = {}
+
+    @classmethod
+    def scan(cls, root: Path, *, use_git: bool = True) -> RepoSnapshot:
+        """Snapshot of ``root``; the inventory is built on first demand."""
+        return cls(root, use_git=use_git)
+
+    # ------------------------------------------------------------------
+    # Walk
+    # ------------------------------------------------------------------
+
+    def _advance(self) -> Iterator[str]:
+        """Continue the shared walk, yielding each newly seen file."""
+        if self._walk is None:
+            self._walk = self._inventory()
+        for rel, is_dir, _pruned in self._walk:
+            if is_dir:
+                self._dirs.add(rel)
+                continue
+            self._files.append(rel)
+            self._file_set.add(rel)
+            yield rel
+        self._complete = True
+
+    def _inventory(self) -> Iterator[tuple[str, bool, bool]]:
+        files = None
+        if self.use_git and self.exists(".git"):
+            files = git_ls_files(self.root)
+        if files is not None:
+            self.inventory_source = "git"
+            return _git_entries(files)
+        self.inventory_source = "walk"
+        gitignore = GitIgnore(self.text(".gitignore").splitlines())
+        return walk_repo(self.root, gitignore=gitignore)
+
+    def _finish(self) -> None:
+        if not self._complete:
+            for _ in self._advance():
+                pass
+
+    @property
+    def files(self) -> frozenset[str]:
+        """Every file in the inventory (completes the walk, if walking)."""
+        self._finish()
+        return frozenset(self._file_set)
+
+    @property
+    def dirs(self) -> frozenset[str]:
+        """Every directory in the inventory (pruned ones too, when walking)."""
+        self._finish()
+        return frozenset(self._dirs)
+
+    def find_file(self, predicate: Callable[[str], bool]) -> str | None:
+        """First inventory file whose relative path satisfies ``predicate``.
+
+        A walk goes only as far as the first match; files already seen by
+        an earlier call are checked without touching the filesystem.
+        """
+        for rel in self._files:
+            if predicate(rel):
+                return rel
+        if self._complete:
+            return None
+        for rel in self._advance():
+            if predicate(rel):
+                return rel
+        return None
+
+    # ------------------------------------------------------------------
+    # Presence
+    # ------------------------------------------------------------------
+
+    def _stat(self, rel: str) -> tuple[bool, bool]:
+        """``(is_file, is_dir)`` for ``rel``, each path probed once.
+
+        Presence is a ``stat``, not a lookup in the walk, so it does not
+        force the walk and is also correct inside pruned directories.
+        """
+        cached = self._stats.get(rel)
+        if cached is None:
+            path = self.root / rel
+            cached = self._stats[rel] = (path.is_file(), path.is_dir())
+        return cached
+
+    def is_file(self, rel: str) -> bool:
+        return self._stat(rel)[0]
+
+    def is_dir(self, rel: str) -> bool:
+        return self._stat(rel)[1]
+
+    def exists(self, rel: str) -> bool:
+        return any(self._stat(rel))
+
+    def any_exists(self, *rels: str) -> bool:
+        return any(self.exists(rel) for rel in rels)
+
+    def children(self, rel_dir: str, *suffixes: str) -> list[str]:
+        """Files directly inside ``rel_dir`` ending in one of ``suffixes``.
+
+        The non-recursive ``Path(rel_dir).glob("*.yml")``, sorted.
+        """
+        prefix = rel_dir.rstrip("/") + "/"
+        names = self._listing(rel_dir, dirs=False)
+        return [prefix + n for n in names if n.endswith(suffixes)]
+
+    def top_level_dirs(self) -> list[str]:
+        return self._listing("", dirs=True)
+
+    def _listing(self, rel_dir: str, *, dirs: bool) -> list[str]:
+        """Sorted names of the files (or directories) in ``rel_dir``."""
+        key = f"{'d' if dirs else 'f'}:{rel_dir}"
+        cached = self._listings.get(key)
+        if cached is None:
+            try:
+                with os.scandir(self.root / rel_dir) as it:
+                    cached = sorted(
+                        e.name for e in it if (e.is_dir() if dirs else e.is_file())
+                    )
+            except OSError:
+                cached = []
+            self._listings[key] = cached
+        return cached
+
+    # ------------------------------------------------------------------
+    # Contents (read at most once)
+    # ------------------------------------------------------------------
+
+    def text(self, rel: str) -> str:
+        """Contents of ``rel`` as text; ``""`` when missing or unreadable."""
+        cached = self._texts.get(rel)
+        if cached is not None:
+            return cached
+        content = ""
+        if self.is_file(rel):
+            path = self.root / rel
+            try:
+                if path.stat().st_size <= _MAX_TEXT_BYTES:
+                    content = path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                pass
+        self._texts[rel] = content
+        return content
+
+    def json(self, rel: str) -> dict[str, Any] | None:
+        """``rel`` parsed as a JSON object, or None."""
+        return self._parse(rel, "json")
+
+    def toml(self, rel: str) -> dict[str, Any] | None:
+        """``rel`` parsed as TOML, or None."""
+        return self._parse(rel, "toml")
+
+    def _parse(self, rel: str, kind: str) -> dict[str, Any] | None:
+        key = (rel, kind)
+        cached = self._parsed.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        result: dict[str, Any] | None = None
+        text = self.text(rel)
+        if text:
+            if kind == "json":
+                try:
+                    loaded = json.loads(text)
+                except ValueError:
+                    loaded = None
+                result = loaded if isinstance(loaded, dict) else None
+            else:
+                result = _toml_loads(text)
+        self._parsed[key] = result
+        return result
+
+
+def snapshot_for(repo: Path, snapshot: RepoSnapshot | None) -> RepoSnapshot:
+    """``snapshot`` if given, else a fresh one for ``repo``."""
+    return snapshot if snapshot is not None else RepoSnapshot.scan(repo)
@@ -11,11 +11,13 @@ Issue #1359.
 
 from __future__ import annotations
 
-import itertools
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .loc_counter import count_loc
+from .repo_snapshot import RepoSnapshot, snapshot_for
+
 
 # Patterns that indicate the file is a "trivial" Python loader/stub.
 # ComfyUI custom-node packs ship a few-line ``__init__.py`` whose only
@@ -71,21 +73,15 @@ class StackProfile:
     is_comfyui_pack: bool = False
     is_python_incidental: bool = False  # < ~50 LOC of Python outside tests
     python_loc_outside_tests: int = 0
+    # Non-blank LOC per language, largest first: (("TypeScript", 1200), ...)
+    loc_by_language: tuple[tuple[str, int], ...] = field(default_factory=tuple)
 
 
-def _read_text(path: Path) -> str:
-    """Read a file as text, returning '' on any failure."""
-    try:
-        return path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return ""
-
-
-def _detect_js_stack(repo: Path) -> dict[str, bool]:
+def _detect_js_stack(snap: RepoSnapshot) -> dict[str, bool]:
     """Detect installed JS/TS tooling configs at the repo root."""
-    has_biome = (repo / "biome.json").exists() or (repo / "biome.jsonc").exists()
+    has_biome = snap.exists("biome.json") or snap.exists("biome.jsonc")
     has_eslint = any(
-        (repo / name).exists()
+        snap.exists(name)
         for name in (
             ".eslintrc",
             ".eslintrc.json",
@@ -97,7 +93,7 @@ def _detect_js_stack(repo: Path) -> dict[str, bool]:
         )
     )
     has_prettier = any(
-        (repo / name).exists()
+        snap.exists(name)
         for name in (
             ".prettierrc",
             ".prettierrc.json",
@@ -108,7 +104,7 @@ def _detect_js_stack(repo: Path) -> dict[str, bool]:
             "prettier.config.cjs",
         )
     )
-    has_tsconfig = (repo / "tsconfig.json").exists()
+    has_tsconfig = snap.exists("tsconfig.json")
     return {
         "has_biome": has_biome,
         "has_eslint": has_eslint,
@@ -117,22 +113,22 @@ def _detect_js_stack(repo: Path) -> dict[str, bool]:
     }
 
 
-def _detect_python_stack(repo: Path) -> dict[str, object]:
+def _detect_python_stack(snap: RepoSnapshot) -> dict[str, object]:
     """Detect installed Python tooling — ruff/mypy/pyright/ty/uv."""
-    pyproject_text = _read_text(repo / "pyproject.toml")
-    precommit_text = _read_text(repo / ".pre-commit-config.yaml")
-    setupcfg_text = _read_text(repo / "setup.cfg")
+    pyproject_text = snap.text("pyproject.toml")
+    precommit_text = snap.text(".pre-commit-config.yaml")
+    setupcfg_text = snap.text("setup.cfg")
 
     has_ruff_lint = (
         "[tool.ruff" in pyproject_text
-        or (repo / "ruff.toml").exists()
-        or (repo / ".ruff.toml").exists()
+        or snap.exists("ruff.toml")
+        or snap.exists(".ruff.toml")
     )
     has_ruff_format = "[tool.ruff.format]" in pyproject_text or has_ruff_lint
     # ruff's `format` subcommand works without a [tool.ruff.format] table
     # — having ruff configured is enough to count as a formatter.
 
-    uses_uv = (repo / "uv.lock").exists() or "uv_build" in pyproject_text
+    uses_uv = snap.exists("uv.lock") or "uv_build" in pyproject_text
 
     # Type checker (the first found wins; the ordering reflects 2026
     # ecosystem reality: a uv+ruff project is most likely to add ty,
@@ -140,14 +136,14 @@ def _detect_python_stack(repo: Path) -> dict[str, object]:
     type_checker_kind = ""
     if "[tool.ty" in pyproject_text:
         type_checker_kind = "ty"
-    elif "[tool.basedpyright" in pyproject_text or (repo / "basedpyright").exists():
+    elif "[tool.basedpyright" in pyproject_text or snap.exists("basedpyright"):
         type_checker_kind = "basedpyright"
-    elif "[tool.pyright" in pyproject_text or (repo / "pyrightconfig.json").exists():
+    elif "[tool.pyright" in pyproject_text or snap.exists("pyrightconfig.json"):
         type_checker_kind = "pyright"
     elif (
         "[tool.mypy" in pyproject_text
-        or (repo / "mypy.ini").exists()
-        or (repo / ".mypy.ini").exists()
+        or snap.exists("mypy.ini")
+        or snap.exists(".mypy.ini")
         or "[mypy" in setupcfg_text
     ):
         type_checker_kind = "mypy"
@@ -169,10 +165,9 @@ def _detect_python_stack(repo: Path) -> dict[str, object]:
     }
 
 
-def _detect_ci_security(repo: Path) -> dict[str, object]:
+def _detect_ci_security(snap: RepoSnapshot) -> dict[str, object]:
     """Scan ``.github/workflows/*.yml`` for known security tools."""
-    workflows = repo / ".github" / "workflows"
-    if not workflows.is_dir():
+    if not snap.is_dir(".github/workflows"):
         return {"ci_has_security_scanning": False, "ci_security_tools": ()}
 
     tools: set[str] = set()
@@ -191,8 +186,8 @@ def _detect_ci_security(repo: Path) -> dict[str, object]:
         "dependency-review": ("dependency-review",),
         "osv-scanner": ("osv-scanner",),
     }
-    for wf in itertools.chain(workflows.glob("*.yml"), workflows.glob("*.yaml")):
-        content = _read_text(wf).lower()
+    for wf in snap.children(".github/workflows", ".yml", ".yaml"):
+        content = snap.text(wf).lower()
         if not content:
             continue
         for name, patterns in detectors.items():
@@ -207,65 +202,44 @@ def _detect_ci_security(repo: Path) -> dict[str, object]:
     }
 
 
-def _count_python_loc_outside_tests(repo: Path) -> int:
-    """Return total non-test Python LOC. Skips ``.venv`` and test paths."""
-    skip_dir_names = {".venv", "venv", "node_modules", "tests", "test", "__pycache__"}
-    total = 0
-    for py in repo.rglob("*.py"):
-        if not py.is_file():
-            continue
-        parts = py.relative_to(repo).parts
-        if any(part in skip_dir_names for part in parts[:-1]):
-            continue
-        if py.name.startswith("test_") or py.name.endswith("_test.py"):
-            continue
-        try:
-            with open(py, "r", encoding="utf-8", errors="replace") as f:
-                total += sum(1 for line in f if line.strip())
-        except OSError:
-            continue
-        if total >= _PYTHON_INCIDENTAL_LOC_THRESHOLD * 10:
-            # Bail early — we only care about the < 50 boundary.
-            return total
-    return total
-
-
-def _detect_project_shape(repo: Path) -> dict[str, object]:
-    """Detect ComfyUI-pack pattern and Python-incidental projects."""
-    init_py = repo / "__init__.py"
-    is_comfyui_pack = bool(
-        init_py.exists() and _COMFYUI_PACK_MARKERS.search(_read_text(init_py))
-    )
+def _detect_project_shape(snap: RepoSnapshot) -> dict[str, object]:
+    """Detect ComfyUI-pack pattern, Python-incidental projects and LOC."""
+    is_comfyui_pack = bool(_COMFYUI_PACK_MARKERS.search(snap.text("__init__.py")))
 
     # Also scan the top-level package dir for the marker (some packs
     # put __init__.py inside the slug-named directory).
     if not is_comfyui_pack:
-        for sub in repo.iterdir():
-            if sub.is_dir() and not sub.name.startswith("."):
-                child_init = sub / "__init__.py"
-                if child_init.exists() and _COMFYUI_PACK_MARKERS.search(
-                    _read_text(child_init)
-                ):
-                    is_comfyui_pack = True
-                    break
-
-    loc = _count_python_loc_outside_tests(repo)
+        for sub in snap.top_level_dirs():
+            if not sub.startswith(".") and _COMFYUI_PACK_MARKERS.search(
+                snap.text(f"{sub}/__init__.py")
+            ):
+                is_comfyui_pack = True
+                break
+
+    loc = count_loc(snap)
     return {
         "is_comfyui_pack": is_comfyui_pack,
-        "is_python_incidental": loc < _PYTHON_INCIDENTAL_LOC_THRESHOLD,
-        "python_loc_outside_tests": loc,
+        "is_python_incidental": (
+            loc.python_outside_tests < _PYTHON_INCIDENTAL_LOC_THRESHOLD
+        ),
+        "python_loc_outside_tests": loc.python_outside_tests,
+        "loc_by_language": tuple(loc.by_language.items()),
     }
 
 
-def profile_stack(repo_path: Path) -> StackProfile:
+def profile_stack(
+    repo_path: Path, snapshot: RepoSnapshot | None = None
+) -> StackProfile:
     """Compute a :class:`StackProfile` for ``repo_path``.
 
     Safe to call on any directory — returns a profile with all-False
-    fields when no tooling is detected.
+    fields when no tooling is detected. Pass ``snapshot`` to reuse a
+    :class:`RepoSnapshot` built by the caller.
     """
+    snap = snapshot_for(repo_path, snapshot)
     fields: dict[str, object] = {}
-    fields.update(_detect_js_stack(repo_path))
-    fields.update(_detect_python_stack(repo_path))
-    fields.update(_detect_ci_security(repo_path))
-    fields.update(_detect_project_shape(repo_path))
+    fields.update(_detect_js_stack(snap))
+    fields.update(_detect_python_stack(snap))
+    fields.update(_detect_ci_security(snap))
+    fields.update(_detect_project_shape(snap))
     return StackProfile(**fields)  # type: ignore[arg-type]
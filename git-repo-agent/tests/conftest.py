@@ -0,0 +1,15 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _no_prompt_cache(monkeypatch) -> None:
+    """Keep compiled prompts out of the user's real on-disk cache.
+
+    Tests that exercise the cache point ``CLAUDE_PLUGINS_PROMPT_CACHE`` at
+    their own ``tmp_path``.
+    """
+    monkeypatch.setenv("CLAUDE_PLUGINS_PROMPT_CACHE", "off")
@@ -0,0 +1,72 @@
+"""Tests for AnalysisContext — static analysis computed once per run."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from git_repo_agent import orchestrator
+from git_repo_agent.tools import analysis_context, attributes
+from git_repo_agent.tools.analysis_context import AnalysisContext
+from git_repo_agent.tools.attributes import collect_attributes
+from git_repo_agent.tools.health_check import compute_health_score
+
+
+def _write(path: Path, content: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def health_calls(monkeypatch) -> list[Path]:
+    """Count compute_health_score runs; fail if attributes recomputes it."""
+    calls: list[Path] = []
+
+    def counting(repo_path, snapshot=None):
+        calls.append(repo_path)
+        return compute_health_score(repo_path, snapshot=snapshot)
+
+    def forbidden(*_args, **_kwargs):
+        raise AssertionError("collect_attributes recomputed the health score")
+
+    monkeypatch.setattr(analysis_context, "compute_health_score", counting)
+    monkeypatch.setattr(attributes, "compute_health_score", forbidden)
+    return calls
+
+
+class TestCollectAttributesReuse:
+    def test_precomputed_health_is_used(self, tmp_path: Path, health_calls):
+        health = compute_health_score(tmp_path)
+        data = collect_attributes(tmp_path, health=health)
+        assert data["scores"]["overall"] == health["overall_score"]
+        assert any(a["id"] == "missing-readme" for a in data["attributes"])
+
+    def test_context_health_is_used(self, tmp_path: Path, health_calls):
+        context = AnalysisContext(tmp_path)
+        data = collect_attributes(tmp_path, context=context)
+        assert data["scores"]["overall"] == context.health["overall_score"]
+        assert len(health_calls) == 1
+
+    def test_matches_standalone_result(self, tmp_path: Path):
+        _write(tmp_path / "README.md", "# x\n")
+        standalone = collect_attributes(tmp_path)
+        shared = AnalysisContext(tmp_path).attributes
+        assert shared["attributes"] == standalone["attributes"]
+        assert shared["scores"] == standalone["scores"]
+
+
+class TestAnalysisContext:
+    def test_views_are_memoized(self, tmp_path: Path, health_calls):
+        context = AnalysisContext(tmp_path)
+        assert context.health is context.health
+        assert context.attributes is context.attributes
+        assert context.analysis is context.analysis
+        assert len(health_calls) == 1
+
+    def test_pre_compute_context_scores_health_once(self, tmp_path: Path, health_calls):
+        _write(tmp_path / "pyproject.toml", "[tool.ruff]\n")
+        text = orchestrator._pre_compute_context(tmp_path)
+        assert "### health_score result" in text
+        assert "### codebase_attributes result" in text
+        assert health_calls == [tmp_path]
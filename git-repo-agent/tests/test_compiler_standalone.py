@@ -114,3 +114,32 @@ class TestMonorepoTakesPrecedence:
         if any(compiler._plugin_skill_available(p) for p in skill_paths):
             assert live == compiler.compile_subagent("configure", skill_paths)
         compiler.get_compiled_prompt.cache_clear()
+
+
+class TestPromptCache:
+    """Compiled skills persist on disk, keyed by compiler + source content."""
+
+    @pytest.fixture
+    def skill(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CLAUDE_PLUGINS_PROMPT_CACHE", str(tmp_path / "cache"))
+        monkeypatch.setattr(compiler, "_PLUGINS_ROOT", tmp_path)
+        path = tmp_path / "demo-plugin" / "skills" / "demo" / "SKILL.md"
+        path.parent.mkdir(parents=True)
+        path.write_text("## Core Expertise\nfirst\n\nSee [ref](REFERENCE.md)\n")
+        return path
+
+    def test_second_compile_is_served_from_disk(self, skill, monkeypatch):
+        first = compiler._compile_skill_cached(skill)
+        assert "first" in first
+
+        def _boom(_path):
+            raise AssertionError("recompiled despite a cache hit")
+
+        monkeypatch.setattr(compiler, "compile_skill", _boom)
+        assert compiler._compile_skill_cached(skill) == first
+
+    def test_reference_md_edit_invalidates(self, skill):
+        (skill.parent / "REFERENCE.md").write_text("old reference\n")
+        assert "old reference" in compiler._compile_skill_cached(skill)
+        (skill.parent / "REFERENCE.md").write_text("new reference\n")
+        assert "new reference" in compiler._compile_skill_cached(skill)
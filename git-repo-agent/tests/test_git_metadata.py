@@ -0,0 +1,308 @@
+"""Tests for the batched git metadata collector."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from git_repo_agent.blueprint_driver import sniff_project_size
+from git_repo_agent.orchestrator import _build_pr_content
+from git_repo_agent.tools import git_metadata
+from git_repo_agent.tools.git_metadata import (
+    CommitTypeIndex,
+    collect_git_metadata,
+    commit_type,
+    load_commit_index,
+    update_commit_index,
+)
+from git_repo_agent.tools.health_check import _score_ci, compute_health_score
+from git_repo_agent.tools.repo_analyzer import _get_git_info
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _init_repo(repo: Path) -> None:
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+
+
+def _commit(repo: Path, message: str, date: str | None = None) -> None:
+    args = ["commit", "-q", "--allow-empty", "-m", message]
+    if date is not None:
+        args += ["--date", date]
+    _git(repo, *args)
+
+
+def _count_log_reads(monkeypatch) -> list[str]:
+    """Record the revision range of every history read."""
+    reads: list[str] = []
+    original = git_metadata._read_log
+
+    def counting(git_dir, revs):
+        reads.append(revs)
+        return original(git_dir, revs)
+
+    monkeypatch.setattr(git_metadata, "_read_log", counting)
+    return reads
+
+
+class TestCommitType:
+    @pytest.mark.parametrize(
+        ("subject", "expected"),
+        [
+            ("feat: add x", "feat"),
+            ("fix(parser): handle y", "fix"),
+            ("feat(api)!: drop v1", "feat"),
+            ("Chore: bump", "chore"),
+            ("feature: not conventional", "feature"),
+            ("Merge branch 'main'", None),
+            ("fixed the thing", None),
+            ("", None),
+        ],
+    )
+    def test_parses_subject(self, subject: str, expected: str | None):
+        assert commit_type(subject) == expected
+
+
+class TestCollectGitMetadata:
+    def test_none_outside_git(self, tmp_path: Path):
+        assert collect_git_metadata(tmp_path) is None
+
+    def test_unborn_branch(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        meta = collect_git_metadata(tmp_path)
+        assert meta is not None
+        assert meta.head is None
+        assert meta.branch == "main"
+        assert meta.commit_count == 0
+
+    def test_branch_remotes_and_counts(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        for message in ("feat: a", "fix: b", "fix(x): c", "docs: d", "wip"):
+            _commit(tmp_path, message)
+        _git(tmp_path, "remote", "add", "origin", "https://example.com/r.git")
+        _git(tmp_path, "remote", "add", "upstream", "git@example.com:u/r.git")
+        meta = collect_git_metadata(tmp_path)
+        assert meta is not None
+        assert meta.branch == "main"
+        assert meta.remote == "https://example.com/r.git"
+        assert meta.remotes["upstream"] == "git@example.com:u/r.git"
+        assert meta.commit_count == 5
+        assert meta.commit_types == {"feat": 1, "fix": 2, "docs": 1}
+
+    def test_detached_head(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "feat: a")
+        _git(tmp_path, "checkout", "-q", "--detach")
+        meta = collect_git_metadata(tmp_path)
+        assert meta is not None
+        assert meta.branch == "HEAD"
+        assert meta.remote == "none"
+
+    def test_history_walked_once_per_head(self, tmp_path: Path, monkeypatch):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "feat: a")
+        walks = _count_log_reads(monkeypatch)
+        assert _get_git_info(tmp_path)["commit_count"] == 1
+        assert sniff_project_size(tmp_path).feat_commits == 1
+        assert len(walks) == 1
+        _commit(tmp_path, "fix: b")
+        assert sniff_project_size(tmp_path).fix_commits == 1
+        assert len(walks) == 2
+
+
+class TestCommitTypeIndex:
+    @staticmethod
+    def _head(repo: Path) -> str:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+    def test_counts_per_month(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "feat: a", "2024-01-10T12:00:00")
+        _commit(tmp_path, "fix: b", "2024-01-20T12:00:00")
+        _commit(tmp_path, "update stuff", "2024-03-05T12:00:00")
+        index = update_commit_index(tmp_path / ".git", self._head(tmp_path))
+        assert index is not None
+        assert index.months == {
+            "2024-01": {"*": 2, "feat": 1, "fix": 1},
+            "2024-03": {"*": 1},
+        }
+        assert index.commit_count == 3
+        assert index.type_counts(months=1) == {}
+        assert index.typed_share(months=1) == 0.0
+        assert index.typed_share() == pytest.approx(2 / 3)
+
+    def test_persisted_under_git_dir(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "feat: a")
+        head = self._head(tmp_path)
+        collect_git_metadata(tmp_path)
+        assert (tmp_path / ".git" / "git-repo-agent" / "commit-types.json").is_file()
+        stored = load_commit_index(tmp_path / ".git")
+        assert stored is not None
+        assert stored.head == head
+        assert stored.commit_count == 1
+
+    def test_linked_worktree_uses_main_git_dir(self, tmp_path: Path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _init_repo(repo)
+        _commit(repo, "feat: a")
+        worktree = tmp_path / "wt"
+        _git(repo, "worktree", "add", "-q", "-b", "side", str(worktree))
+        _commit(worktree, "fix: b")
+
+        meta = collect_git_metadata(worktree)
+        assert meta is not None
+        assert meta.git_dir == (repo / ".git").resolve()
+        assert meta.branch == "side"
+        assert meta.commit_count == 2
+
+        _git(repo, "worktree", "remove", str(worktree))
+        stored = load_commit_index(repo / ".git")
+        assert stored is not None
+        assert stored.commit_count == 2
+
+    def test_incremental_from_last_indexed_sha(self, tmp_path: Path, monkeypatch):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "feat: a")
+        git_dir = tmp_path / ".git"
+        first = self._head(tmp_path)
+        update_commit_index(git_dir, first)
+        _commit(tmp_path, "fix: b")
+        _commit(tmp_path, "fix: c")
+        second = self._head(tmp_path)
+        reads = _count_log_reads(monkeypatch)
+        index = update_commit_index(git_dir, second)
+        assert reads == [f"{first}..{second}"]
+        assert index is not None
+        assert index.commit_count == 3
+        assert index.type_counts() == {"feat": 1, "fix": 2}
+        # Up to date: no history read at all.
+        update_commit_index(git_dir, second)
+        assert len(reads) == 1
+
+    def test_rewritten_history_is_reindexed(self, tmp_path: Path, monkeypatch):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "feat: a")
+        _commit(tmp_path, "fix: b")
+        git_dir = tmp_path / ".git"
+        update_commit_index(git_dir, self._head(tmp_path))
+        _git(tmp_path, "reset", "-q", "--hard", "HEAD~1")
+        _commit(tmp_path, "docs: c")
+        head = self._head(tmp_path)
+        reads = _count_log_reads(monkeypatch)
+        index = update_commit_index(git_dir, head)
+        assert reads == [head]
+        assert index is not None
+        assert index.type_counts() == {"feat": 1, "docs": 1}
+
+    def test_corrupt_index_is_rebuilt(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "feat: a")
+        path = tmp_path / ".git" / "git-repo-agent" / "commit-types.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json", encoding="utf-8")
+        index = update_commit_index(tmp_path / ".git", self._head(tmp_path))
+        assert index is not None
+        assert index.commit_count == 1
+
+    def test_empty_index_has_no_share(self):
+        assert CommitTypeIndex().typed_share() is None
+
+
+class TestSharedConsumers:
+    def test_git_info_shape(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "chore: init")
+        info = _get_git_info(tmp_path)
+        assert info == {
+            "is_repo": True,
+            "branch": "main",
+            "remote": "none",
+            "commit_count": 1,
+        }
+
+    def test_project_size_counts_conventional_types_only(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "feature: looks like feat but is not")
+        _commit(tmp_path, "fixup typo")
+        size = sniff_project_size(tmp_path)
+        assert size.total_commits == 2
+        assert size.feat_commits == 0
+        assert size.fix_commits == 0
+
+    def test_project_size_unknown_on_unborn_branch(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        assert not sniff_project_size(tmp_path).is_known
+
+    def test_health_score_reports_commit_history(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "feat: a", "2024-05-01T12:00:00")
+        _commit(tmp_path, "tweak", "2024-06-01T12:00:00")
+        history = compute_health_score(tmp_path)["commit_history"]
+        assert history == {
+            "commits": 2,
+            "types": {"feat": 1},
+            "recent_conventional_share": 0.5,
+            "last_active_month": "2024-06",
+        }
+        # A subdirectory is not a repository root.
+        (tmp_path / "sub").mkdir()
+        assert compute_health_score(tmp_path / "sub")["commit_history"] is None
+
+    def test_release_please_flags_untyped_history(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        workflow = tmp_path / ".github" / "workflows" / "release.yml"
+        workflow.parent.mkdir(parents=True)
+        workflow.write_text("uses: googleapis/release-please-action@v4\n")
+        for message in ("update", "more updates", "feat: a"):
+            _commit(tmp_path, message)
+        _, findings = _score_ci(tmp_path)
+        assert any("33% of recent commits" in f for f in findings)
+        _commit(tmp_path, "fix: b")
+        _commit(tmp_path, "fix: c")
+        _, findings = _score_ci(tmp_path)
+        assert not any("release-please" in f for f in findings)
+
+    def test_merge_commits_do_not_dilute_typed_share(self, tmp_path: Path):
+        _init_repo(tmp_path)
+        _commit(tmp_path, "chore: init")
+        for i in range(3):
+            _git(tmp_path, "checkout", "-q", "-b", f"topic{i}")
+            _commit(tmp_path, f"fix: change {i}")
+            _git(tmp_path, "checkout", "-q", "main")
+            _git(tmp_path, "merge", "-q", "--no-ff", "-m", f"Merge #{i}", f"topic{i}")
+            _git(tmp_path, "branch", "-q", "-D", f"topic{i}")
+        meta = collect_git_metadata(tmp_path)
+        assert meta is not None
+        assert meta.commit_count == 7  # same as rev-list --count
+        assert meta.commit_types == {"chore": 1, "fix": 3}
+        assert meta.history.typed_share() == 1.0
+        title, _ = _build_pr_content(
+            "maintain", "## Maintenance Report\n### Fixed\n- Add badge\n", tmp_path
+        )
+        assert title == "chore: add badge"
+
+    def test_pr_title_follows_repo_style(self, tmp_path: Path):
+        output = "## Maintenance Report\n### Fixed\n- Add README badge\n"
+        _init_repo(tmp_path)
+        _commit(tmp_path, "Initial import")
+        _commit(tmp_path, "Tidy up")
+        title, _ = _build_pr_content("maintain", output, tmp_path)
+        assert title == "Add README badge"
+        _commit(tmp_path, "chore: a")
+        _commit(tmp_path, "chore: b")
+        title, _ = _build_pr_content("maintain", output, tmp_path)
+        assert title == "chore: add README badge"
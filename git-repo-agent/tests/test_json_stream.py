@@ -0,0 +1,84 @@
+"""Tests for the incremental JSON reader."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from git_repo_agent.tools.json_stream import ITEMS, JsonStream
+
+_DOC = {
+    "apiVersion": "v1",
+    "items": [
+        {"name": "a", "n": 12345, "ratio": -1.5e-3},
+        {"name": "b", "tags": ["x", "y"], "nested": {"items": [1]}},
+        'text with "quotes" and ] brackets',
+        None,
+        True,
+    ],
+    "metadata": {"resourceVersion": "42"},
+}
+
+
+def _feed(text: str, handlers, chunk: int) -> JsonStream:
+    stream = JsonStream(handlers)
+    for i in range(0, len(text), chunk):
+        stream.feed(text[i : i + chunk])
+    stream.close()
+    return stream
+
+
+class TestJsonStream:
+    @pytest.mark.parametrize("chunk", [1, 2, 7, 1 << 16])
+    @pytest.mark.parametrize("indent", [None, 4])
+    def test_items_match_json_loads(self, chunk: int, indent: int | None):
+        items: list = []
+        stream = _feed(
+            json.dumps(_DOC, indent=indent), {("items", ITEMS): items.append}, chunk
+        )
+        assert stream.done
+        assert items == _DOC["items"]
+
+    def test_nested_paths_and_top_level_array(self):
+        seen: dict = {}
+        text = json.dumps(
+            {
+                "metadata": {"name": "api", "labels": {"a": "b"}},
+                "spec": {"huge": ["x"] * 100},
+                "status": {"health": {"status": "Degraded"}, "resources": [1, 2]},
+            }
+        )
+        _feed(
+            text,
+            {
+                ("metadata", "name"): lambda v: seen.setdefault("name", v),
+                ("status", "health"): lambda v: seen.setdefault("health", v),
+                ("status", "resources", ITEMS): seen.setdefault("res", []).append,
+            },
+            chunk=5,
+        )
+        assert seen == {"name": "api", "health": {"status": "Degraded"}, "res": [1, 2]}
+        entries: list = []
+        _feed("[10, 20]", {(ITEMS,): entries.append}, chunk=1)
+        assert entries == [10, 20]
+
+    def test_unexpected_shape_is_skipped(self):
+        items: list = []
+        _feed('{"items": null, "x": [1]}', {("items", ITEMS): items.append}, 3)
+        assert items == []
+
+    def test_items_before_an_error_are_kept(self):
+        items: list = []
+        stream = JsonStream({("items", ITEMS): items.append})
+        stream.feed('{"items": [{"a": 1}, {"b": 2}, {"c"')
+        with pytest.raises(ValueError):
+            stream.close()
+        assert items == [{"a": 1}, {"b": 2}]
+
+    @pytest.mark.parametrize(
+        "text", ["", "{", '{"items": [1 2]}', '{"items": []} extra', "[1,]"]
+    )
+    def test_invalid_json_raises(self, text: str):
+        with pytest.raises(ValueError):
+            _feed(text, {("items", ITEMS): lambda v: None}, chunk=1)
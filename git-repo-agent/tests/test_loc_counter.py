@@ -0,0 +1,128 @@
+"""Tests for the language-aware LOC counter and its per-tree cache."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from git_repo_agent.tools import loc_counter
+from git_repo_agent.tools.loc_counter import (
+    count_lines,
+    count_loc,
+    is_python_test_path,
+    language_of,
+)
+from git_repo_agent.tools.repo_snapshot import RepoSnapshot
+from git_repo_agent.tools.stack_profile import profile_stack
+
+
+def _write(path: Path, content: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _sample(root: Path) -> Path:
+    _write(root / "src" / "app.py", "import os\n\n\ndef main():\n    pass\n")
+    _write(root / "tests" / "test_app.py", "def test():\n    pass\n")
+    _write(root / "web" / "index.ts", "export {};\n  \t\nconst x = 1;")
+    _write(root / "README.md", "# not code\n")
+    return root
+
+
+def _commit_all(root: Path) -> None:
+    git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+    subprocess.run([*git, "init", "-q"], cwd=root, check=True)
+    subprocess.run([*git, "add", "-A"], cwd=root, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], cwd=root, check=True)
+
+
+class TestCounting:
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            (b"", 0),
+            (b"\n\n", 0),
+            (b"a\nb\n", 2),
+            (b"a\n \t\r\n\nb", 2),
+            (b"a\r\nb\r\n\r\n", 2),
+            (b"  x  ", 1),
+        ],
+    )
+    def test_count_lines_skips_blank(self, data: bytes, expected: int):
+        assert count_lines(data) == expected
+
+    def test_language_of(self):
+        assert language_of("src/a.py") == "Python"
+        assert language_of("web/App.TSX") == "TypeScript"
+        assert language_of("README.md") is None
+        assert language_of(".bashrc") is None
+        assert language_of("Makefile") is None
+
+    def test_python_test_paths(self):
+        assert is_python_test_path("tests/conftest.py")
+        assert is_python_test_path("pkg/test_x.py")
+        assert is_python_test_path("pkg/x_test.py")
+        assert is_python_test_path(".venv/lib/site.py")
+        assert not is_python_test_path("src/testing_utils.py")
+
+    def test_counts_per_language(self, tmp_path: Path):
+        loc = count_loc(RepoSnapshot.scan(_sample(tmp_path)))
+        assert loc.by_language == {"Python": 5, "TypeScript": 2}
+        assert loc.python_outside_tests == 3
+        assert loc.total == 7
+
+    def test_stack_profile_exposes_loc(self, tmp_path: Path):
+        profile = profile_stack(_sample(tmp_path))
+        assert profile.python_loc_outside_tests == 3
+        assert dict(profile.loc_by_language) == {"Python": 5, "TypeScript": 2}
+
+
+class TestTreeCache:
+    def test_clean_tree_is_served_from_cache(self, tmp_path: Path, monkeypatch):
+        repo = _sample(tmp_path)
+        _commit_all(repo)
+        first = count_loc(RepoSnapshot.scan(repo))
+        assert (repo / ".git" / "git-repo-agent" / "loc.json").is_file()
+
+        def forbidden(_snap):
+            raise AssertionError("counted a tree that is in the cache")
+
+        monkeypatch.setattr(loc_counter, "_count", forbidden)
+        assert count_loc(RepoSnapshot.scan(repo)) == first
+
+    def test_dirty_tree_is_recounted(self, tmp_path: Path):
+        repo = _sample(tmp_path)
+        _commit_all(repo)
+        count_loc(RepoSnapshot.scan(repo))
+        _write(repo / "src" / "extra.py", "a = 1\nb = 2\n")
+        loc = count_loc(RepoSnapshot.scan(repo))
+        assert loc.python_outside_tests == 5
+
+    def test_new_commit_misses_cache(self, tmp_path: Path):
+        repo = _sample(tmp_path)
+        _commit_all(repo)
+        count_loc(RepoSnapshot.scan(repo))
+        _write(repo / "src" / "extra.py", "a = 1\n")
+        _commit_all(repo)
+        assert count_loc(RepoSnapshot.scan(repo)).python_outside_tests == 4
+
+    def test_linked_worktree_caches_in_main_git_dir(self, tmp_path: Path):
+        repo = _sample(tmp_path / "repo")
+        _commit_all(repo)
+        worktree = tmp_path / "wt"
+        subprocess.run(
+            ["git", "worktree", "add", "-q", "--detach", str(worktree)],
+            cwd=repo,
+            check=True,
+        )
+        count_loc(RepoSnapshot.scan(worktree))
+        assert (repo / ".git" / "git-repo-agent" / "loc.json").is_file()
+        assert not (repo / ".git" / "worktrees" / "wt" / "git-repo-agent").exists()
+
+    def test_use_cache_false_skips_git(self, tmp_path: Path):
+        repo = _sample(tmp_path)
+        _commit_all(repo)
+        count_loc(RepoSnapshot.scan(repo), use_cache=False)
+        assert not (repo / ".git" / "git-repo-agent").exists()
@@ -141,6 +141,16 @@ class TestBuildPrTitle:
         title = _build_pr_title("maintain", ["a", "b", "c"])
         assert title == "chore: apply 3 automated maintain fixes"
 
+    def test_non_conventional_repo_drops_prefix(self):
+        assert (
+            _build_pr_title("maintain", ["Add install section"], conventional=False)
+            == "Add install section"
+        )
+        assert (
+            _build_pr_title("onboard", [], conventional=False)
+            == "Automated onboard run"
+        )
+
 
 class TestBuildPrContent:
     def test_descriptive_title_from_fixed_items(self):
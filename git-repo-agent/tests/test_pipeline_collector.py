@@ -0,0 +1,397 @@
+"""Tests for the concurrent pipeline diagnostics collector.
+
+Each CLI (``kubectl``, ``argocd``, ``gh``) is a stub shell script on a
+private ``PATH`` that prints canned JSON, optionally sleeps, and logs
+each call to ``bin/calls.log``. That ``PATH`` holds nothing else but
+links to ``sh``, ``sleep`` and ``git``, so a real CLI is never reached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from git_repo_agent.tools import pipeline_cache, pipeline_collector
+from git_repo_agent.tools.pipeline_collector import collect_pipeline_diagnostics
+
+_PODS = {
+    "items": [
+        {
+            "metadata": {"name": "api-1", "namespace": "prod"},
+            "status": {
+                "phase": "Running",
+                "containerStatuses": [{"restartCount": 3, "ready": False}],
+                "conditions": [{"type": "Ready", "status": "False"}],
+            },
+        }
+    ]
+}
+_EVENTS = {
+    "items": [
+        {
+            "type": "Warning",
+            "reason": "BackOff",
+            "message": "Back-off restarting failed container",
+            "involvedObject": {"name": "api-1"},
+        }
+    ]
+}
+_APP = {
+    "metadata": {"name": "api"},
+    "status": {"sync": {"status": "OutOfSync"}, "health": {"status": "Degraded"}},
+}
+_RUNS = [
+    {"databaseId": 11, "conclusion": "failure", "name": "CI", "url": "u11"},
+    {"databaseId": 12, "conclusion": "success", "name": "CI", "url": "u12"},
+]
+_JOBS = {
+    "jobs": [
+        {
+            "name": "test",
+            "conclusion": "failure",
+            "steps": [{"name": "pytest", "conclusion": "failure"}],
+        }
+    ]
+}
+
+
+def _stub(bin_dir: Path, name: str, cases: dict[str, object], delay: float) -> None:
+    """Write a stub CLI answering ``"$1 $2"`` with canned JSON.
+
+    Local config reads (``config ...``, ``context``) answer without ``delay``.
+    """
+    lines = [
+        "#!/bin/sh",
+        f'echo "{name} $1 $2" >> "{bin_dir}/calls.log"',
+        f'case "$1" in config|context) ;; *) sleep {delay} ;; esac',
+        'case "$1 $2" in',
+    ]
+    for pattern, payload in cases.items():
+        body = payload if isinstance(payload, str) else json.dumps(payload)
+        lines.append(f"  '{pattern}'*) echo '{body}' ;;")
+    lines += ['  *) echo "unexpected: $*" >&2; exit 2 ;;', "esac"]
+    path = bin_dir / name
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    path.chmod(0o755)
+
+
+@pytest.fixture
+def stub_path(tmp_path: Path, monkeypatch):
+    """Return a function that installs stubs; PATH holds only them + sh/sleep/git."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for tool in ("sh", "sleep", "git"):
+        (bin_dir / tool).symlink_to(shutil.which(tool))
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setenv(pipeline_cache.CACHE_ENV_VAR, str(tmp_path / "cache"))
+
+    def install(*names: str, delay: float = 0.0, context: str = "prod") -> None:
+        if "kubectl" in names:
+            _stub(
+                bin_dir,
+                "kubectl",
+                {
+                    "get pods": _PODS,
+                    "get events": _EVENTS,
+                    "config current-context": context,
+                },
+                delay,
+            )
+        if "argocd" in names:
+            _stub(
+                bin_dir,
+                "argocd",
+                {
+                    "app get": _APP,
+                    "app history": [{"id": 1}],
+                    "context": "CURRENT  NAME  SERVER\n"
+                    f"*        {context}  argocd.{context}.example.com",
+                },
+                delay,
+            )
+        if "gh" in names:
+            _stub(
+                bin_dir,
+                "gh",
+                {
+                    "auth status": "ok",
+                    "run list": _RUNS,
+                    "run view": _JOBS,
+                    "repo view": {"owner": {"login": "o"}, "name": "r"},
+                    "api /repos/o/r/packages": [{"name": "img"}],
+                },
+                delay,
+            )
+
+    return install
+
+
+def _collect(tmp_path: Path, **kwargs) -> dict:
+    return asyncio.run(collect_pipeline_diagnostics(tmp_path, **kwargs))
+
+
+def _calls(tmp_path: Path) -> list[str]:
+    """Stub CLI calls so far, as ``"<cli> $1 $2"`` lines."""
+    log = tmp_path / "bin" / "calls.log"
+    return log.read_text(encoding="utf-8").splitlines() if log.exists() else []
+
+
+class TestSources:
+    def test_auto_detect_only_reports_available(self, tmp_path: Path, stub_path):
+        stub_path("kubectl")
+        result = _collect(tmp_path)
+        assert result["available_sources"] == ["kubectl"]
+        assert "github_actions" not in result
+        pods = result["kubectl"]["data"]["pods"]
+        assert pods[0]["restart_count"] == 3
+        assert pods[0]["conditions"] == [{"type": "Ready", "status": "False"}]
+        assert result["kubectl"]["data"]["events"][0]["reason"] == "BackOff"
+
+    def test_explicit_missing_sources_are_unavailable(self, tmp_path: Path, stub_path):
+        result = _collect(tmp_path, sources=["kubectl", "actions"])
+        assert result["available_sources"] == []
+        assert result["kubectl"] == {
+            "status": "unavailable",
+            "message": "kubectl not found",
+        }
+        assert result["github_actions"]["status"] == "unavailable"
+        assert "argocd" not in result
+
+    def test_unrequested_sources_are_not_probed(self, tmp_path: Path, stub_path):
+        stub_path("kubectl", "gh")
+        result = _collect(tmp_path, sources=["kubectl"])
+        assert result["available_sources"] == ["kubectl"]
+        assert not [c for c in _calls(tmp_path) if c.startswith("gh ")]
+
+    def test_all_sources(self, tmp_path: Path, stub_path):
+        stub_path("kubectl", "argocd", "gh")
+        result = _collect(tmp_path, app_name="api", namespace="prod")
+        assert result["available_sources"] == [
+            "kubectl",
+            "argocd",
+            "actions",
+            "packages",
+        ]
+        assert result["argocd"]["data"]["app"]["health_status"] == "Degraded"
+        assert result["argocd"]["data"]["history"] == [{"id": 1}]
+        failed = result["github_actions"]["data"]["failed_details"]
+        assert [d["run_id"] for d in failed] == [11]
+        assert failed[0]["failed_jobs"][0]["steps"] == [
+            {"name": "pytest", "conclusion": "failure"}
+        ]
+        assert result["github_packages"]["data"]["packages"][0]["name"] == "img"
+
+
+class TestConcurrency:
+    def test_bounded_by_slowest_source(self, tmp_path: Path, stub_path):
+        # Sequentially: 2 kubectl + 2 argocd + 4 gh calls (auth, list,
+        # view; repo view, api) at 0.5 s each is well over 4 s.
+        stub_path("kubectl", "argocd", "gh", delay=0.5)
+        start = time.monotonic()
+        result = _collect(tmp_path, app_name="api")
+        elapsed = time.monotonic() - start
+        assert all(
+            result[key]["status"] == "ok"
+            for key in ("kubectl", "argocd", "github_actions", "github_packages")
+        )
+        assert elapsed < 2.5
+
+    def test_source_timeout_does_not_block_others(
+        self, tmp_path: Path, stub_path, monkeypatch
+    ):
+        stub_path("kubectl", delay=5)
+        stub_path("argocd")
+        monkeypatch.setitem(pipeline_collector._SOURCE_TIMEOUTS, "kubectl", 0.3)
+        start = time.monotonic()
+        result = _collect(tmp_path, sources=["kubectl", "argocd"])
+        assert time.monotonic() - start < 2
+        assert result["kubectl"] == {
+            "status": "timeout",
+            "message": "timed out after 0.3s",
+        }
+        assert result["argocd"]["status"] == "ok"
+
+    def test_overall_deadline(self, tmp_path: Path, stub_path):
+        stub_path("kubectl", "argocd", delay=5)
+        start = time.monotonic()
+        result = _collect(tmp_path, deadline=0.3)
+        assert time.monotonic() - start < 2
+        for key in ("kubectl", "argocd"):
+            assert result[key]["status"] == "timeout"
+            assert "deadline" in result[key]["message"]
+
+
+class TestCache:
+    def test_second_run_served_from_cache(self, tmp_path: Path, stub_path):
+        stub_path("kubectl", "gh")
+        first = _collect(tmp_path, namespace="prod")
+        calls = len(_calls(tmp_path))
+        second = _collect(tmp_path, namespace="prod")
+        # Only the kube context is looked up again, to build the key.
+        assert _calls(tmp_path)[calls:] == ["kubectl config current-context"]
+        assert second["available_sources"] == first["available_sources"]
+        assert second["kubectl"]["data"] == first["kubectl"]["data"]
+        assert second["kubectl"]["cached_age_s"] >= 0
+        assert "cached_age_s" not in first["kubectl"]
+        assert second["github_actions"]["data"] == first["github_actions"]["data"]
+
+    def test_fresh_bypasses_and_refreshes(self, tmp_path: Path, stub_path):
+        stub_path("kubectl")
+        _collect(tmp_path)
+        result = _collect(tmp_path, fresh=True)
+        assert _calls(tmp_path).count("kubectl get pods") == 2
+        assert "cached_age_s" not in result["kubectl"]
+        _collect(tmp_path)
+        assert _calls(tmp_path).count("kubectl get pods") == 2
+
+    def test_expired_entry_is_recollected(self, tmp_path: Path, stub_path, monkeypatch):
+        stub_path("kubectl")
+        monkeypatch.setitem(pipeline_cache.SOURCE_TTLS, "kubectl", 0)
+        _collect(tmp_path)
+        _collect(tmp_path)
+        assert _calls(tmp_path).count("kubectl get pods") == 2
+
+    def test_key_covers_namespace_and_head(self, tmp_path: Path, stub_path):
+        stub_path("kubectl")
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for args in (
+            ["init", "-q", "-b", "main"],
+            ["config", "user.email", "test@example.com"],
+            ["config", "user.name", "Test"],
+            ["commit", "-q", "--allow-empty", "-m", "first"],
+        ):
+            subprocess.run(["git", *args], cwd=repo, check=True)
+        _collect(repo, namespace="a")
+        _collect(repo, namespace="b")
+        _collect(repo, namespace="a")
+        assert _calls(tmp_path).count("kubectl get pods") == 2
+        subprocess.run(
+            ["git", "commit", "-q", "--allow-empty", "-m", "second"],
+            cwd=repo,
+            check=True,
+        )
+        _collect(repo, namespace="a")
+        assert _calls(tmp_path).count("kubectl get pods") == 3
+
+    def test_key_covers_cluster_target(self, tmp_path: Path, stub_path, monkeypatch):
+        stub_path("kubectl", "argocd")
+        _collect(tmp_path, app_name="api")
+        _collect(tmp_path, app_name="api")
+        assert _calls(tmp_path).count("kubectl get pods") == 1
+        assert _calls(tmp_path).count("argocd app get") == 1
+
+        stub_path("kubectl", "argocd", context="staging")
+        _collect(tmp_path, app_name="api")
+        assert _calls(tmp_path).count("kubectl get pods") == 2
+        assert _calls(tmp_path).count("argocd app get") == 2
+
+        # ARGOCD_SERVER overrides the argocd context, as it does for the CLI.
+        monkeypatch.setenv("ARGOCD_SERVER", "other.example.com")
+        _collect(tmp_path, app_name="api")
+        assert _calls(tmp_path).count("kubectl get pods") == 2
+        assert _calls(tmp_path).count("argocd app get") == 3
+
+    def test_failures_are_not_cached(self, tmp_path: Path, stub_path, monkeypatch):
+        stub_path("kubectl", delay=5)
+        monkeypatch.setitem(pipeline_collector._SOURCE_TIMEOUTS, "kubectl", 0.3)
+        assert _collect(tmp_path)["kubectl"]["status"] == "timeout"
+        assert not list((tmp_path / "cache").glob("*.json"))
+
+    def test_failed_commands_are_not_cached(self, tmp_path: Path, stub_path):
+        stub_path()
+        # Answers the context lookup; every "get" exits 2.
+        _stub(tmp_path / "bin", "kubectl", {"config current-context": "prod"}, 0)
+        first = _collect(tmp_path)
+        assert "pods_error" in first["kubectl"]["data"]
+        second = _collect(tmp_path)
+        assert "cached_age_s" not in second["kubectl"]
+        assert _calls(tmp_path).count("kubectl get pods") == 2
+        assert not list((tmp_path / "cache").glob("*.json"))
+
+    def test_disabled_cache(self, tmp_path: Path, stub_path, monkeypatch):
+        stub_path("kubectl")
+        monkeypatch.setenv(pipeline_cache.CACHE_ENV_VAR, "off")
+        _collect(tmp_path)
+        _collect(tmp_path)
+        assert _calls(tmp_path).count("kubectl get pods") == 2
+
+
+class TestStreaming:
+    def test_byte_budget_truncates_source(self, tmp_path: Path, stub_path, monkeypatch):
+        stub_path()
+        pods = {
+            "items": [
+                {"metadata": {"name": f"pod-{i}"}, "status": {"phase": "Running"}}
+                for i in range(50)
+            ]
+        }
+        _stub(tmp_path / "bin", "kubectl", {"get pods": pods, "get events": _EVENTS}, 0)
+        monkeypatch.setattr(pipeline_collector, "_STREAM_CHUNK", 64)
+        monkeypatch.setitem(pipeline_collector._SOURCE_BYTE_BUDGETS, "kubectl", 1500)
+        data = _collect(tmp_path)["kubectl"]["data"]
+        assert 0 < len(data["pods"]) < 50
+        assert data["pods"][0]["name"] == "pod-0"
+        assert "exceeded 1500 bytes" in data["pods_truncated"]
+
+    def test_invalid_json_is_reported(self, tmp_path: Path, stub_path):
+        stub_path()
+        _stub(
+            tmp_path / "bin",
+            "kubectl",
+            {"get pods": "{not json", "get events": _EVENTS},
+            0,
+        )
+        data = _collect(tmp_path)["kubectl"]["data"]
+        assert "invalid JSON output" in data["pods_error"]
+        assert "pods" not in data
+        assert data["events"][0]["reason"] == "BackOff"
+
+    def test_only_projected_fields_and_redacted_passthrough(
+        self, tmp_path: Path, stub_path
+    ):
+        stub_path()
+        app = {
+            "metadata": {"name": "api", "annotations": {"x": "y"}},
+            "spec": {"source": {"repoURL": "https://example.com/r.git"}},
+            "status": {
+                "sync": {"status": "Synced", "revision": "abc"},
+                "health": {"status": "Healthy"},
+                "conditions": [{"type": "ComparisonError", "token": "t0p"}],
+                "resources": [
+                    {"status": "Synced", "health": {"status": "Healthy"}},
+                    {"status": "OutOfSync", "health": {"status": "Missing"}},
+                ],
+            },
+        }
+        history = [{"id": i, "source": {"password": "p"}} for i in range(8)]
+        _stub(
+            tmp_path / "bin",
+            "argocd",
+            {"app get": app, "app history": history},
+            0,
+        )
+        data = _collect(tmp_path, app_name="api")["argocd"]["data"]
+        assert data["app"] == {
+            "name": "api",
+            "sync_status": "Synced",
+            "health_status": "Healthy",
+            "sync_revision": "abc",
+            "conditions": [{"type": "ComparisonError", "token": "***REDACTED***"}],
+            "resources_summary": {
+                "total": 2,
+                "synced": 1,
+                "out_of_sync": 1,
+                "healthy": 1,
+                "degraded": 0,
+                "missing": 1,
+            },
+        }
+        assert [h["id"] for h in data["history"]] == [3, 4, 5, 6, 7]
+        assert data["history"][0]["source"] == {"password": "***REDACTED***"}
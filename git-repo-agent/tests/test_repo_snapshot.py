@@ -0,0 +1,220 @@
+"""Tests for RepoSnapshot — the shared single-walk view of a repository."""
+
+from __future__ import annotations
+
+import subprocess
+from collections import Counter
+from pathlib import Path
+
+from git_repo_agent.tools.health_check import _score_tests, compute_health_score
+from git_repo_agent.tools.repo_analyzer import analyze_repo
+from git_repo_agent.tools.repo_snapshot import GitIgnore, RepoSnapshot, walk_repo
+from git_repo_agent.tools.stack_profile import profile_stack
+
+
+def _write(path: Path, content: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _sample_repo(root: Path) -> Path:
+    _write(root / "README.md", "# Sample\n" + "words " * 60)
+    _write(root / "pyproject.toml", '[project]\nname = "x"\n\n[tool.ruff]\n')
+    _write(root / ".pre-commit-config.yaml", "repos: []\n")
+    _write(root / ".github" / "workflows" / "ci.yml", "on: pull_request\nrun: test\n")
+    _write(root / ".github" / "workflows" / "sec.yml", "uses: gitleaks/action\n")
+    _write(root / "src" / "pkg" / "__init__.py", "x = 1\n" * 80)
+    _write(root / "tests" / "test_pkg.py", "def test(): pass\n")
+    _write(root / "node_modules" / "dep" / "index.js", "")
+    return root
+
+
+class TestScan:
+    def test_records_files_and_dirs(self, tmp_path: Path):
+        snap = RepoSnapshot.scan(_sample_repo(tmp_path))
+        assert snap.is_file("README.md")
+        assert snap.is_file(".github/workflows/ci.yml")
+        assert snap.is_dir(".github/workflows")
+        assert snap.is_dir("src/pkg")
+        assert snap.exists("tests")
+        assert not snap.exists("missing.txt")
+
+    def test_pruned_dirs_recorded_but_not_descended(self, tmp_path: Path):
+        snap = RepoSnapshot.scan(_sample_repo(tmp_path))
+        assert snap.is_dir("node_modules")
+        assert not any(f.startswith("node_modules/") for f in snap.files)
+
+    def test_children_is_non_recursive_and_filtered(self, tmp_path: Path):
+        _write(tmp_path / ".github" / "workflows" / "a.yml")
+        _write(tmp_path / ".github" / "workflows" / "b.yaml")
+        _write(tmp_path / ".github" / "workflows" / "notes.txt")
+        _write(tmp_path / ".github" / "workflows" / "sub" / "c.yml")
+        snap = RepoSnapshot.scan(tmp_path)
+        assert snap.children(".github/workflows", ".yml") == [".github/workflows/a.yml"]
+        assert snap.children(".github/workflows", ".yml", ".yaml") == [
+            ".github/workflows/a.yml",
+            ".github/workflows/b.yaml",
+        ]
+
+
+class TestPrunedWalk:
+    def test_skips_build_dirs_and_gitignored_dirs(self, tmp_path: Path):
+        _write(tmp_path / ".gitignore", "generated/\n/out\n")
+        for rel in (
+            "src/a.py",
+            "target/debug/x.rs",
+            "dist/bundle.js",
+            ".git/HEAD",
+            "generated/g.py",
+            "pkg/generated/h.py",
+            "out/o.txt",
+            "pkg/out/kept.txt",
+        ):
+            _write(tmp_path / rel)
+        ignore = GitIgnore((tmp_path / ".gitignore").read_text().splitlines())
+        entries = {
+            rel: pruned
+            for rel, _is_dir, pruned in walk_repo(tmp_path, gitignore=ignore)
+        }
+        assert entries["target"] and entries["dist"] and entries[".git"]
+        assert entries["generated"] and entries["pkg/generated"] and entries["out"]
+        assert "pkg/out/kept.txt" in entries
+        assert "src/a.py" in entries
+        assert not any(
+            rel.startswith(("target/", "dist/", "generated/", "pkg/generated/", "out/"))
+            for rel in entries
+        )
+
+    def test_gitignore_negation_and_globs(self):
+        ignore = GitIgnore(
+            ["# comment", "build*/", "!build-tools/", "**/cache", "*.log"]
+        )
+        assert ignore.ignored("build", True)
+        assert ignore.ignored("pkg/build-out", True)
+        assert not ignore.ignored("build-tools", True)
+        assert ignore.ignored("a/b/cache", True)
+        assert ignore.ignored("x/debug.log", False)
+        assert not ignore.ignored("build", False)
+
+    def test_gitignore_anchored_dir_rule(self):
+        ignore = GitIgnore(["/build/", "docs/out/"])
+        assert ignore.ignored("build", True)
+        assert not ignore.ignored("src/build", True)
+        assert ignore.ignored("docs/out", True)
+        assert not ignore.ignored("pkg/docs/out", True)
+
+    def test_find_file_stops_at_first_match(self, tmp_path: Path):
+        for i in range(50):
+            _write(tmp_path / f"pkg{i:02d}" / "mod.py")
+        _write(tmp_path / "a_test.go")
+        snap = RepoSnapshot.scan(tmp_path)
+        assert snap.find_file(lambda rel: "test" in rel) == "a_test.go"
+        assert not snap._complete
+        assert snap.find_file(lambda rel: rel.endswith(".rs")) is None
+        assert snap._complete
+
+    def test_score_tests_ignores_test_files_in_pruned_dirs(self, tmp_path: Path):
+        _write(tmp_path / "node_modules" / "dep" / "dep.test.js")
+        _write(tmp_path / "dist" / "app.test.js")
+        _, findings = _score_tests(tmp_path)
+        assert "No test directory or test files found" in findings
+        _write(tmp_path / "src" / "app.test.js")
+        score, findings = _score_tests(tmp_path)
+        assert score == 5
+        assert findings == []
+
+
+class TestGitInventory:
+    @staticmethod
+    def _git_repo(root: Path) -> Path:
+        _write(root / ".gitignore", "node_modules/\n*.log\n")
+        _write(root / "packages" / "a" / ".gitignore", "out/\n")
+        _write(root / "src" / "index.ts", "x\n")
+        _write(root / "dist" / "vendored.js", "x\n")
+        _write(root / "node_modules" / "dep" / "dep.test.js")
+        _write(root / "packages" / "a" / "out" / "build.test.js")
+        _write(root / "debug.log")
+        subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+        subprocess.run(
+            ["git", "add", "src", "dist", ".gitignore"], cwd=root, check=True
+        )
+        _write(root / "notes.md", "untracked but not ignored\n")
+        return root
+
+    def test_inventory_from_git_index(self, tmp_path: Path):
+        snap = RepoSnapshot.scan(self._git_repo(tmp_path))
+        files = snap.files
+        assert snap.inventory_source == "git"
+        # Tracked files are listed even under a PRUNE_DIRS name.
+        assert {"src/index.ts", "dist/vendored.js", "notes.md"} <= files
+        # Ignored files are not, at any .gitignore level.
+        assert "debug.log" not in files
+        assert not any(
+            f.startswith(("node_modules/", "packages/a/out/")) for f in files
+        )
+        assert snap.find_file(lambda rel: "test" in rel) is None
+        assert {"src", "dist"} <= snap.dirs
+
+    def test_use_git_false_walks(self, tmp_path: Path):
+        snap = RepoSnapshot.scan(self._git_repo(tmp_path), use_git=False)
+        files = snap.files
+        assert snap.inventory_source == "walk"
+        assert "debug.log" in files
+        assert "dist/vendored.js" not in files
+        # The walk only knows the root .gitignore.
+        assert "packages/a/out/build.test.js" in files
+
+    def test_non_repo_falls_back_to_walk(self, tmp_path: Path):
+        _write(tmp_path / "src" / "index.ts")
+        snap = RepoSnapshot.scan(tmp_path)
+        assert snap.files == {"src/index.ts"}
+        assert snap.inventory_source == "walk"
+
+
+class TestContents:
+    def test_text_is_cached(self, tmp_path: Path):
+        _write(tmp_path / "setup.cfg", "[mypy]\n")
+        snap = RepoSnapshot.scan(tmp_path)
+        assert snap.text("setup.cfg") == "[mypy]\n"
+        (tmp_path / "setup.cfg").write_text("changed\n", encoding="utf-8")
+        assert snap.text("setup.cfg") == "[mypy]\n"
+
+    def test_missing_file_is_empty(self, tmp_path: Path):
+        snap = RepoSnapshot.scan(tmp_path)
+        assert snap.text("pyproject.toml") == ""
+        assert snap.toml("pyproject.toml") is None
+
+    def test_json_and_toml(self, tmp_path: Path):
+        _write(tmp_path / "package.json", '{"devDependencies": {"vitest": "1"}}')
+        _write(tmp_path / "bad.json", "[1, 2]")
+        _write(tmp_path / "Cargo.toml", '[dependencies]\naxum = "0.7"\n')
+        snap = RepoSnapshot.scan(tmp_path)
+        assert snap.json("package.json") == {"devDependencies": {"vitest": "1"}}
+        assert snap.json("bad.json") is None
+        assert snap.toml("Cargo.toml") == {"dependencies": {"axum": "0.7"}}
+
+
+class TestSharedSnapshot:
+    def test_results_match_path_only_calls(self, tmp_path: Path):
+        repo = _sample_repo(tmp_path)
+        snap = RepoSnapshot.scan(repo)
+        assert analyze_repo(repo, snapshot=snap) == analyze_repo(repo)
+        assert compute_health_score(repo, snapshot=snap) == compute_health_score(repo)
+        assert profile_stack(repo, snapshot=snap) == profile_stack(repo)
+
+    def test_each_file_read_at_most_once(self, tmp_path: Path, monkeypatch):
+        repo = _sample_repo(tmp_path)
+        reads: Counter[str] = Counter()
+        original = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads[self.relative_to(repo).as_posix()] += 1
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        snap = RepoSnapshot.scan(repo)
+        analyze_repo(repo, snapshot=snap)
+        compute_health_score(repo, snapshot=snap)
+        assert reads["pyproject.toml"] == 1
+        assert reads[".github/workflows/ci.yml"] == 1
+        assert max(reads.values()) == 1
@@ -0,0 +1,65 @@
+"""Tests for the fence-aware markdown section parser."""
+
+from __future__ import annotations
+
+from git_repo_agent.prompts.sections import parse_sections
+
+
+class TestParseSections:
+    def test_splits_by_heading(self) -> None:
+        sections = parse_sections("intro\n\n## First\na\n\n### Second\nb\n")
+        assert [(s.heading, s.marker) for s in sections] == [
+            ("", ""),
+            ("First", "##"),
+            ("Second", "###"),
+        ]
+        assert sections[0].body == "intro\n\n"
+        assert sections[1].body == "a\n\n"
+
+    def test_heading_lines_inside_fence_stay_in_section(self) -> None:
+        content = "## Setup\n```markdown\n## Not a heading\n```\n## Next\nb\n"
+        sections = parse_sections(content)
+        assert [s.heading for s in sections] == ["", "Setup", "Next"]
+        assert sections[1].body == "```markdown\n## Not a heading\n```\n"
+
+    def test_nested_fence_needs_a_long_enough_closer(self) -> None:
+        content = (
+            "## Example\n"
+            "````markdown\n"
+            "```bash\n"
+            "# install deps\n"
+            "```\n"
+            "## Inner\n"
+            "````\n"
+            "## After\n"
+        )
+        sections = parse_sections(content)
+        assert [s.heading for s in sections] == ["", "Example", "After"]
+        assert "## Inner\n" in sections[1].body
+
+    def test_closer_must_match_opener_character(self) -> None:
+        content = "~~~\n```\n# still code\n~~~\n# Heading\n"
+        sections = parse_sections(content)
+        assert [s.heading for s in sections] == ["", "Heading"]
+        assert "# still code" in sections[0].body
+
+    def test_closer_with_info_string_does_not_close(self) -> None:
+        content = "```\n```bash\n## still code\n```\n## Heading\n"
+        sections = parse_sections(content)
+        assert [s.heading for s in sections] == ["", "Heading"]
+
+    def test_unterminated_fence_runs_to_end(self) -> None:
+        content = "## Setup\n```bash\n# install deps\n## Not a heading\n"
+        sections = parse_sections(content)
+        assert [s.heading for s in sections] == ["", "Setup"]
+        assert sections[1].body == "```bash\n# install deps\n## Not a heading\n"
+
+    def test_indented_code_is_not_a_fence(self) -> None:
+        content = "    ```\n## Heading\n"
+        sections = parse_sections(content)
+        assert [s.heading for s in sections] == ["", "Heading"]
+
+    def test_level_four_heading_is_body(self) -> None:
+        sections = parse_sections("## Top\n#### Deep\ntext\n")
+        assert len(sections) == 2
+        assert sections[1].body == "#### Deep\ntext\n"
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Measure how much memory the vault index and analyzer reports hold.
+
+Uses ``tracemalloc`` on a synthetic vault (see ``vault_agent.synthetic``):
+the index is measured after ``scan``, then each analyzer report is
+measured while the index stays alive, so report figures are only what
+the report itself adds on top of the notes it points at.
+
+For every report the script also walks its records and counts ``Path``
+references: how many there are, how many distinct objects they point to,
+and how many of those are the index's own ``Note.path`` objects. Reports
+share the index's paths rather than copying them, so a report costs a
+pointer per reference, not a path.
+
+Usage:
+    python scripts/bench_memory.py                  # 10k articles
+    python scripts/bench_memory.py --sizes 1000,50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any
+
+# Allow running from scripts/ without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bench_vault import _vault_for  # noqa: E402
+from vault_agent.analyzers import scan  # noqa: E402
+from vault_agent.analyzers.duplicates import analyze_duplicates  # noqa: E402
+from vault_agent.analyzers.frontmatter import analyze_frontmatter  # noqa: E402
+from vault_agent.analyzers.graph import analyze_graph  # noqa: E402
+from vault_agent.analyzers.links import analyze_links  # noqa: E402
+from vault_agent.analyzers.mocs import analyze_mocs  # noqa: E402
+from vault_agent.analyzers.stubs import analyze_stubs  # noqa: E402
+from vault_agent.config import load_config  # noqa: E402
+from vault_agent.synthetic import SyntheticSpec  # noqa: E402
+
+
+def _traced(fn: Callable[[], Any]) -> tuple[Any, int]:
+    """Run ``fn`` and return its result plus the bytes still allocated."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    gc.collect()
+    return result, tracemalloc.get_traced_memory()[0] - before
+
+
+def _paths(obj: Any, seen: set[int]) -> list[Path]:
+    """Every ``Path`` reachable from a report, depth-first."""
+    if isinstance(obj, Path):
+        return [obj]
+    if id(obj) in seen:
+        return []
+    seen.add(id(obj))
+    if is_dataclass(obj):
+        children = [getattr(obj, f.name) for f in fields(obj)]
+    elif isinstance(obj, dict):
+        children = [*obj.keys(), *obj.values()]
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        children = list(obj)
+    else:
+        return []
+    out: list[Path] = []
+    for child in children:
+        out.extend(_paths(child, seen))
+    return out
+
+
+def _measure(vault: Path) -> dict[str, Any]:
+    config = load_config(vault)
+    tracemalloc.start()
+    try:
+        index, index_bytes = _traced(lambda: scan(vault))
+        index_paths = {id(n.path) for n in index.notes}
+        analyzers: dict[str, Callable[[], Any]] = {
+            "frontmatter": lambda: analyze_frontmatter(index, config),
+            "links": lambda: analyze_links(index),
+            "graph": lambda: analyze_graph(index, config=config),
+            "stubs": lambda: analyze_stubs(index, config),
+            "mocs": lambda: analyze_mocs(index),
+            "duplicates": lambda: analyze_duplicates(index),
+        }
+        reports: dict[str, Any] = {}
+        for name, fn in analyzers.items():
+            report, nbytes = _traced(fn)
+            refs = _paths(report, set())
+            reports[name] = {
+                "bytes": nbytes,
+                "path_refs": len(refs),
+                "distinct_paths": len({id(p) for p in refs}),
+                "shared_with_index": sum(id(p) in index_paths for p in refs),
+            }
+            del report
+        links = sum(len(n.wikilinks) for n in index.notes)
+    finally:
+        tracemalloc.stop()
+    return {
+        "notes": len(index.notes),
+        "wikilinks": links,
+        "index_bytes": index_bytes,
+        "reports": reports,
+    }
+
+
+def _mib(nbytes: int) -> str:
+    return f"{nbytes / (1024 * 1024):8.2f} MiB"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(x) for x in s.split(",")],
+        default=[10_000],
+        help="Comma-separated article counts (default: 10000).",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "vault-agent-bench",
+        help="Where generated vaults are kept between runs.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {}
+    for size in args.sizes:
+        vault = _vault_for(SyntheticSpec(notes=size, seed=args.seed), args.workdir)
+        result = _measure(vault)
+        results[str(size)] = result
+        if args.json:
+            continue
+        print(
+            f"{size} articles: {result['notes']} notes, {result['wikilinks']} wikilinks"
+        )
+        print(f"  {'index':<12} {_mib(result['index_bytes'])}")
+        for name, r in result["reports"].items():
+            print(
+                f"  {name:<12} {_mib(r['bytes'])}  "
+                f"{r['path_refs']:>6} path refs → {r['distinct_paths']:>6} objects, "
+                f"{r['shared_with_index']:>6} shared with the index"
+            )
+    if args.json:
+        print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
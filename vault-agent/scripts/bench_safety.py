@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the PreToolUse safety hook.
+
+Replays a synthetic session's worth of tool inputs — mostly repeated
+``Edit``/``Write`` targets and ``git``/``uv run`` commands, with a few
+blocked ones mixed in — through ``validate_tool_use`` and reports the
+per-call latency, next to the previous per-pattern implementation kept
+below for comparison. Also asserts both give the same decisions.
+
+Usage:
+    python scripts/bench_safety.py                 # 2000-call session
+    python scripts/bench_safety.py --calls 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Allow running from scripts/ without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from vault_agent.hooks import safety  # noqa: E402
+from vault_agent.hooks.safety import (  # noqa: E402
+    PROTECTED_DIR_SEGMENTS,
+    PROTECTED_TOP_DIRS,
+    RM_RF_ALLOWLIST_SEGMENTS,
+    SafetyDecision,
+    validate_tool_use,
+)
+
+
+def _legacy_validate(tool_name: str, tool_input: dict[str, Any]) -> SafetyDecision:
+    """The loop-over-patterns hook this module replaced (reasons elided)."""
+    return SafetyDecision(_legacy_allow(tool_name, tool_input), "")
+
+
+def _legacy_allow(tool_name: str, tool_input: dict[str, Any]) -> bool:
+    if tool_name in ("Write", "Edit", "NotebookEdit"):
+        for raw in (tool_input.get("file_path"), tool_input.get("notebook_path")):
+            if not raw:
+                continue
+            parts = [
+                p for p in str(raw).replace("\\", "/").split("/") if p and p != "."
+            ]
+            for segment in parts:
+                if segment in PROTECTED_DIR_SEGMENTS or segment in PROTECTED_TOP_DIRS:
+                    return False
+        return True
+    if tool_name == "Bash":
+        command = str(tool_input.get("command", "") or "")
+        if not command.strip():
+            return True
+        for pat in safety._BLOCKED_BASH_PATTERNS:
+            if pat.search(command):
+                return False
+        if safety._RM_RF_RE.search(command):
+            return any(
+                f"/{seg}/" in command
+                or command.endswith(f"/{seg}")
+                or f" {seg}/" in command
+                for seg in RM_RF_ALLOWLIST_SEGMENTS
+            )
+    return True
+
+
+def _session(calls: int, seed: int = 0) -> list[tuple[str, dict[str, Any]]]:
+    """A deterministic replay: ~60 distinct inputs drawn ``calls`` times."""
+    rng = random.Random(seed)
+    notes = [f"Zettelkasten/Note {i}.md" for i in range(40)]
+    commands = [
+        "git status --porcelain",
+        "git diff --stat",
+        'git add -A && git commit -m "fix(tags): normalize"',
+        "uv run python -c 'from vault_agent.fixers import moc_curation'",
+        "ls work/z | head -50",
+        "rm -rf /tmp/vault-agent-scratch/processed/",
+        "git push origin HEAD",
+        "rm -rf Zettelkasten",
+        "git reset --hard HEAD~1",
+    ]
+    pool: list[tuple[str, dict[str, Any]]] = [
+        *[("Edit", {"file_path": f"/vault/{n}"}) for n in notes],
+        *[("Bash", {"command": c}) for c in commands],
+        ("Write", {"file_path": "/vault/.obsidian/app.json"}),
+        ("Write", {"file_path": "/vault/Files/image.png"}),
+        ("Read", {"file_path": "/vault/Zettelkasten/Note 1.md"}),
+        ("Grep", {"pattern": "TODO"}),
+    ]
+    return [rng.choice(pool) for _ in range(calls)]
+
+
+def _time(fn, session) -> float:
+    start = time.perf_counter()
+    for name, tool_input in session:
+        fn(name, tool_input)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    session = _session(args.calls)
+    for name, tool_input in session:
+        if validate_tool_use(name, tool_input).allow != _legacy_allow(name, tool_input):
+            print(f"MISMATCH: {name} {tool_input}", file=sys.stderr)
+            return 1
+
+    safety._bash_decision.cache_clear()
+    safety._path_decision.cache_clear()
+    legacy = _time(_legacy_validate, session)
+    current = _time(validate_tool_use, session)
+    print(f"{len(session)} tool calls, {len({repr(s) for s in session})} distinct")
+    print(f"  legacy  per-pattern loop:  {legacy / len(session) * 1e6:6.2f} µs/call")
+    print(f"  compiled + memoized:       {current / len(session) * 1e6:6.2f} µs/call")
+    print(f"  speedup: {legacy / current:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
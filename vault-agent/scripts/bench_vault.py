@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Benchmark scan, the analyzers and the deterministic write modes.
+
+Generates synthetic vaults (see ``vault_agent.synthetic``) at each size,
+times every case for a few rounds, prints min/median per case, and
+appends the run — with the git commit, Python version and spec — to a
+JSON history file so regressions show up as a diff between entries.
+
+Cases:
+    scan                          ``scan`` of the whole vault
+    analyze.<name>                each analyzer on a pre-scanned index
+    run_audit                     scan + every analyzer + health
+    run_lint(apply) / run_links(apply)
+                                  full write runs: worktree, fixers, commits
+
+Generated vaults are kept under ``--workdir`` (one directory per spec), so
+repeated runs skip generation; write runs remove their worktree after each
+round and never touch the vault itself.
+
+Usage:
+    python scripts/bench_vault.py                        # 1k, 10k, 50k notes
+    python scripts/bench_vault.py --sizes 1000 --rounds 5
+    python scripts/bench_vault.py --history .benchmarks/vault.json --compare
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Allow running from scripts/ without installing the package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from vault_agent.analyzers import scan  # noqa: E402
+from vault_agent.analyzers.audit import run_audit  # noqa: E402
+from vault_agent.analyzers.duplicates import analyze_duplicates  # noqa: E402
+from vault_agent.analyzers.frontmatter import analyze_frontmatter  # noqa: E402
+from vault_agent.analyzers.graph import analyze_graph  # noqa: E402
+from vault_agent.analyzers.links import analyze_links  # noqa: E402
+from vault_agent.analyzers.mocs import analyze_mocs  # noqa: E402
+from vault_agent.analyzers.stubs import analyze_stubs  # noqa: E402
+from vault_agent.config import load_config  # noqa: E402
+from vault_agent.links_mode import run_links  # noqa: E402
+from vault_agent.lint import run_lint  # noqa: E402
+from vault_agent.synthetic import SyntheticSpec, generate_vault, init_git  # noqa: E402
+from vault_agent.worktree import cleanup_worktree  # noqa: E402
+
+_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_HISTORY = _ROOT / ".benchmarks" / "vault.json"
+_DEFAULT_SIZES = (1000, 10_000, 50_000)
+
+
+def _vault_for(spec: SyntheticSpec, workdir: Path) -> Path:
+    key = hashlib.sha256(json.dumps(spec.to_dict(), sort_keys=True).encode())
+    root = workdir / f"vault-{spec.notes}-{key.hexdigest()[:10]}"
+    if (root / ".git").is_dir():
+        return root
+    shutil.rmtree(root, ignore_errors=True)
+    start = time.perf_counter()
+    generated = generate_vault(root, spec)
+    init_git(root)
+    print(
+        f"  generated {generated.total_notes} notes in "
+        f"{time.perf_counter() - start:.1f}s → {root}"
+    )
+    return root
+
+
+def _time(fn: Callable[[], Any], rounds: int) -> dict[str, float]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return {
+        "rounds": rounds,
+        "min_s": round(min(samples), 4),
+        "median_s": round(statistics.median(samples), 4),
+        "mean_s": round(statistics.fmean(samples), 4),
+        "stdev_s": round(statistics.stdev(samples), 4) if rounds > 1 else 0.0,
+    }
+
+
+def _write_run(run: Callable[..., Any], vault: Path) -> Callable[[], None]:
+    def go() -> None:
+        result = run(vault, apply=True)
+        if result.handle is not None:
+            cleanup_worktree(result.handle)
+
+    return go
+
+
+def _bench_size(vault: Path, rounds: int, write_rounds: int) -> dict[str, Any]:
+    config = load_config(vault)
+    index = scan(vault)
+    analyzers: dict[str, Callable[[], Any]] = {
+        "analyze.frontmatter": lambda: analyze_frontmatter(index, config),
+        "analyze.links": lambda: analyze_links(index),
+        "analyze.graph": lambda: analyze_graph(index, config=config),
+        "analyze.stubs": lambda: analyze_stubs(index, config),
+        "analyze.mocs": lambda: analyze_mocs(index),
+        "analyze.duplicates": lambda: analyze_duplicates(index),
+    }
+    cases: dict[str, dict[str, float]] = {"scan": _time(lambda: scan(vault), rounds)}
+    for name, fn in analyzers.items():
+        cases[name] = _time(fn, rounds)
+    cases["run_audit"] = _time(lambda: run_audit(vault), rounds)
+    cases["run_lint(apply)"] = _time(_write_run(run_lint, vault), write_rounds)
+    cases["run_links(apply)"] = _time(_write_run(run_links, vault), write_rounds)
+    return {"notes": len(index.notes), "cases": cases}
+
+
+def _git_commit() -> str | None:
+    proc = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return proc.stdout.strip() or None
+
+
+def _load_history(path: Path) -> list[dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return data if isinstance(data, list) else []
+
+
+def _print_comparison(previous: dict[str, Any], current: dict[str, Any]) -> None:
+    print(f"\nvs {previous.get('commit')} ({previous.get('timestamp')}):")
+    for size, result in current["results"].items():
+        before = previous.get("results", {}).get(size)
+        if not before:
+            continue
+        for case, stats in result["cases"].items():
+            old = before["cases"].get(case)
+            if not old or not old["median_s"]:
+                continue
+            ratio = stats["median_s"] / old["median_s"]
+            print(f"  {size:>7} {case:<22} {ratio:6.2f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(x) for x in s.split(",")],
+        default=list(_DEFAULT_SIZES),
+        help="Comma-separated article counts (default: 1000,10000,50000).",
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per read case.")
+    parser.add_argument(
+        "--write-rounds", type=int, default=1, help="Rounds per write-mode case."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=Path(tempfile.gettempdir()) / "vault-agent-bench",
+        help="Where generated vaults are kept between runs.",
+    )
+    parser.add_argument("--history", type=Path, default=_DEFAULT_HISTORY)
+    parser.add_argument(
+        "--compare", action="store_true", help="Print ratios against the last entry."
+    )
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {}
+    specs: dict[str, Any] = {}
+    for size in args.sizes:
+        spec = SyntheticSpec(notes=size, seed=args.seed)
+        print(f"{size} articles:")
+        vault = _vault_for(spec, args.workdir)
+        result = _bench_size(vault, args.rounds, args.write_rounds)
+        results[str(size)] = result
+        specs[str(size)] = spec.to_dict()
+        for case, stats in result["cases"].items():
+            print(
+                f"  {case:<22} min {stats['min_s']:8.3f}s  "
+                f"median {stats['median_s']:8.3f}s"
+            )
+
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "specs": specs,
+        "results": results,
+    }
+    history = _load_history(args.history)
+    if args.compare and history:
+        _print_comparison(history[-1], entry)
+    history.append(entry)
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    args.history.write_text(json.dumps(history, indent=2) + "\n", encoding="utf-8")
+    print(f"\nAppended to {args.history}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
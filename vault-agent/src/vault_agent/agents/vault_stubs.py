@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from vault_agent.agents._build import _BASE_TOOLS, load_mode_prompt
+from vault_agent.search import SEARCH_TOOL_NAME
 
 try:
     from claude_agent_sdk import AgentDefinition  # type: ignore[import-untyped]
@@ -23,7 +24,7 @@ def _build() -> "AgentDefinition":
     return AgentDefinition(
         description=_DESCRIPTION,
         prompt=load_mode_prompt("vault_stubs.md", "vault-stubs"),
-        tools=list(_BASE_TOOLS),
+        tools=[*_BASE_TOOLS, SEARCH_TOOL_NAME],
         model="sonnet",
     )
 
@@ -13,11 +13,12 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from vault_agent.analyzers.vault_index import VaultIndex
+from vault_agent.profiling import timed
 
 _UNTITLED_RE = re.compile(r"^Untitled(\s+\d+)?$", re.IGNORECASE)
 
 
-@dataclass
+@dataclass(slots=True)
 class DuplicateGroup:
     basename: str
     paths: list[Path]
@@ -40,6 +41,7 @@ class DuplicateReport:
         }
 
 
+@timed("analyze.duplicates")
 def analyze_duplicates(index: VaultIndex) -> DuplicateReport:
     report = DuplicateReport()
 
@@ -20,6 +20,7 @@ from pathlib import Path
 
 from vault_agent.config import DEFAULT_CONFIG, VaultConfig
 from vault_agent.analyzers.vault_index import Note, VaultIndex
+from vault_agent.profiling import timed
 
 # Tag value treated as a no-op placeholder when it appears alone (no /subcategory).
 _BARE_PLACEHOLDERS: frozenset[str] = frozenset({"📝", "🌱", "📝/🌱"})
@@ -41,7 +42,7 @@ _TEMPLATER_PATTERNS: tuple[re.Pattern[str], ...] = (
 _UNICODE_REPLACEMENT = "\ufffd"
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteIssue:
     """One problem found on one note."""
 
@@ -108,6 +109,7 @@ def _normalize_for_dupe_detection(tag: str) -> str:
     return lower
 
 
+@timed("analyze.frontmatter")
 def analyze_frontmatter(
     index: VaultIndex, config: VaultConfig = DEFAULT_CONFIG
 ) -> FrontmatterReport:
@@ -14,6 +14,7 @@ from pathlib import Path
 
 from vault_agent.config import DEFAULT_CONFIG, VaultConfig
 from vault_agent.analyzers.vault_index import Note, VaultIndex
+from vault_agent.profiling import timed
 
 # Top-level directories whose notes are expected to be weakly connected.
 # They're counted, but not flagged as "meaningful" orphans.
@@ -55,6 +56,7 @@ class GraphReport:
         }
 
 
+@timed("analyze.graph")
 def analyze_graph(
     index: VaultIndex, *, hub_limit: int = 20, config: VaultConfig = DEFAULT_CONFIG
 ) -> GraphReport:
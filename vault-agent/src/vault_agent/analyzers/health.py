@@ -20,6 +20,7 @@ from vault_agent.analyzers.graph import GraphReport
 from vault_agent.analyzers.links import LinkReport
 from vault_agent.analyzers.mocs import MocReport
 from vault_agent.analyzers.stubs import StubClass, StubReport
+from vault_agent.profiling import timed
 
 
 @dataclass
@@ -41,6 +42,7 @@ def _ratio_score(numer: int, denom: int, *, max_points: float = 20.0) -> float:
     return max_points * max(0.0, 1.0 - numer / denom)
 
 
+@timed("analyze.health")
 def compute_health(
     *,
     frontmatter: FrontmatterReport,
@@ -17,9 +17,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from vault_agent.analyzers.vault_index import VaultIndex, Wikilink
+from vault_agent.profiling import timed
 
 
-@dataclass
+@dataclass(slots=True)
 class BrokenLink:
     source_path: Path
     target: str
@@ -33,7 +34,7 @@ class BrokenLink:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AmbiguousLink:
     source_path: Path
     target: str
@@ -95,6 +96,7 @@ def _is_meaningfully_broken(link: Wikilink, index: VaultIndex) -> bool:
     return len(index.resolve(link.target)) == 0
 
 
+@timed("analyze.links")
 def analyze_links(index: VaultIndex) -> LinkReport:
     report = LinkReport()
     broken_counter: Counter[str] = Counter()
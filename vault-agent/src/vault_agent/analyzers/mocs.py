@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from vault_agent.analyzers.vault_index import Note, VaultIndex
+from vault_agent.profiling import timed
 
 MOC_TAGS_CURRENT: frozenset[str] = frozenset({"📝/moc"})
 MOC_TAGS_LEGACY: frozenset[str] = frozenset({"🗺️", "🗺"})
@@ -25,7 +26,7 @@ MOC_TAGS_LEGACY: frozenset[str] = frozenset({"🗺️", "🗺"})
 NEW_MOC_THRESHOLD = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class MOC:
     path: Path
     basename: str
@@ -43,7 +44,7 @@ class MOC:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryCoverage:
     """Tag-category statistics."""
 
@@ -99,6 +100,7 @@ def _is_moc(note: Note) -> tuple[bool, bool]:
     return (has_current or has_legacy, has_legacy)
 
 
+@timed("analyze.mocs")
 def analyze_mocs(index: VaultIndex, *, sample_size: int = 10) -> MocReport:
     report = MocReport()
 
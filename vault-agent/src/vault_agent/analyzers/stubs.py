@@ -19,6 +19,7 @@ from pathlib import Path
 
 from vault_agent.config import DEFAULT_CONFIG, VaultConfig
 from vault_agent.analyzers.vault_index import Note, VaultIndex
+from vault_agent.profiling import timed
 
 _CLEAN_STUB_MAX_BYTES = 200
 
@@ -35,7 +36,7 @@ class StubClass(str, Enum):
     NS_ORIGINAL = "ns_original"
 
 
-@dataclass
+@dataclass(slots=True)
 class StubClassification:
     path: Path
     cls: StubClass
@@ -86,6 +87,7 @@ def _canonical_in_zettelkasten(index: VaultIndex, basename: str) -> Path | None:
     return None
 
 
+@timed("analyze.stubs")
 def analyze_stubs(
     index: VaultIndex, config: VaultConfig = DEFAULT_CONFIG
 ) -> StubReport:
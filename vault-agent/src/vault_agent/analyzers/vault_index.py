@@ -7,17 +7,28 @@ downstream analyzers consume this index rather than re-scanning.
 Exclusions follow the convention documented in
 ``CLAUDE.md`` / ``.claude/rules/vault-conventions.md``: ignore Obsidian's
 own state, Claude's metadata, git internals, media, and build artifacts.
+
+Link resolution follows Obsidian: targets match case-insensitively and
+regardless of Unicode normalization (notes synced from macOS often have
+NFD filenames while links are typed NFC), and a path-qualified target
+like ``[[sub/dir/Note]]`` matches any note whose path ends with those
+segments. ``VaultIndex`` precomputes both lookups once — normalized
+basename keys and a path-suffix map, see :func:`normalize_key` — so
+``resolve`` stays a couple of dict lookups.
 """
 
 from __future__ import annotations
 
 import re
+import unicodedata
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
 
 import frontmatter
 
+from vault_agent.profiling import timed
+
 # Paths that are never vault content. Match on any path segment.
 EXCLUDED_DIRS: frozenset[str] = frozenset(
     {
@@ -45,7 +56,19 @@ _WIKILINK_RE = re.compile(
 )
 
 
-@dataclass(frozen=True)
+def normalize_key(target: str) -> str:
+    """Resolution key for a link target or relative path.
+
+    NFC-normalized and casefolded, ``\\`` → ``/``, no leading/trailing
+    slash and no ``.md`` suffix: ``Café/Note.md`` and ``cafe\u0301/note``
+    share a key.
+    """
+    key = unicodedata.normalize("NFC", target.strip().replace("\\", "/"))
+    key = unicodedata.normalize("NFC", key.casefold()).strip("/")
+    return key[:-3] if key.endswith(".md") else key
+
+
+@dataclass(frozen=True, slots=True)
 class Wikilink:
     """A parsed ``[[Target]]``, ``[[Target|Alias]]`` or ``![[Target]]``."""
 
@@ -55,7 +78,7 @@ class Wikilink:
     is_embed: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """One markdown file in the vault."""
 
@@ -103,10 +126,22 @@ class VaultIndex:
     by_basename: dict[str, list[Note]]
     # relative path string → note
     by_rel_path: dict[str, Note]
+    # normalize_key(basename) → notes; the case/Unicode-insensitive fallback
+    by_key: dict[str, list[Note]] = field(init=False, repr=False)
+    # normalize_key of every path suffix with 2+ segments (up to the full
+    # relative path) → notes ending with it
+    by_path_suffix: dict[str, list[Note]] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         if not isinstance(self.vault_root, Path):
             self.vault_root = Path(self.vault_root)
+        self.by_key = {}
+        self.by_path_suffix = {}
+        for note in self.notes:
+            parts = normalize_key(note.rel_path.as_posix()).split("/")
+            self.by_key.setdefault(parts[-1], []).append(note)
+            for i in range(len(parts) - 1):
+                self.by_path_suffix.setdefault("/".join(parts[i:]), []).append(note)
 
     # -- convenience lookups ----------------------------------------------
 
@@ -114,20 +149,25 @@ class VaultIndex:
         """Resolve a wikilink target to candidate notes.
 
         Obsidian resolves by basename, but callers may pass a path-qualified
-        target like ``Kanban/Main``. We try path-qualified first, then
-        basename.
+        target like ``Kanban/Main``. An exact match wins (the full relative
+        path, or the basename as written); otherwise the normalized key is
+        looked up — in the path-suffix map for qualified targets, so
+        ``[[dir/Note]]`` finds ``a/dir/Note.md``, and by basename otherwise.
+        More than one candidate means the link is ambiguous.
         """
         target = target.strip()
         if not target:
             return []
-        # Path-qualified match
         if "/" in target:
             key = target if target.endswith(".md") else f"{target}.md"
             note = self.by_rel_path.get(key)
             if note is not None:
                 return [note]
-        # Basename match
-        return list(self.by_basename.get(target, []))
+            return list(self.by_path_suffix.get(normalize_key(target), []))
+        exact = self.by_basename.get(target)
+        if exact:
+            return list(exact)
+        return list(self.by_key.get(normalize_key(target), []))
 
     def is_broken(self, target: str) -> bool:
         return len(self.resolve(target)) == 0
@@ -220,6 +260,7 @@ def _load_note(vault_root: Path, path: Path) -> Note:
     )
 
 
+@timed("scan")
 def scan(vault_root: Path | str) -> VaultIndex:
     """Walk the vault once and build a VaultIndex."""
     root = Path(vault_root).expanduser().resolve()
@@ -0,0 +1,144 @@
+"""Run one mode over many vaults in a single process.
+
+Scheduled jobs used to spawn one ``vault-agent`` process per vault, each
+paying interpreter start-up, imports and config load. ``--vaults`` on
+``analyze`` and ``maintain`` hands the whole list to :class:`BatchRunner`
+instead: a bounded ``ThreadPoolExecutor`` runs the per-vault function,
+and every finished vault is reported as one JSON line (see
+:meth:`VaultRun.to_dict`) so the combined output is JSONL.
+
+Write runs take each vault's advisory lock with ``worktree.acquire_lock``
+before touching it; a vault whose lock is held is reported as ``locked``
+and the rest of the batch carries on. Failures are per vault too: an
+exception becomes an ``error`` line with the exit code the single-vault
+command would have used, never an aborted batch.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from vault_agent.non_interactive import (
+    EXIT_HOOK_BLOCKED,
+    EXIT_LOCKED,
+    EXIT_RUNTIME_ERROR,
+    EXIT_SUCCESS,
+    HookBlockedError,
+)
+from vault_agent.worktree import acquire_lock, release_lock
+
+# Vaults are mostly disk- and git-bound; a handful of workers is enough.
+DEFAULT_MAX_WORKERS = 4
+
+
+class VaultExit(Exception):
+    """Raised by a per-vault function to end that vault with ``exit_code``."""
+
+    def __init__(self, exit_code: int, message: str = "") -> None:
+        super().__init__(message)
+        self.exit_code = exit_code
+
+
+@dataclass
+class VaultRun:
+    """Outcome for one vault: exit code plus the mode's summary payload."""
+
+    vault: Path
+    exit_code: int
+    payload: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    elapsed_s: float = 0.0
+
+    @property
+    def status(self) -> str:
+        if self.exit_code == EXIT_SUCCESS:
+            return "ok"
+        if self.exit_code == EXIT_LOCKED:
+            return "locked"
+        return "error"
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "vault": str(self.vault),
+            "status": self.status,
+            "exit_code": self.exit_code,
+            "elapsed_s": round(self.elapsed_s, 3),
+            **self.payload,
+        }
+        if self.error:
+            out["error"] = self.error
+        return out
+
+
+def batch_exit_code(runs: Sequence[VaultRun]) -> int:
+    """Highest per-vault exit code, so any failure fails the batch."""
+    return max((r.exit_code for r in runs), default=EXIT_SUCCESS)
+
+
+class BatchRunner:
+    """Bounded worker pool over vaults, with per-vault locking.
+
+    ``held_locks`` is the set of lock files currently held, so a signal
+    handler can release them via :meth:`release_all` on interruption.
+    """
+
+    def __init__(self, *, lock: bool, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self.lock = lock
+        self.max_workers = max(1, max_workers)
+        self.held_locks: set[Path] = set()
+        self._mutex = threading.Lock()
+
+    def release_all(self) -> None:
+        with self._mutex:
+            held, self.held_locks = self.held_locks, set()
+        for lock_path in held:
+            release_lock(lock_path)
+
+    def _run_one(self, vault: Path, fn: Callable[[Path], dict[str, Any]]) -> VaultRun:
+        start = time.perf_counter()
+        run = self._attempt(vault, fn)
+        run.elapsed_s = time.perf_counter() - start
+        return run
+
+    def _attempt(self, vault: Path, fn: Callable[[Path], dict[str, Any]]) -> VaultRun:
+        lock_path: Path | None = None
+        try:
+            if self.lock:
+                lock_path = acquire_lock(vault)
+                if lock_path is None:
+                    return VaultRun(
+                        vault,
+                        EXIT_LOCKED,
+                        error="another vault-agent run holds the lock",
+                    )
+                with self._mutex:
+                    self.held_locks.add(lock_path)
+            payload = fn(vault)
+            return VaultRun(vault, EXIT_SUCCESS, payload)
+        except VaultExit as exc:
+            return VaultRun(vault, exc.exit_code, error=str(exc) or None)
+        except HookBlockedError as exc:
+            return VaultRun(vault, EXIT_HOOK_BLOCKED, error=str(exc))
+        except Exception as exc:  # noqa: BLE001 — one vault must not sink the batch
+            return VaultRun(vault, EXIT_RUNTIME_ERROR, error=str(exc))
+        finally:
+            if lock_path is not None:
+                with self._mutex:
+                    self.held_locks.discard(lock_path)
+                release_lock(lock_path)
+
+    def run(
+        self, vaults: Sequence[Path], fn: Callable[[Path], dict[str, Any]]
+    ) -> Iterator[VaultRun]:
+        """Run ``fn`` on every vault; yield each :class:`VaultRun` as it finishes."""
+        workers = min(self.max_workers, len(vaults)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._run_one, v, fn) for v in vaults]
+            for future in as_completed(futures):
+                yield future.result()
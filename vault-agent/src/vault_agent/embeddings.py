@@ -0,0 +1,248 @@
+"""Optional local embeddings for related-note suggestions.
+
+MOC curation and broken-link triage only have string similarity to go on
+(``difflib`` over basenames, BM25 in ``search.py``), so "which MOC should
+this orphan join" needs an LLM round-trip. With the ``embeddings`` extra
+installed (``uv sync --extra embeddings``: numpy + sentence-transformers),
+this module embeds every note once on the CPU and answers nearest-note
+questions with one matrix product.
+
+Vectors are cached in a compact float32 ``.npz`` per model and vault
+under ``$XDG_CACHE_HOME/vault-agent/embeddings/``, keyed by the digest of
+the text that was embedded (title + body). Only new or edited notes are
+re-embedded. Each save keeps only the digests of that vault's current
+notes, so edited and deleted notes don't accumulate, and vaults sharing a
+model never evict each other's vectors. All vectors are L2-normalized,
+so cosine similarity is a dot product.
+
+Nothing here is imported by the default code paths; callers get
+:class:`EmbeddingsUnavailable` when the extra is missing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from vault_agent.analyzers.vault_index import Note, VaultIndex
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Long notes are truncated before embedding; small CPU models only see the
+# first few hundred tokens anyway.
+_MAX_CHARS = 4000
+_BATCH_SIZE = 64
+
+
+class EmbeddingsUnavailable(ImportError):
+    """The ``embeddings`` extra (numpy + sentence-transformers) is not installed."""
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise EmbeddingsUnavailable(
+            "numpy is required for embeddings; install vault-agent[embeddings]"
+        ) from exc
+    return numpy
+
+
+class Embedder(Protocol):
+    """Anything that maps texts to an ``(n, dim)`` float32 array."""
+
+    name: str
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray: ...
+
+
+class SentenceTransformerEmbedder:
+    """CPU ``sentence-transformers`` model, loaded on first use."""
+
+    def __init__(self, name: str = DEFAULT_MODEL) -> None:
+        self.name = name
+        self._model: Any = None
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as exc:
+                raise EmbeddingsUnavailable(
+                    "sentence-transformers is required for embeddings; "
+                    "install vault-agent[embeddings]"
+                ) from exc
+            self._model = SentenceTransformer(self.name, device="cpu")
+        return self._model.encode(
+            list(texts), batch_size=_BATCH_SIZE, convert_to_numpy=True
+        )
+
+
+def note_text(note: Note) -> str:
+    """The text embedded for ``note``: its title, then the (truncated) body."""
+    return f"{note.basename}\n\n{note.body[:_MAX_CHARS]}"
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    np = _numpy()
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+# ---------------------------------------------------------------------------
+# Vector cache
+# ---------------------------------------------------------------------------
+
+
+def cache_path(model_name: str, vault_root: Path | str) -> Path:
+    """Cache file for ``model_name``'s vectors of the vault at ``vault_root``."""
+    root = Path(vault_root).expanduser().resolve()
+    base = os.environ.get("XDG_CACHE_HOME")
+    cache_root = Path(base).expanduser() if base else Path.home() / ".cache"
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name)
+    key = hashlib.sha256(str(root).encode()).hexdigest()[:16]
+    return cache_root / "vault-agent" / "embeddings" / slug / f"{key}.npz"
+
+
+def _load_vectors(path: Path) -> dict[str, np.ndarray]:
+    np = _numpy()
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            digests = data["digests"].tolist()
+            vectors = data["vectors"]
+    except (OSError, KeyError, ValueError):
+        return {}
+    return dict(zip(digests, vectors))
+
+
+def _save_vectors(path: Path, vectors: dict[str, np.ndarray]) -> None:
+    np = _numpy()
+    digests = sorted(vectors)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(
+            tmp,
+            digests=np.array(digests, dtype="U64"),
+            vectors=np.stack([vectors[d] for d in digests]).astype(np.float32),
+        )
+        tmp.replace(path)
+    except OSError as exc:
+        logger.debug("Embedding cache write to %s failed: %s", path, exc)
+
+
+# ---------------------------------------------------------------------------
+# Note embeddings
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class NoteEmbeddings:
+    """Normalized vectors for every note, row-aligned with ``rel_paths``."""
+
+    rel_paths: list[str]
+    matrix: np.ndarray  # (n_notes, dim) float32, L2-normalized
+
+    def __post_init__(self) -> None:
+        self._rows = {p: i for i, p in enumerate(self.rel_paths)}
+
+    def vector(self, rel_path: str) -> np.ndarray:
+        return self.matrix[self._rows[rel_path]]
+
+    def nearest(
+        self, query: np.ndarray, k: int = 5, *, exclude: Sequence[str] = ()
+    ) -> list[tuple[str, float]]:
+        """Top ``k`` notes by cosine similarity to ``query`` (a normalized vector)."""
+        np = _numpy()
+        scores = self.matrix @ query
+        for rel in exclude:
+            row = self._rows.get(rel)
+            if row is not None:
+                scores[row] = -np.inf
+        k = min(k, len(self.rel_paths) - len(exclude))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.rel_paths[i], float(scores[i])) for i in top]
+
+    def related(self, rel_path: str, k: int = 5) -> list[tuple[str, float]]:
+        """Top ``k`` notes most similar to the note at ``rel_path``."""
+        return self.nearest(self.vector(rel_path), k, exclude=(rel_path,))
+
+    def best_matches(
+        self, sources: Sequence[str], targets: Sequence[str], k: int = 3
+    ) -> dict[str, list[tuple[str, float]]]:
+        """For each source note, the ``k`` closest notes among ``targets``.
+
+        One ``(sources × targets)`` matrix product — the orphan → MOC
+        question for a whole vault.
+        """
+        np = _numpy()
+        if not sources or not targets:
+            return {}
+        src = self.matrix[[self._rows[p] for p in sources]]
+        tgt = self.matrix[[self._rows[p] for p in targets]]
+        scores = src @ tgt.T
+        k = min(k, len(targets))
+        order = np.argsort(-scores, axis=1)[:, :k]
+        return {
+            source: [(targets[j], float(scores[i, j])) for j in order[i]]
+            for i, source in enumerate(sources)
+        }
+
+
+def embed_vault(
+    index: VaultIndex,
+    embedder: Embedder | None = None,
+    *,
+    use_cache: bool = True,
+) -> NoteEmbeddings:
+    """Embed every note in ``index``, reusing cached vectors by text digest."""
+    np = _numpy()
+    embedder = embedder if embedder is not None else SentenceTransformerEmbedder()
+    path = cache_path(embedder.name, index.vault_root)
+    cached = _load_vectors(path) if use_cache else {}
+
+    texts = [note_text(note) for note in index.notes]
+    digests = [text_digest(t) for t in texts]
+    missing = {d: t for d, t in zip(digests, texts) if d not in cached}
+    if missing:
+        fresh = _normalize(embedder.encode(list(missing.values())))
+        cached.update(zip(missing, fresh))
+    if use_cache and digests:
+        # Stale digests are this vault's edited or deleted notes.
+        current = {d: cached[d] for d in digests}
+        if missing or len(current) < len(cached):
+            _save_vectors(path, current)
+
+    if digests:
+        matrix = np.stack([cached[d] for d in digests]).astype(np.float32)
+    else:
+        matrix = np.zeros((0, 0), dtype=np.float32)
+    return NoteEmbeddings(
+        rel_paths=[note.rel_path.as_posix() for note in index.notes],
+        matrix=matrix,
+    )
+
+
+def embed_query(text: str, embedder: Embedder) -> np.ndarray:
+    """Normalized vector for free text (e.g. a broken wikilink target)."""
+    return _normalize(embedder.encode([text]))[0]
@@ -4,15 +4,28 @@ These modules perform mechanical transformations that don't require
 judgment: strip a field, normalize a tag, remove an unrendered template
 marker. They're fast, idempotent, and safe to run inside a worktree.
 
+The frontmatter fixers are also exposed as ``Transform`` objects so
+``executor.run_fixers`` can apply several of them with one read and one
+write per file.
+
 The LLM-backed modes (vault-stubs, vault-mocs) handle the judgment cases.
 """
 
-from vault_agent.fixers.id_stripper import strip_legacy_id
-from vault_agent.fixers.tag_normalizer import normalize_tags
-from vault_agent.fixers.templater_cleaner import clean_templater_leakage
+from vault_agent.fixers.id_stripper import LEGACY_ID_TRANSFORM, strip_legacy_id
+from vault_agent.fixers.pipeline import PipelineResult, Transform
+from vault_agent.fixers.tag_normalizer import TAG_TRANSFORM, normalize_tags
+from vault_agent.fixers.templater_cleaner import (
+    TEMPLATER_TRANSFORM,
+    clean_templater_leakage,
+)
 
 __all__ = [
     "strip_legacy_id",
     "normalize_tags",
     "clean_templater_leakage",
+    "Transform",
+    "PipelineResult",
+    "LEGACY_ID_TRANSFORM",
+    "TAG_TRANSFORM",
+    "TEMPLATER_TRANSFORM",
 ]
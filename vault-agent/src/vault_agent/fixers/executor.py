@@ -0,0 +1,84 @@
+"""Run several frontmatter fixers over a thread pool, one read/write per file.
+
+``strip_legacy_id``, ``normalize_tags`` and ``clean_templater_leakage`` each
+load and save their targets on their own, so a note with all three problems
+is read and written three times, and every file is handled serially.
+
+``run_fixers`` groups the fixers' target lists by file instead. Each unique
+file is one task on a ``ThreadPoolExecutor`` that runs
+``pipeline.transform_file`` with just the transforms targeting it (in the
+order the fixers were given): load once, apply, save once if anything
+changed. Per-file work is independent, so the tasks touch disjoint files
+and need no locking.
+
+The result keeps each fixer's changed-path list, so callers can still emit
+one conventional commit per category. A file changed by two fixers carries
+both edits on disk; ``result.stages`` keeps its text after each fixer, so
+``lint`` can stage each category's intermediate text and keep every
+commit to its own category.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from vault_agent.fixers.pipeline import PipelineResult, Transform, transform_file
+from vault_agent.profiling import timed
+
+# Below this many files the pool costs more than it saves.
+_MIN_PARALLEL_FILES = 16
+
+
+@dataclass(frozen=True)
+class FixerSpec:
+    """One fixer category: its transform and the files it targets."""
+
+    transform: Transform
+    targets: list[Path]
+
+    @property
+    def category(self) -> str:
+        return self.transform.name
+
+
+@timed("fix.frontmatter")
+def run_fixers(
+    specs: list[FixerSpec], *, max_workers: int | None = None
+) -> PipelineResult:
+    """Apply every fixer to its own targets.
+
+    ``result.changed`` maps each category to its changed paths, listed in
+    the fixer's own target order; every category in ``specs`` is present,
+    possibly with an empty list.
+    """
+    per_file: dict[Path, list[Transform]] = {}
+    for spec in specs:
+        for path in dict.fromkeys(spec.targets):
+            per_file.setdefault(path, []).append(spec.transform)
+
+    files = list(per_file)
+    if len(files) < _MIN_PARALLEL_FILES or max_workers == 1:
+        outcomes = [transform_file(path, per_file[path]) for path in files]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            outcomes = list(
+                pool.map(lambda path: transform_file(path, per_file[path]), files)
+            )
+
+    changed_by_file = dict(zip(files, outcomes))
+    return PipelineResult(
+        changed={
+            spec.category: [
+                path
+                for path in dict.fromkeys(spec.targets)
+                if spec.category in changed_by_file[path]
+            ]
+            for spec in specs
+        },
+        written=[path for path, changed in changed_by_file.items() if changed],
+        stages={
+            path: stages for path, stages in changed_by_file.items() if len(stages) > 1
+        },
+    )
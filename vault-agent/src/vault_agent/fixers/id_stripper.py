@@ -10,7 +10,8 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
-from vault_agent.fixers._frontmatter_io import load, save
+from vault_agent.fixers._frontmatter_io import FrontmatterFile, load, save
+from vault_agent.fixers.pipeline import Transform
 
 _ID_LINE_RE = re.compile(r"^id:\s+.*$")
 
@@ -28,17 +29,26 @@ def _strip_id_from_lines(fm_lines: list[str]) -> tuple[list[str], bool]:
     return out, stripped
 
 
+def strip_legacy_id_in(ff: FrontmatterFile) -> bool:
+    """Remove ``id:`` from an already-loaded file, in memory. True if changed."""
+    if not ff.has_frontmatter:
+        return False
+    new_lines, was_stripped = _strip_id_from_lines(ff.fm_lines)
+    if was_stripped:
+        ff.fm_lines = new_lines
+    return was_stripped
+
+
+LEGACY_ID_TRANSFORM = Transform("frontmatter", strip_legacy_id_in)
+
+
 def strip_legacy_id(paths: list[Path]) -> list[Path]:
     """Remove ``id:`` from every given file. Returns the list actually changed."""
     changed: list[Path] = []
     for path in paths:
         ff = load(path)
-        if not ff.has_frontmatter:
-            continue
-        new_lines, was_stripped = _strip_id_from_lines(ff.fm_lines)
-        if not was_stripped:
+        if not strip_legacy_id_in(ff):
             continue
-        ff.fm_lines = new_lines
         save(ff)
         changed.append(path)
     return changed
@@ -21,6 +21,11 @@ For low-leverage broken targets the rule table doesn't cover (e.g.
     near-matches in the vault's basename index, returning
     ``(basename, ratio)`` tuples above a configurable cutoff.
 
+  * :func:`semantic_basename_candidates` — the same question answered by
+    embedding similarity when the optional ``embeddings`` extra is
+    installed. :func:`propose_rewrites` adds these to each proposal when
+    given an ``embedder``.
+
   * :class:`ConfidenceTier` + :func:`classify_match` — translate a
     similarity score into an action tier (auto / confirm / no-canonical)
     that the subagent uses to decide whether to rewrite, prompt, or
@@ -30,6 +35,7 @@ For low-leverage broken targets the rule table doesn't cover (e.g.
 from __future__ import annotations
 
 import difflib
+import logging
 import re
 from collections.abc import Mapping
 from dataclasses import dataclass, field
@@ -37,6 +43,16 @@ from enum import Enum
 from pathlib import Path
 
 from vault_agent.analyzers.vault_index import VaultIndex
+from vault_agent.embeddings import (
+    Embedder,
+    EmbeddingsUnavailable,
+    NoteEmbeddings,
+    embed_query,
+    embed_vault,
+)
+from vault_agent.profiling import timed
+
+logger = logging.getLogger(__name__)
 
 # Rule table: broken target → canonical target (e.g. ``{"OldTopic": "Topic"}``).
 # Empty by default — populate it per vault via ``VaultConfig.broken_link_rewrites``
@@ -87,6 +103,7 @@ def _applicable_rules(index: VaultIndex, table: dict[str, str]) -> dict[str, str
     return {old: new for old, new in table.items() if len(index.resolve(new)) == 1}
 
 
+@timed("fix.links")
 def apply_rewrites(
     index: VaultIndex, rules: dict[str, str] | None = None
 ) -> list[LinkPatchResult]:
@@ -113,6 +130,7 @@ def apply_rewrites(
     return results
 
 
+@timed("fix.kanban")
 def unqualify_kanban_links(index: VaultIndex) -> list[LinkPatchResult]:
     """Rewrite ``[[Kanban/X]]`` → ``[[X]]`` where ``X`` is a unique basename."""
     results: list[LinkPatchResult] = []
@@ -151,6 +169,11 @@ def summarize_rewrites(results: list[LinkPatchResult]) -> dict[str, int]:
     return totals
 
 
+def rule_paths(results: list[LinkPatchResult], rule: str) -> list[Path]:
+    """Files in which ``rule`` rewrote at least one link."""
+    return [r.path for r in results if r.per_rule_counts.get(rule)]
+
+
 # ---------------------------------------------------------------------------
 # #1073 — LLM-backed edge-case helpers
 # ---------------------------------------------------------------------------
@@ -232,6 +255,27 @@ def fuzzy_basename_candidates(
     return out
 
 
+def semantic_basename_candidates(
+    target: str,
+    embeddings: NoteEmbeddings,
+    embedder: Embedder,
+    *,
+    limit: int = 5,
+) -> list[BasenameMatch]:
+    """Nearest notes to ``target`` by embedding similarity (``embeddings`` extra).
+
+    Complements :func:`fuzzy_basename_candidates` for targets that are
+    spelled nothing like their canonical note (``[[CICD]]`` →
+    ``Continuous Delivery``). ``ratio`` holds the cosine similarity, which
+    is not on difflib's scale — don't feed these to :func:`classify_match`.
+    """
+    query = embed_query(target, embedder)
+    return [
+        BasenameMatch(basename=Path(rel).stem, ratio=score)
+        for rel, score in embeddings.nearest(query, limit)
+    ]
+
+
 def classify_match(target: str, candidates: list[BasenameMatch]) -> ConfidenceTier:
     """Map the top candidate's similarity to a :class:`ConfidenceTier`.
 
@@ -263,6 +307,8 @@ class RewriteProposal:
     reference_count: int  # how many wikilinks to this target exist
     candidates: list[BasenameMatch]  # sorted, top-N
     tier: ConfidenceTier
+    # Embedding neighbours (cosine similarity); empty without an embedder.
+    semantic_candidates: list[BasenameMatch] = field(default_factory=list)
 
     @property
     def top_canonical(self) -> str | None:
@@ -277,6 +323,10 @@ class RewriteProposal:
                 {"basename": c.basename, "ratio": round(c.ratio, 3)}
                 for c in self.candidates
             ],
+            "semantic_candidates": [
+                {"basename": c.basename, "similarity": round(c.ratio, 3)}
+                for c in self.semantic_candidates
+            ],
             "top_canonical": self.top_canonical,
         }
 
@@ -287,6 +337,7 @@ def propose_rewrites(
     *,
     min_references: int = 3,
     rewrites: Mapping[str, str] | None = None,
+    embedder: Embedder | None = None,
 ) -> list[RewriteProposal]:
     """Compute per-target :class:`RewriteProposal`s for LLM-tier triage.
 
@@ -296,6 +347,11 @@ def propose_rewrites(
     compute candidates + tier for each. Targets already covered by the
     rule table (``rewrites``, defaulting to :data:`BROKEN_LINK_REWRITES`)
     are skipped.
+
+    With an ``embedder`` each proposal also gets
+    :func:`semantic_basename_candidates`. They don't change the tier,
+    which stays on difflib's scale. Without the ``embeddings`` extra they
+    are left empty.
     """
     table = rewrites if rewrites is not None else BROKEN_LINK_REWRITES
     proposals: list[RewriteProposal] = []
@@ -314,4 +370,13 @@ def propose_rewrites(
                 tier=tier,
             )
         )
+    if proposals and embedder is not None:
+        try:
+            embeddings = embed_vault(index, embedder)
+            for proposal in proposals:
+                proposal.semantic_candidates = semantic_basename_candidates(
+                    proposal.target, embeddings, embedder
+                )
+        except EmbeddingsUnavailable as exc:
+            logger.debug("Skipping semantic candidates: %s", exc)
     return proposals
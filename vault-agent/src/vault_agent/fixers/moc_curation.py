@@ -13,6 +13,11 @@ primitives the subagent's prompt tells it to use before writing to a MOC.
     inside a section, preserving the existing sort order (alphabetical,
     inferred from the section's first 3 entries).
 
+  * ``insert_links`` / ``insert_links_in_file`` — the batch form: many
+    ``(heading, target)`` insertions into one MOC with a single parse,
+    a bisect merge per section, a single rebuild and (for the file
+    variant) a single write.
+
   * ``render_new_moc`` — compose a canonical new-MOC body from a
     proposal (title, intro, sections, per-section links).
 
@@ -23,9 +28,11 @@ primitives the subagent's prompt tells it to use before writing to a MOC.
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, NamedTuple
 
 
 NEW_MOC_FILENAME_TEMPLATE = "Zettelkasten/{subject} MOC.md"
@@ -121,6 +128,14 @@ def _is_alphabetical(targets: Iterable[str]) -> bool:
     return items == sorted(items)
 
 
+class LinkInsertion(NamedTuple):
+    """One link to add to a MOC section; plain ``(heading, target)`` tuples work too."""
+
+    heading: str
+    target: str
+    alias: str | None = None
+
+
 def insert_link_alphabetically(
     body: str, heading: str, new_target: str, *, alias: str | None = None
 ) -> str:
@@ -134,50 +149,120 @@ def insert_link_alphabetically(
     Raises ``ValueError`` if the section doesn't exist or if the body is
     dataview-generated.
     """
+    return insert_links(body, [LinkInsertion(heading, new_target, alias)])
+
+
+def insert_links(
+    body: str, insertions: Iterable[LinkInsertion | tuple[str, str]]
+) -> str:
+    """Insert many wikilinks into one MOC, parsing and rebuilding it once.
+
+    Same result as calling :func:`insert_link_alphabetically` for each
+    insertion in turn: links already in the section (or added earlier in
+    the batch) are skipped, alphabetical sections get each link at its
+    sorted position, other sections get them appended in the given order.
+
+    Validates every heading before changing anything, so a bad insertion
+    raises ``ValueError`` without a partial edit.
+    """
     if is_dataview_moc(body):
         raise ValueError("cannot insert into a dataview-generated MOC")
 
     structure = parse_moc_sections(body)
-    target_section = next((s for s in structure.sections if s.heading == heading), None)
-    if target_section is None:
-        raise ValueError(f"section {heading!r} not found in MOC")
-
-    wikilink = f"[[{new_target}|{alias}]]" if alias else f"[[{new_target}]]"
-
-    # Parse the section's body into lines so we can place the bullet.
-    body_lines = target_section.body.split("\n") if target_section.body else []
-    bullet = f"- {wikilink}"
-
-    # Already present?
-    if any(new_target in ln for ln in body_lines):
-        return body  # idempotent
-
-    # Decide placement.
-    if (
-        _is_alphabetical(target_section.wikilink_targets)
-        and target_section.wikilink_targets
-    ):
-        # Insert before the first bullet whose target sorts after ours.
-        inserted = False
-        new_lines: list[str] = []
-        for ln in body_lines:
-            m = _WIKILINK_RE.search(ln)
-            if not inserted and m and m.group(1).lower() > new_target.lower():
-                new_lines.append(bullet)
-                inserted = True
-            new_lines.append(ln)
-        if not inserted:
-            new_lines.append(bullet)
-        body_lines = new_lines
-    else:
-        body_lines.append(bullet)
-
-    new_section_body = "\n".join(body_lines).rstrip()
-    return _rebuild_moc(structure, heading, new_section_body)
-
-
-def _rebuild_moc(structure: MocStructure, replaced_heading: str, new_body: str) -> str:
-    """Reassemble a MOC body after editing one section."""
+    by_heading = {s.heading: s for s in structure.sections}
+    grouped: dict[str, list[LinkInsertion]] = {}
+    for item in insertions:
+        ins = LinkInsertion(*item)
+        if ins.heading not in by_heading:
+            raise ValueError(f"section {ins.heading!r} not found in MOC")
+        grouped.setdefault(ins.heading, []).append(ins)
+
+    new_bodies: dict[str, str] = {}
+    for heading, items in grouped.items():
+        section = by_heading[heading]
+        merged = _merge_section(section, items)
+        if merged != section.body:
+            new_bodies[heading] = merged
+    if not new_bodies:
+        return body
+    return _rebuild_moc(structure, new_bodies)
+
+
+def insert_links_in_file(
+    path: Path, insertions: Iterable[LinkInsertion | tuple[str, str]]
+) -> bool:
+    """Apply :func:`insert_links` to the MOC at ``path``; write once if changed."""
+    body = path.read_text(encoding="utf-8")
+    updated = insert_links(body, insertions)
+    if updated == body:
+        return False
+    path.write_text(updated, encoding="utf-8")
+    return True
+
+
+def _merge_section(section: MocSection, items: list[LinkInsertion]) -> str:
+    """New body for ``section`` with ``items`` merged in (see ``insert_links``)."""
+    body_lines = section.body.split("\n") if section.body else []
+    seen = section.body
+    bullets: list[tuple[str, str]] = []  # (target, bullet) not yet present
+    for ins in items:
+        if ins.target in seen:
+            continue  # idempotent, as in insert_link_alphabetically
+        wikilink = f"[[{ins.target}|{ins.alias}]]" if ins.alias else f"[[{ins.target}]]"
+        bullet = f"- {wikilink}"
+        bullets.append((ins.target, bullet))
+        seen += "\n" + bullet
+    if not bullets:
+        return section.body
+
+    # An empty section turns alphabetical after its first link, so only a
+    # populated, unsorted section falls back to appending.
+    targets = section.wikilink_targets
+    if targets and not _is_alphabetical(targets):
+        body_lines.extend(bullet for _, bullet in bullets)
+        return "\n".join(body_lines).rstrip()
+
+    # Sort keys of the lines that carry a link, in document order (sorted,
+    # since the section is alphabetical). A new bullet goes before the
+    # first line whose key sorts after it, so bisect_right picks its gap
+    # among the existing lines; within a gap, _place applies the same rule
+    # to the bullets already queued there.
+    keyed: list[int] = []
+    keys: list[str] = []
+    for i, ln in enumerate(body_lines):
+        m = _WIKILINK_RE.search(ln)
+        if m:
+            keyed.append(i)
+            keys.append(m.group(1).lower())
+
+    before: dict[int, list[str]] = {}
+    tail: list[str] = []
+    for target, bullet in bullets:
+        j = bisect_right(keys, target.lower())
+        gap = before.setdefault(keyed[j], []) if j < len(keys) else tail
+        _place(gap, target, bullet)
+
+    out: list[str] = []
+    for i, ln in enumerate(body_lines):
+        out.extend(before.get(i, ()))
+        out.append(ln)
+    out.extend(tail)
+    return "\n".join(out).rstrip()
+
+
+def _place(lines: list[str], target: str, bullet: str) -> None:
+    """Insert ``bullet`` before the first line whose link sorts after ``target``."""
+    key = target.lower()
+    for i, ln in enumerate(lines):
+        m = _WIKILINK_RE.search(ln)
+        if m and m.group(1).lower() > key:
+            lines.insert(i, bullet)
+            return
+    lines.append(bullet)
+
+
+def _rebuild_moc(structure: MocStructure, new_bodies: Mapping[str, str]) -> str:
+    """Reassemble a MOC body, replacing the bodies of the sections in ``new_bodies``."""
     parts: list[str] = []
     if structure.frontmatter:
         parts.append(structure.frontmatter.rstrip() + "\n")
@@ -185,7 +270,7 @@ def _rebuild_moc(structure: MocStructure, replaced_heading: str, new_body: str)
         parts.append(structure.preamble.rstrip() + "\n\n")
     for section in structure.sections:
         parts.append(f"## {section.heading}\n")
-        body = new_body if section.heading == replaced_heading else section.body
+        body = new_bodies.get(section.heading, section.body)
         if body:
             parts.append(body.rstrip() + "\n")
         parts.append("\n")
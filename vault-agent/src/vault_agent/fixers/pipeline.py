@@ -0,0 +1,61 @@
+"""Compose frontmatter fixers as transforms over a loaded ``FrontmatterFile``.
+
+A :class:`Transform` is a named in-memory edit: it mutates a loaded file
+and reports whether it changed anything. It never touches the disk.
+:func:`transform_file` loads a file once, applies its transforms in
+order, and writes once if any of them changed the file. It returns the
+text right after each transform that changed the file, so callers can
+still write one commit per category, each with only its own edit.
+
+The fixer modules each export their transform (``LEGACY_ID_TRANSFORM``,
+``TAG_TRANSFORM``, ``TEMPLATER_TRANSFORM``). ``executor.run_fixers`` runs
+``transform_file`` over every file the fixers target and collects the
+per-transform changes into a :class:`PipelineResult`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from vault_agent.fixers._frontmatter_io import FrontmatterFile, load, save
+
+
+@dataclass(frozen=True)
+class Transform:
+    """A named in-memory edit of a loaded note."""
+
+    name: str
+    # Mutates the loaded file in place; returns True if anything changed.
+    apply: Callable[[FrontmatterFile], bool]
+
+
+@dataclass
+class PipelineResult:
+    """Which transforms changed which files, and which files were written.
+
+    ``stages`` holds, for each file changed by more than one transform,
+    its text right after each of those transforms (transform name → text,
+    in application order). The last entry is what was written.
+    """
+
+    changed: dict[str, list[Path]] = field(default_factory=dict)
+    written: list[Path] = field(default_factory=list)
+    stages: dict[Path, dict[str, str]] = field(default_factory=dict)
+
+    def count(self, name: str) -> int:
+        return len(self.changed.get(name, []))
+
+
+def transform_file(path: Path, transforms: Iterable[Transform]) -> dict[str, str]:
+    """Load ``path`` once, apply ``transforms``, save once if anything changed.
+
+    Returns the file's text after each transform that changed it, keyed
+    by transform name in application order.
+    """
+    ff = load(path)
+    stages = {t.name: ff.join() for t in transforms if t.apply(ff)}
+    if stages:
+        save(ff)
+    return stages
@@ -33,6 +33,7 @@ from pathlib import Path
 from vault_agent.analyzers.stubs import StubClass, analyze_stubs
 from vault_agent.analyzers.vault_index import VaultIndex
 from vault_agent.config import DEFAULT_CONFIG, VaultConfig
+from vault_agent.profiling import timed
 
 
 CANONICAL_REDIRECT_TEMPLATE = """---
@@ -165,6 +166,7 @@ class StubRewriteResult:
     previous_size: int
 
 
+@timed("fix.stubs")
 def rewrite_broken_redirects(
     index: VaultIndex, config: VaultConfig = DEFAULT_CONFIG
 ) -> list[StubRewriteResult]:
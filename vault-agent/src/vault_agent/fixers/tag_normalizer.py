@@ -25,7 +25,8 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
-from vault_agent.fixers._frontmatter_io import load, save
+from vault_agent.fixers._frontmatter_io import FrontmatterFile, load, save
+from vault_agent.fixers.pipeline import Transform
 
 # Bare placeholder tags — no-ops we want to drop.
 BARE_PLACEHOLDERS: frozenset[str] = frozenset({"📝", "🌱", "📝/🌱"})
@@ -201,34 +202,39 @@ def _normalize_fm_lines(lines: list[str]) -> tuple[list[str], int, int, int]:
     return out, p, r, n
 
 
+def normalize_tags_in(ff: FrontmatterFile) -> TagFixResult:
+    """Normalize the tag list of an already-loaded file, in memory."""
+    if not ff.has_frontmatter:
+        return TagFixResult(
+            path=ff.path,
+            changed=False,
+            removed_placeholders=0,
+            rewrites=0,
+            removed_nulls=0,
+        )
+    new_lines, p, r, n = _normalize_fm_lines(ff.fm_lines)
+    changed = p + r + n > 0 or new_lines != ff.fm_lines
+    if changed:
+        ff.fm_lines = new_lines
+    return TagFixResult(
+        path=ff.path,
+        changed=changed,
+        removed_placeholders=p,
+        rewrites=r,
+        removed_nulls=n,
+    )
+
+
+TAG_TRANSFORM = Transform("tags", lambda ff: normalize_tags_in(ff).changed)
+
+
 def normalize_tags(paths: list[Path]) -> list[TagFixResult]:
     """Normalize tag lists in each file. Returns per-file results."""
     results: list[TagFixResult] = []
     for path in paths:
         ff = load(path)
-        if not ff.has_frontmatter:
-            results.append(
-                TagFixResult(
-                    path=path,
-                    changed=False,
-                    removed_placeholders=0,
-                    rewrites=0,
-                    removed_nulls=0,
-                )
-            )
-            continue
-        new_lines, p, r, n = _normalize_fm_lines(ff.fm_lines)
-        changed = p + r + n > 0 or new_lines != ff.fm_lines
-        if changed:
-            ff.fm_lines = new_lines
+        result = normalize_tags_in(ff)
+        if result.changed:
             save(ff)
-        results.append(
-            TagFixResult(
-                path=path,
-                changed=changed,
-                removed_placeholders=p,
-                rewrites=r,
-                removed_nulls=n,
-            )
-        )
+        results.append(result)
     return results
@@ -13,12 +13,20 @@ up front:
 
 Pure-Python so it can be unit-tested without the SDK. The function's
 shape matches ``claude_agent_sdk.HookMatcher`` expectations.
+
+``validate_tool_use`` runs on every tool call of a session, so each rule
+set is compiled once at import into a single alternation (one regex per
+tool: protected path segments, blocked git invocations, ``rm -rf``, the
+rm allowlist) and decisions are memoized per command / path string —
+agents repeat the same ``git status`` or ``Edit`` target many times.
+``scripts/bench_safety.py`` replays a session's worth of tool inputs.
 """
 
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 SAFETY_HOOK_NAME = "vault-agent-safety"
@@ -57,6 +65,32 @@ _BLOCKED_BASH_PATTERNS: tuple[re.Pattern[str], ...] = (
 _RM_RF_RE = re.compile(r"\brm\s+-[a-zA-Z]*r[a-zA-Z]*f\b|\brm\s+-[a-zA-Z]*f[a-zA-Z]*r\b")
 
 
+def _alternation(words: frozenset[str]) -> str:
+    return "|".join(re.escape(w) for w in sorted(words))
+
+
+# Compiled rule table. Each blocked-bash pattern is a named group so one
+# ``search`` both detects a hit and tells us which rule fired.
+_BLOCKED_BASH_RE = re.compile(
+    "|".join(f"(?P<r{i}>{p.pattern})" for i, p in enumerate(_BLOCKED_BASH_PATTERNS))
+)
+_BLOCKED_BASH_BY_GROUP: dict[str, str] = {
+    f"r{i}": p.pattern for i, p in enumerate(_BLOCKED_BASH_PATTERNS)
+}
+# A whole protected segment: preceded by start or "/", followed by "/" or end.
+_PROTECTED_SEGMENT_RE = re.compile(
+    rf"(?:^|/)({_alternation(PROTECTED_DIR_SEGMENTS | PROTECTED_TOP_DIRS)})(?=/|$)"
+)
+# ``/seg/`` anywhere, ``/seg`` at the very end, or `` seg/`` after a space.
+_RM_RF_ALLOW_RE = re.compile(
+    rf"/(?:{_alternation(RM_RF_ALLOWLIST_SEGMENTS)})(?:/|\Z)"
+    rf"| (?:{_alternation(RM_RF_ALLOWLIST_SEGMENTS)})/"
+)
+
+# Memo size for per-string decisions; a session has far fewer distinct inputs.
+_DECISION_CACHE_SIZE = 4096
+
+
 @dataclass(frozen=True)
 class SafetyDecision:
     """Result of a hook evaluation."""
@@ -66,13 +100,17 @@ class SafetyDecision:
 
     @classmethod
     def ok(cls) -> "SafetyDecision":
-        return cls(allow=True, reason="")
+        return _ALLOW
 
     @classmethod
     def block(cls, reason: str) -> "SafetyDecision":
         return cls(allow=False, reason=reason)
 
 
+# Decisions are immutable, so every "allow" can share one instance.
+_ALLOW = SafetyDecision(allow=True, reason="")
+
+
 # ---------------------------------------------------------------------------
 # Path helpers
 # ---------------------------------------------------------------------------
@@ -80,25 +118,15 @@ class SafetyDecision:
 
 def _path_touches_protected(path: str) -> str | None:
     """Return the offending segment if ``path`` is under a protected dir."""
-    parts = [p for p in path.replace("\\", "/").split("/") if p and p != "."]
-    for segment in parts:
-        if segment in PROTECTED_DIR_SEGMENTS or segment in PROTECTED_TOP_DIRS:
-            return segment
-    return None
+    match = _PROTECTED_SEGMENT_RE.search(path.replace("\\", "/"))
+    return match.group(1) if match else None
 
 
 def _rm_rf_allowed(command: str) -> bool:
     """True if every rm target is inside the allowlist."""
     # Very cheap: require that at least one allowlisted segment appears
     # after the rm invocation. Not a full shell parser, but conservative.
-    for seg in RM_RF_ALLOWLIST_SEGMENTS:
-        if (
-            f"/{seg}/" in command
-            or command.endswith(f"/{seg}")
-            or f" {seg}/" in command
-        ):
-            return True
-    return False
+    return _RM_RF_ALLOW_RE.search(command) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -108,32 +136,42 @@ def _rm_rf_allowed(command: str) -> bool:
 
 def _check_file_write(tool_input: dict[str, Any]) -> SafetyDecision:
     """Block writes to protected paths. Handles Write / Edit / NotebookEdit."""
-    candidates = [
-        tool_input.get("file_path"),
-        tool_input.get("notebook_path"),
-    ]
-    for raw in candidates:
+    for key in ("file_path", "notebook_path"):
+        raw = tool_input.get(key)
         if not raw:
             continue
-        offending = _path_touches_protected(str(raw))
-        if offending:
-            return SafetyDecision.block(
-                f"refusing to write under protected path segment '{offending}' ({raw})"
-            )
+        decision = _path_decision(str(raw))
+        if not decision.allow:
+            return decision
+    return SafetyDecision.ok()
+
+
+@lru_cache(maxsize=_DECISION_CACHE_SIZE)
+def _path_decision(raw: str) -> SafetyDecision:
+    offending = _path_touches_protected(raw)
+    if offending:
+        return SafetyDecision.block(
+            f"refusing to write under protected path segment '{offending}' ({raw})"
+        )
     return SafetyDecision.ok()
 
 
 def _check_bash(tool_input: dict[str, Any]) -> SafetyDecision:
     """Block destructive bash invocations."""
-    command = str(tool_input.get("command", "") or "")
+    return _bash_decision(str(tool_input.get("command", "") or ""))
+
+
+@lru_cache(maxsize=_DECISION_CACHE_SIZE)
+def _bash_decision(command: str) -> SafetyDecision:
     if not command.strip():
         return SafetyDecision.ok()
 
-    for pat in _BLOCKED_BASH_PATTERNS:
-        if pat.search(command):
-            return SafetyDecision.block(
-                f"blocked destructive git invocation: {pat.pattern}"
-            )
+    blocked = _BLOCKED_BASH_RE.search(command)
+    if blocked:
+        return SafetyDecision.block(
+            "blocked destructive git invocation: "
+            f"{_BLOCKED_BASH_BY_GROUP[blocked.lastgroup]}"
+        )
 
     if _RM_RF_RE.search(command):
         if not _rm_rf_allowed(command):
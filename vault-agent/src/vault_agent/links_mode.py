@@ -19,6 +19,7 @@ from vault_agent.analyzers.audit import VaultAudit, run_audit
 from vault_agent.analyzers.vault_index import VaultIndex, scan
 from vault_agent.fixers.link_patcher import (
     apply_rewrites,
+    rule_paths,
     summarize_rewrites,
     unqualify_kanban_links,
 )
@@ -85,7 +86,7 @@ def _translate_worktree(
     return scan(handle.worktree_path)
 
 
-def run_links(vault: Path, *, apply: bool = False) -> LinksResult:
+def run_links(vault: Path, *, apply: bool = False, sparse: bool = False) -> LinksResult:
     vault = Path(vault).expanduser().resolve()
     audit = run_audit(vault)
     plan = plan_links(audit)
@@ -95,7 +96,7 @@ def run_links(vault: Path, *, apply: bool = False) -> LinksResult:
             dry_run=True, plan=plan, audit=audit, handle=None, commits=[]
         )
 
-    handle = enter_worktree(vault)
+    handle = enter_worktree(vault, sparse=sparse)
     # Re-scan inside the worktree so fixers write to the worktree's copies.
     wt_index = _translate_worktree(handle, vault, audit.index)
     commits: list[str] = []
@@ -106,17 +107,18 @@ def run_links(vault: Path, *, apply: bool = False) -> LinksResult:
     for rule, count in totals.items():
         new = plan.rewrites_available[rule]
         msg = f"fix(links): rewrite {count} × [[{rule}]] → [[{new}]]"
-        if commit_all(handle, msg):
+        if commit_all(handle, msg, paths=rule_paths(results, rule)):
             commits.append(msg)
 
     # Pass 2: Kanban unqualification
     # Re-scan (previous pass modified files).
     wt_index = scan(handle.worktree_path)
     kanban_results = unqualify_kanban_links(wt_index)
-    changed_count = sum(1 for r in kanban_results if r.changed)
+    changed_paths = [r.path for r in kanban_results if r.changed]
+    changed_count = len(changed_paths)
     if changed_count:
         msg = f"fix(links): unqualify [[Kanban/X]] → [[X]] in {changed_count} notes"
-        if commit_all(handle, msg):
+        if commit_all(handle, msg, paths=changed_paths):
             commits.append(msg)
 
     return LinksResult(
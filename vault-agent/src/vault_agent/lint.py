@@ -16,9 +16,10 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from vault_agent.analyzers.audit import VaultAudit, run_audit
-from vault_agent.fixers.id_stripper import strip_legacy_id
-from vault_agent.fixers.tag_normalizer import normalize_tags
-from vault_agent.fixers.templater_cleaner import clean_templater_leakage
+from vault_agent.fixers.executor import FixerSpec, run_fixers
+from vault_agent.fixers.id_stripper import LEGACY_ID_TRANSFORM
+from vault_agent.fixers.tag_normalizer import TAG_TRANSFORM
+from vault_agent.fixers.templater_cleaner import TEMPLATER_TRANSFORM
 from vault_agent.orchestrator import commit_all, enter_worktree
 from vault_agent.worktree import (
     WorktreeHandle,
@@ -26,6 +27,13 @@ from vault_agent.worktree import (
     worktree_file_change_count,
 )
 
+# Transform name → conventional-commit message (``{n}`` = changed-note count).
+_COMMIT_MESSAGES: dict[str, str] = {
+    LEGACY_ID_TRANSFORM.name: "fix(frontmatter): remove legacy id: field from {n} notes",
+    TAG_TRANSFORM.name: "fix(tags): normalize bare 📝/🌱/🗺️/null in {n} notes",
+    TEMPLATER_TRANSFORM.name: "fix(templates): remove Templater leakage from {n} notes",
+}
+
 
 @dataclass
 class LintPlan:
@@ -76,77 +84,72 @@ def _translate_paths(
 
 def plan_lint(audit: VaultAudit) -> LintPlan:
     fm = audit.frontmatter
+    # Also include notes whose tag frequency map has the legacy MOC tag.
+    # (The frontmatter analyzer records these under tag_frequency.)
+    legacy_moc_candidates: list[Path] = []
+    for note in audit.index.notes:
+        if any(t in ("🗺️", "🗺") for t in note.tags):
+            legacy_moc_candidates.append(note.path)
     return LintPlan(
         legacy_id=list(fm.notes_with_legacy_id),
         # tag_issues: any note with bare placeholder, null, or legacy 🗺️
         tag_issues=sorted(
-            set(fm.notes_with_bare_placeholder) | set(fm.notes_with_null_tags)
-            # legacy-tag candidates come from the tag frequency map
+            set(fm.notes_with_bare_placeholder)
+            | set(fm.notes_with_null_tags)
+            | set(legacy_moc_candidates)
         ),
         templater=list(fm.notes_with_templater_leak),
     )
 
 
-def run_lint(vault: Path, *, apply: bool = False) -> LintResult:
-    """Run lint. In ``apply=False`` mode, returns plan + empty commits."""
+def apply_lint_plan(handle: WorktreeHandle, vault: Path, plan: LintPlan) -> list[str]:
+    """Run the three fixers inside ``handle``'s worktree; one commit per category.
+
+    The fixers run together through ``run_fixers`` so a note targeted by
+    several of them is read and written once, with all of its edits. Each
+    commit still holds only its own category's edits: for such a note,
+    every category but the last stages the text it had right after that
+    category's fixer (``result.stages``). Returns the subjects of the
+    commits actually made, in category order.
+    """
+    specs = [
+        FixerSpec(LEGACY_ID_TRANSFORM, _translate_paths(handle, vault, plan.legacy_id)),
+        FixerSpec(TAG_TRANSFORM, _translate_paths(handle, vault, plan.tag_issues)),
+        FixerSpec(TEMPLATER_TRANSFORM, _translate_paths(handle, vault, plan.templater)),
+    ]
+    result = run_fixers(specs)
+
+    commits: list[str] = []
+    for category, template in _COMMIT_MESSAGES.items():
+        paths = result.changed[category]
+        if not paths:
+            continue
+        # Notes a later category also changed: commit this category's state.
+        contents = {
+            p: stages[category]
+            for p in paths
+            if (stages := result.stages.get(p)) and list(stages)[-1] != category
+        }
+        message = template.format(n=len(paths))
+        if commit_all(handle, message, paths=paths, contents=contents):
+            commits.append(message)
+    return commits
+
+
+def run_lint(vault: Path, *, apply: bool = False, sparse: bool = False) -> LintResult:
+    """Run lint. In ``apply=False`` mode, returns plan + empty commits.
+
+    ``sparse`` creates the worktree with markdown only checked out.
+    """
     vault = Path(vault).expanduser().resolve()
     audit = run_audit(vault)
     plan = plan_lint(audit)
 
-    # Also include notes whose tag frequency map has the legacy MOC tag.
-    # (The frontmatter analyzer records these under tag_frequency.)
-    legacy_moc_candidates: list[Path] = []
-    for note in audit.index.notes:
-        if any(t in ("🗺️", "🗺") for t in note.tags):
-            legacy_moc_candidates.append(note.path)
-    # Merge into tag_issues without introducing duplicates.
-    merged = sorted({*plan.tag_issues, *legacy_moc_candidates})
-    plan = LintPlan(
-        legacy_id=plan.legacy_id,
-        tag_issues=merged,
-        templater=plan.templater,
-    )
-
     if not apply:
         return LintResult(dry_run=True, plan=plan, audit=audit, handle=None, commits=[])
 
-    handle = enter_worktree(vault)
-    commits: list[str] = []
-
-    # 1) Strip legacy id
-    targets = _translate_paths(handle, vault, plan.legacy_id)
-    changed = strip_legacy_id(targets)
-    if changed and commit_all(
-        handle,
-        f"fix(frontmatter): remove legacy id: field from {len(changed)} notes",
-    ):
-        commits.append(
-            f"fix(frontmatter): remove legacy id: field from {len(changed)} notes"
-        )
-
-    # 2) Tags normalization
-    targets = _translate_paths(handle, vault, plan.tag_issues)
-    results = normalize_tags(targets)
-    changed_count = sum(1 for r in results if r.changed)
-    if changed_count and commit_all(
-        handle,
-        f"fix(tags): normalize bare 📝/🌱/🗺️/null in {changed_count} notes",
-    ):
-        commits.append(
-            f"fix(tags): normalize bare 📝/🌱/🗺️/null in {changed_count} notes"
-        )
-
-    # 3) Templater cleanup
-    targets = _translate_paths(handle, vault, plan.templater)
-    results_t = clean_templater_leakage(targets)
-    changed_count = sum(1 for r in results_t if r.changed)
-    if changed_count and commit_all(
-        handle,
-        f"fix(templates): remove Templater leakage from {changed_count} notes",
-    ):
-        commits.append(
-            f"fix(templates): remove Templater leakage from {changed_count} notes"
-        )
+    handle = enter_worktree(vault, sparse=sparse)
+    commits = apply_lint_plan(handle, vault, plan)
 
     return LintResult(
         dry_run=False, plan=plan, audit=audit, handle=handle, commits=commits
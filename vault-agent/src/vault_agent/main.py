@@ -14,6 +14,8 @@ from rich.console import Console
 
 from . import __version__
 from .analyzers.audit import run_audit
+from .batch import DEFAULT_MAX_WORKERS, BatchRunner, VaultExit, batch_exit_code
+from .embeddings import EmbeddingsUnavailable
 from .lint import render_apply as render_lint_apply
 from .lint import render_dry_run as render_lint_dry_run
 from .lint import run_lint
@@ -33,7 +35,9 @@ from .non_interactive import (
     NonInteractiveConfig,
     NonInteractiveUsageError,
 )
+from .profiling import cprofile_to, profiled, stage
 from .reporting import render_json, render_markdown, render_terminal
+from .search import load_or_build as load_search_index
 from .stubs_mode import render_apply as render_stubs_apply
 from .stubs_mode import render_dry_run as render_stubs_dry_run
 from .stubs_mode import run_stubs
@@ -218,6 +222,8 @@ def _run_write_mode(
     action: Callable[[], Any],
     summary_payload: Callable[[Any], dict[str, Any]],
     render: Callable[[Any], str],
+    profile: bool = False,
+    profile_out: Optional[Path] = None,
 ) -> None:
     """Shared runner: lock → signals → action → render → summary → release.
 
@@ -229,6 +235,10 @@ def _run_write_mode(
     The lock is only acquired for write runs (``apply and ni is not None``):
     the lock exists to prevent two scheduled jobs from racing on the same
     worktree, which is irrelevant in dry-run or interactive use.
+
+    ``profile`` records per-stage timings (see ``profiling.py``) and adds
+    them to the summary as ``profile``; ``profile_out`` also dumps
+    ``cProfile`` stats for ``action`` — the deterministic phase — there.
     """
     lock_path: Optional[Path] = None
     cleanup_token = None
@@ -250,24 +260,22 @@ def _run_write_mode(
         cleanup_token = _install_cleanup_handler(_cleanup)
 
     try:
-        result = action()
-        typer.echo(render(result))
-
-        # Hand off to the SDK for the LLM-backed portion when applicable.
-        # The deterministic path has already committed its fixes; the SDK
-        # works in the same worktree on top of those commits.
-        sdk_result = _maybe_run_sdk(
-            mode=mode, vault=vault, apply=apply, result=result, ni=ni
-        )
-
-        payload = {"mode": mode, **summary_payload(result)}
-        if sdk_result is not None:
-            payload["sdk_ran"] = True
-            payload["sdk_commits"] = sdk_result.commits_made
-            payload["sdk_files_changed"] = sdk_result.files_changed
-            if sdk_result.report_section:
-                typer.echo("")
-                typer.echo(sdk_result.report_section)
+        with profiled(profile or profile_out is not None) as prof:
+            with cprofile_to(profile_out):
+                result = action()
+            typer.echo(render(result))
+            payload = _finish_mode(
+                mode=mode,
+                vault=vault,
+                apply=apply,
+                ni=ni,
+                result=result,
+                summary_payload=summary_payload,
+            )
+        if prof is not None:
+            payload["profile"] = prof.to_dict()
+            if log_format != "json":
+                typer.echo(prof.render(), err=True)
         _emit_summary(payload, log_format)
     except LockedError as exc:
         console.print(f"[yellow]{exc}[/yellow]")
@@ -289,6 +297,79 @@ def _run_write_mode(
         release_lock(lock_path)
 
 
+def _finish_mode(
+    *,
+    mode: str,
+    vault: Path,
+    apply: bool,
+    ni: Optional[NonInteractiveConfig],
+    result: Any,
+    summary_payload: Callable[[Any], dict[str, Any]],
+    echo_report: bool = True,
+) -> dict[str, Any]:
+    """Run the SDK pass if needed and build the run's summary payload."""
+    # Hand off to the SDK for the LLM-backed portion when applicable.
+    # The deterministic path has already committed its fixes; the SDK
+    # works in the same worktree on top of those commits.
+    sdk_result = _maybe_run_sdk(
+        mode=mode, vault=vault, apply=apply, result=result, ni=ni
+    )
+
+    payload = {"mode": mode, **summary_payload(result)}
+    if sdk_result is not None:
+        payload["sdk_ran"] = True
+        payload["sdk_commits"] = sdk_result.commits_made
+        payload["sdk_files_changed"] = sdk_result.files_changed
+        if sdk_result.report_section and echo_report:
+            typer.echo("")
+            typer.echo(sdk_result.report_section)
+    return payload
+
+
+def _single_vault(vaults: list[Path]) -> Path:
+    """The one vault of a non-batch run; several need ``--vaults``."""
+    if len(vaults) != 1:
+        console.print(
+            "[red]Error:[/red] several vaults given; pass [bold]--vaults[/bold] "
+            "to run them as a batch."
+        )
+        raise typer.Exit(code=EXIT_CONFIG_ERROR)
+    return vaults[0]
+
+
+def _run_batch(
+    vaults: list[Path],
+    fn: Callable[[Path], dict[str, Any]],
+    *,
+    lock: bool,
+    jobs: int,
+) -> None:
+    """Run ``fn`` over ``vaults`` in one process; print one JSON line per vault.
+
+    Exits with the highest per-vault exit code (0 when every vault succeeded).
+    """
+    runner = BatchRunner(lock=lock, max_workers=jobs)
+
+    def _task(vault: Path) -> dict[str, Any]:
+        try:
+            return fn(vault)
+        except typer.Exit as exc:
+            # Per-vault validation (_ensure_vault etc.) already printed why.
+            raise VaultExit(exc.exit_code) from exc
+
+    cleanup_token = _install_cleanup_handler(runner.release_all)
+    runs = []
+    try:
+        for run in runner.run(vaults, _task):
+            runs.append(run)
+            _emit_summary(run.to_dict(), "json")
+    finally:
+        _restore_handlers(cleanup_token)
+    code = batch_exit_code(runs)
+    if code:
+        raise typer.Exit(code=code)
+
+
 def _handle_result(handle) -> dict[str, Any]:
     """Extract branch / commits / files from a worktree handle, if present."""
     if handle is None:
@@ -347,7 +428,8 @@ def _maybe_run_sdk(
         )
 
     try:
-        return asyncio.run(_go())
+        with stage("sdk"):
+            return asyncio.run(_go())
     except ImportError:
         # SDK not installed — deterministic-only run. Not an error in
         # pure-Python deployments.
@@ -362,10 +444,35 @@ def _maybe_run_sdk(
 
 @app.command()
 def analyze(
-    vault: Path = typer.Argument(..., exists=True, file_okay=False, dir_okay=True),
+    vault: list[Path] = typer.Argument(
+        ..., exists=True, file_okay=False, dir_okay=True
+    ),
     format: str = typer.Option("text", "--format", help="text | json | markdown"),
+    batch: bool = typer.Option(
+        False,
+        "--vaults",
+        help="Analyze every VAULT argument in one process; one JSON line per vault.",
+    ),
+    jobs: int = typer.Option(
+        DEFAULT_MAX_WORKERS, "--jobs", "-j", help="Worker threads for --vaults."
+    ),
 ) -> None:
     """Run all read-only analyzers and emit a report. No LLM."""
+    if batch:
+
+        def _analyze_one(path: Path) -> dict[str, Any]:
+            _ensure_vault(path)
+            audit = run_audit(path)
+            return {
+                "mode": "analyze",
+                "total_notes": audit.frontmatter.total_notes,
+                "health": audit.health.to_dict(),
+            }
+
+        _run_batch(vault, _analyze_one, lock=False, jobs=jobs)
+        return
+
+    vault = _single_vault(vault)
     _ensure_vault(vault)
     audit = run_audit(vault)
     if format == "json":
@@ -405,6 +512,25 @@ def report(
         typer.echo(render_markdown(audit))
 
 
+@app.command()
+def search(
+    vault: Path = typer.Argument(..., exists=True, file_okay=False, dir_okay=True),
+    query: str = typer.Argument(..., help="Free-text query."),
+    limit: int = typer.Option(10, "--limit", "-n", help="Maximum results."),
+    format: str = typer.Option("text", "--format", help="text | json"),
+) -> None:
+    """Rank notes by BM25 relevance (titles, tags, bodies). No LLM."""
+    _ensure_vault(vault)
+    hits = load_search_index(vault).search(query, limit=limit)
+    if format == "json":
+        typer.echo(json.dumps([h.to_dict() for h in hits], indent=2))
+        return
+    if not hits:
+        console.print("[dim]No matches.[/dim]")
+    for hit in hits:
+        console.print(f"{hit.score:7.2f}  {hit.rel_path}")
+
+
 @app.command()
 def lint(
     vault: Path = typer.Argument(..., exists=True, file_okay=False, dir_okay=True),
@@ -426,6 +552,25 @@ def lint(
         "--log-format",
         help="Output format: text, json, plain. Default: plain when not a TTY.",
     ),
+    sparse: bool = typer.Option(
+        False,
+        "--sparse",
+        help="Check out only markdown in the worktree (skips Files/ and other "
+        "non-note trees); faster on vaults with large attachments. Sets "
+        "extensions.worktreeConfig=true in the vault repo's git config.",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record per-stage wall/CPU time and peak memory; added to the "
+        "--log-format json summary as 'profile'.",
+    ),
+    profile_out: Optional[Path] = typer.Option(
+        None,
+        "--profile-out",
+        help="Also write cProfile stats for the deterministic phase to this "
+        "file (implies --profile).",
+    ),
 ) -> None:
     """Mechanical fixes: bare emoji tags, legacy id:, Templater leakage."""
     _ensure_vault(vault)
@@ -439,10 +584,12 @@ def lint(
     )
     _run_write_mode(
         mode="lint",
+        profile=profile,
+        profile_out=profile_out,
         vault=vault,
         apply=not dry_run,
         ni=ni,
-        action=lambda: run_lint(vault, apply=not dry_run),
+        action=lambda: run_lint(vault, apply=not dry_run, sparse=sparse),
         summary_payload=lambda r: {
             "dry_run": r.dry_run,
             "health_before": r.audit.health.total,
@@ -475,6 +622,25 @@ def links(
         "--log-format",
         help="Output format: text, json, plain. Default: plain when not a TTY.",
     ),
+    sparse: bool = typer.Option(
+        False,
+        "--sparse",
+        help="Check out only markdown in the worktree (skips Files/ and other "
+        "non-note trees); faster on vaults with large attachments. Sets "
+        "extensions.worktreeConfig=true in the vault repo's git config.",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record per-stage wall/CPU time and peak memory; added to the "
+        "--log-format json summary as 'profile'.",
+    ),
+    profile_out: Optional[Path] = typer.Option(
+        None,
+        "--profile-out",
+        help="Also write cProfile stats for the deterministic phase to this "
+        "file (implies --profile).",
+    ),
 ) -> None:
     """Broken-wikilink repair and cross-namespace ambiguity resolution."""
     _ensure_vault(vault)
@@ -488,10 +654,12 @@ def links(
     )
     _run_write_mode(
         mode="links",
+        profile=profile,
+        profile_out=profile_out,
         vault=vault,
         apply=not dry_run,
         ni=ni,
-        action=lambda: run_links(vault, apply=not dry_run),
+        action=lambda: run_links(vault, apply=not dry_run, sparse=sparse),
         summary_payload=lambda r: {
             "dry_run": r.dry_run,
             "health_before": r.audit.health.total,
@@ -524,6 +692,25 @@ def stubs(
         "--log-format",
         help="Output format: text, json, plain. Default: plain when not a TTY.",
     ),
+    sparse: bool = typer.Option(
+        False,
+        "--sparse",
+        help="Check out only markdown in the worktree (skips Files/ and other "
+        "non-note trees); faster on vaults with large attachments. Sets "
+        "extensions.worktreeConfig=true in the vault repo's git config.",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record per-stage wall/CPU time and peak memory; added to the "
+        "--log-format json summary as 'profile'.",
+    ),
+    profile_out: Optional[Path] = typer.Option(
+        None,
+        "--profile-out",
+        help="Also write cProfile stats for the deterministic phase to this "
+        "file (implies --profile).",
+    ),
 ) -> None:
     """Classify work-namespace stubs; fix broken_redirects; report stale_duplicates."""
     _ensure_vault(vault)
@@ -537,10 +724,12 @@ def stubs(
     )
     _run_write_mode(
         mode="stubs",
+        profile=profile,
+        profile_out=profile_out,
         vault=vault,
         apply=not dry_run,
         ni=ni,
-        action=lambda: run_stubs(vault, apply=not dry_run),
+        action=lambda: run_stubs(vault, apply=not dry_run, sparse=sparse),
         summary_payload=lambda r: {
             "dry_run": r.dry_run,
             "health_before": r.audit.health.total,
@@ -558,16 +747,28 @@ def mocs(
     dry_run: bool = typer.Option(
         True, "--dry-run/--fix", help="Read-only in the deterministic path."
     ),
+    suggest: bool = typer.Option(
+        False,
+        "--suggest",
+        help="Rank existing MOCs for each orphan by local embeddings "
+        "(needs the 'embeddings' extra).",
+    ),
 ) -> None:
     """MOC analysis: inventory, coverage, missing-MOC candidates."""
     _ensure_vault(vault)
-    _, report = run_mocs(vault)
+    try:
+        _, report = run_mocs(vault, suggest=suggest)
+    except EmbeddingsUnavailable as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        raise typer.Exit(code=EXIT_CONFIG_ERROR) from exc
     typer.echo(render_mocs_report(report))
 
 
 @app.command()
 def maintain(
-    vault: Path = typer.Argument(..., exists=True, file_okay=False, dir_okay=True),
+    vault: list[Path] = typer.Argument(
+        ..., exists=True, file_okay=False, dir_okay=True
+    ),
     modes: str = typer.Option(
         "lint,links,stubs,mocs",
         "--modes",
@@ -591,12 +792,87 @@ def maintain(
         "--log-format",
         help="Output format: text, json, plain. Default: plain when not a TTY.",
     ),
+    sparse: bool = typer.Option(
+        False,
+        "--sparse",
+        help="Check out only markdown in the worktree (skips Files/ and other "
+        "non-note trees); faster on vaults with large attachments. Sets "
+        "extensions.worktreeConfig=true in the vault repo's git config.",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Record per-stage wall/CPU time and peak memory; added to the "
+        "--log-format json summary as 'profile'.",
+    ),
+    profile_out: Optional[Path] = typer.Option(
+        None,
+        "--profile-out",
+        help="Also write cProfile stats for the deterministic phase to this "
+        "file (implies --profile).",
+    ),
+    batch: bool = typer.Option(
+        False,
+        "--vaults",
+        help="Maintain every VAULT argument in one process, each in its own "
+        "worktree under its own lock; one JSON line per vault. Not combinable "
+        "with --profile.",
+    ),
+    jobs: int = typer.Option(
+        DEFAULT_MAX_WORKERS, "--jobs", "-j", help="Worker threads for --vaults."
+    ),
 ) -> None:
     """Run multiple modes sequentially in a single worktree."""
+    mode_list = [m.strip() for m in modes.split(",") if m.strip()]
+
+    def _summary(r) -> dict[str, Any]:
+        return {
+            "dry_run": r.dry_run,
+            "modes": r.modes_requested,
+            "commit_count": len(r.commits),
+            **_handle_result(r.handle),
+        }
+
+    if batch:
+        if profile or profile_out is not None:
+            # Vaults run concurrently; stage timings and cProfile are per process.
+            console.print(
+                "[red]Error:[/red] [bold]--profile[/bold] / [bold]--profile-out"
+                "[/bold] can't be combined with [bold]--vaults[/bold]; profile "
+                "one vault at a time."
+            )
+            raise typer.Exit(code=EXIT_CONFIG_ERROR)
+        ni = _build_ni_config(
+            non_interactive=non_interactive,
+            apply=not dry_run,
+            max_cost_usd=max_cost_usd,
+            log_format=log_format,
+        )
+
+        def _maintain_one(path: Path) -> dict[str, Any]:
+            _ensure_vault(path)
+            if not dry_run:
+                _ensure_git_repo(path)
+            result = run_maintain(
+                path, modes=mode_list, apply=not dry_run, sparse=sparse
+            )
+            return _finish_mode(
+                mode="maintain",
+                vault=path,
+                apply=not dry_run,
+                ni=ni,
+                result=result,
+                summary_payload=_summary,
+                echo_report=False,
+            )
+
+        _run_batch(vault, _maintain_one, lock=not dry_run, jobs=jobs)
+        return
+
+    vault = _single_vault(vault)
     _ensure_vault(vault)
     if not dry_run:
         _ensure_git_repo(vault)
-    mode_list = [m.strip() for m in modes.split(",") if m.strip()]
     ni = _build_ni_config(
         non_interactive=non_interactive,
         apply=not dry_run,
@@ -605,16 +881,15 @@ def maintain(
     )
     _run_write_mode(
         mode="maintain",
+        profile=profile,
+        profile_out=profile_out,
         vault=vault,
         apply=not dry_run,
         ni=ni,
-        action=lambda: run_maintain(vault, modes=mode_list, apply=not dry_run),
-        summary_payload=lambda r: {
-            "dry_run": r.dry_run,
-            "modes": r.modes_requested,
-            "commit_count": len(r.commits),
-            **_handle_result(r.handle),
-        },
+        action=lambda: run_maintain(
+            vault, modes=mode_list, apply=not dry_run, sparse=sparse
+        ),
+        summary_payload=_summary,
         render=render_maintain,
     )
 
@@ -12,18 +12,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-from vault_agent.analyzers.audit import run_audit
+from vault_agent.analyzers.audit import VaultAudit, run_audit
 from vault_agent.analyzers.vault_index import scan
 from vault_agent.config import DEFAULT_CONFIG, VaultConfig
-from vault_agent.fixers.id_stripper import strip_legacy_id
 from vault_agent.fixers.link_patcher import (
     apply_rewrites,
+    rule_paths,
     summarize_rewrites,
     unqualify_kanban_links,
 )
 from vault_agent.fixers.stub_rewriter import rewrite_broken_redirects
-from vault_agent.fixers.tag_normalizer import normalize_tags
-from vault_agent.fixers.templater_cleaner import clean_templater_leakage
+from vault_agent.lint import apply_lint_plan, plan_lint
 from vault_agent.mocs_mode import build_report as build_mocs_report
 from vault_agent.orchestrator import commit_all, enter_worktree
 from vault_agent.worktree import (
@@ -41,61 +40,13 @@ class MaintainResult:
     commits: list[str]
     handle: WorktreeHandle | None
     mocs_summary: str
-
-
-def _translate(handle: WorktreeHandle, vault: Path, paths: list[Path]) -> list[Path]:
-    out: list[Path] = []
-    for p in paths:
-        try:
-            rel = p.relative_to(vault)
-        except ValueError:
-            out.append(p)
-            continue
-        out.append(handle.worktree_path / rel)
-    return out
+    # Pre-fix audit; the CLI checks it for leftover SDK work.
+    audit: VaultAudit | None = None
 
 
 def _run_lint_in(handle: WorktreeHandle, vault: Path) -> list[str]:
     audit = run_audit(vault)
-    fm = audit.frontmatter
-    commits: list[str] = []
-
-    # 1) id: strip
-    targets = _translate(handle, vault, list(fm.notes_with_legacy_id))
-    changed = strip_legacy_id(targets)
-    if changed:
-        msg = f"fix(frontmatter): remove legacy id: field from {len(changed)} notes"
-        if commit_all(handle, msg):
-            commits.append(msg)
-
-    # 2) Tag normalization
-    legacy_moc_paths: list[Path] = []
-    for note in audit.index.notes:
-        if any(t in ("🗺️", "🗺") for t in note.tags):
-            legacy_moc_paths.append(note.path)
-    tag_paths = sorted(
-        set(fm.notes_with_bare_placeholder)
-        | set(fm.notes_with_null_tags)
-        | set(legacy_moc_paths)
-    )
-    targets = _translate(handle, vault, tag_paths)
-    results = normalize_tags(targets)
-    c = sum(1 for r in results if r.changed)
-    if c:
-        msg = f"fix(tags): normalize bare 📝/🌱/🗺️/null in {c} notes"
-        if commit_all(handle, msg):
-            commits.append(msg)
-
-    # 3) Templater cleanup
-    targets = _translate(handle, vault, list(fm.notes_with_templater_leak))
-    results_t = clean_templater_leakage(targets)
-    c = sum(1 for r in results_t if r.changed)
-    if c:
-        msg = f"fix(templates): remove Templater leakage from {c} notes"
-        if commit_all(handle, msg):
-            commits.append(msg)
-
-    return commits
+    return apply_lint_plan(handle, vault, plan_lint(audit))
 
 
 def _run_links_in(
@@ -113,15 +64,16 @@ def _run_links_in(
     for rule, count in totals.items():
         new = applicable[rule]
         msg = f"fix(links): rewrite {count} × [[{rule}]] → [[{new}]]"
-        if commit_all(handle, msg):
+        if commit_all(handle, msg, paths=rule_paths(results, rule)):
             commits.append(msg)
 
     wt_index = scan(handle.worktree_path)
     kanban_results = unqualify_kanban_links(wt_index)
-    c = sum(1 for r in kanban_results if r.changed)
+    changed_paths = [r.path for r in kanban_results if r.changed]
+    c = len(changed_paths)
     if c:
         msg = f"fix(links): unqualify [[Kanban/X]] → [[X]] in {c} notes"
-        if commit_all(handle, msg):
+        if commit_all(handle, msg, paths=changed_paths):
             commits.append(msg)
     return commits
 
@@ -132,16 +84,17 @@ def _run_stubs_in(
     commits: list[str] = []
     wt_index = scan(handle.worktree_path)
     results = rewrite_broken_redirects(wt_index, config)
-    c = sum(1 for r in results if r.changed)
+    changed_paths = [r.path for r in results if r.changed]
+    c = len(changed_paths)
     if c:
         msg = f"fix(stubs): restore canonical redirect body in {c} work-namespace files"
-        if commit_all(handle, msg):
+        if commit_all(handle, msg, paths=changed_paths):
             commits.append(msg)
     return commits
 
 
 def run_maintain(
-    vault: Path, *, modes: list[str], apply: bool = False
+    vault: Path, *, modes: list[str], apply: bool = False, sparse: bool = False
 ) -> MaintainResult:
     vault = Path(vault).expanduser().resolve()
     invalid = [m for m in modes if m not in AVAILABLE_MODES]
@@ -166,9 +119,10 @@ def run_maintain(
             commits=[],
             handle=None,
             mocs_summary="\n".join(mocs_summary_lines),
+            audit=audit,
         )
 
-    handle = enter_worktree(vault)
+    handle = enter_worktree(vault, sparse=sparse)
     all_commits: list[str] = []
 
     if "lint" in modes:
@@ -185,6 +139,7 @@ def run_maintain(
         commits=all_commits,
         handle=handle,
         mocs_summary="\n".join(mocs_summary_lines),
+        audit=audit,
     )
 
 
@@ -9,15 +9,21 @@ Deterministic portions:
 Non-deterministic (require LLM judgment — deferred to the mocs subagent):
   * Creating a new MOC with curated section structure
   * Linking orphan notes into existing MOCs
+
+With ``suggest=True`` (``vault-agent mocs --suggest``, needs the
+``embeddings`` extra) each meaningful orphan also gets its nearest
+existing MOCs by embedding similarity, so the subagent — or the user —
+starts from ranked placements instead of a blank page.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from vault_agent.analyzers.audit import VaultAudit, run_audit
 from vault_agent.analyzers.mocs import MocReport
+from vault_agent.embeddings import NoteEmbeddings, embed_vault
 
 
 @dataclass
@@ -26,6 +32,8 @@ class MocsReport:
     legacy_tagged_mocs: list[Path]
     missing_moc_candidates: list[str]
     coverage: list[tuple[str, int, int]]  # (category, tagged, unlinked)
+    # orphan rel path → [(MOC basename, cosine similarity), ...]; --suggest only
+    placements: dict[str, list[tuple[str, float]]] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
         return {
@@ -33,6 +41,7 @@ class MocsReport:
             "legacy_tagged_mocs": [str(p) for p in self.legacy_tagged_mocs],
             "missing_moc_candidates": self.missing_moc_candidates,
             "coverage": self.coverage,
+            "placements": self.placements,
         }
 
 
@@ -50,11 +59,32 @@ def build_report(mocs: MocReport) -> MocsReport:
     )
 
 
-def run_mocs(vault: Path) -> tuple[VaultAudit, MocsReport]:
-    """Read-only: produce a MOC report. No writes in this mode (yet)."""
+def suggest_placements(
+    audit: VaultAudit, embeddings: NoteEmbeddings, *, k: int = 3
+) -> dict[str, list[tuple[str, float]]]:
+    """Rank existing MOCs for every meaningful orphan by embedding similarity."""
+    root = audit.vault_root
+    orphans = [p.relative_to(root).as_posix() for p in audit.graph.meaningful_orphans]
+    mocs = [m.path.relative_to(root).as_posix() for m in audit.mocs.mocs]
+    matches = embeddings.best_matches(orphans, mocs, k=k)
+    return {
+        orphan: [(Path(moc).stem, score) for moc, score in ranked]
+        for orphan, ranked in matches.items()
+    }
+
+
+def run_mocs(vault: Path, *, suggest: bool = False) -> tuple[VaultAudit, MocsReport]:
+    """Read-only: produce a MOC report. No writes in this mode (yet).
+
+    ``suggest`` adds embedding-ranked MOC placements for orphans; raises
+    :class:`~vault_agent.embeddings.EmbeddingsUnavailable` without the extra.
+    """
     vault = Path(vault).expanduser().resolve()
     audit = run_audit(vault)
-    return audit, build_report(audit.mocs)
+    report = build_report(audit.mocs)
+    if suggest:
+        report.placements = suggest_placements(audit, embed_vault(audit.index))
+    return audit, report
 
 
 def render_report(report: MocsReport) -> str:
@@ -95,4 +125,11 @@ def render_report(report: MocsReport) -> str:
             "deferred to the vault-mocs subagent."
         )
 
+    if report.placements:
+        lines.append("")
+        lines.append(f"Suggested MOC placements for orphans: {len(report.placements)}")
+        for orphan, ranked in sorted(report.placements.items()):
+            best = ", ".join(f"{name} ({score:.2f})" for name, score in ranked)
+            lines.append(f"  {orphan} → {best}")
+
     return "\n".join(lines)
@@ -23,19 +23,29 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import subprocess
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
 from vault_agent.analyzers.audit import VaultAudit, run_audit
+from vault_agent.search import (
+    MCP_SERVER_NAME,
+    SEARCH_TOOL_NAME,
+    create_search_server,
+    load_or_build,
+)
 from vault_agent.worktree import (
+    CommitLedger,
     WorktreeHandle,
     create_worktree,
     format_review_instructions,
     timestamped_branch,
     worktree_file_change_count,
 )
+from vault_agent.profiling import timed
 
 logger = logging.getLogger(__name__)
 
@@ -175,39 +185,128 @@ def _compact_audit_for_prompt(audit: VaultAudit, sample: int = 30) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def enter_worktree(vault: Path, *, prefix: str = "vault-agent") -> WorktreeHandle:
-    """Create a fresh worktree for a write run."""
+def enter_worktree(
+    vault: Path, *, prefix: str = "vault-agent", sparse: bool = False
+) -> WorktreeHandle:
+    """Create a fresh worktree for a write run.
+
+    The handle starts with an empty ``CommitLedger`` so deterministic runs
+    that commit through ``commit_all(paths=...)`` can report counts without
+    another ``git diff``. ``sparse`` checks out markdown only (see
+    ``worktree.create_worktree``).
+    """
     branch = timestamped_branch(prefix)
-    return create_worktree(vault, branch)
+    handle = create_worktree(vault, branch, sparse=sparse)
+    handle.ledger = CommitLedger()
+    return handle
+
+
+def _stage_contents(cwd: Path, contents: Mapping[Path, str]) -> None:
+    """Put ``contents`` in the index as blobs, leaving the files on disk alone."""
+    entries = []
+    for path, text in contents.items():
+        rel = str(path.relative_to(cwd))
+        blob = (
+            subprocess.run(
+                ["git", "hash-object", "-w", "--stdin", f"--path={rel}"],
+                cwd=cwd,
+                input=text.encode("utf-8"),
+                capture_output=True,
+                check=True,
+            )
+            .stdout.decode("ascii")
+            .strip()
+        )
+        mode = "100755" if os.access(path, os.X_OK) else "100644"
+        entries.append(f"{mode} {blob}\t{rel}\0")
+    subprocess.run(
+        ["git", "update-index", "-z", "--index-info"],
+        cwd=cwd,
+        input="".join(entries).encode("utf-8"),
+        check=True,
+        capture_output=True,
+    )
 
 
+@timed("git.commit")
 def commit_all(
-    handle: WorktreeHandle, message: str, *, paths: list[Path] | None = None
+    handle: WorktreeHandle,
+    message: str,
+    *,
+    paths: list[Path] | None = None,
+    contents: Mapping[Path, str] | None = None,
 ) -> bool:
-    """Stage and commit. Returns True if a commit was made."""
-    if paths:
-        rels = [str(p.relative_to(handle.worktree_path)) for p in paths]
+    """Stage and commit. Returns True if a commit was made.
+
+    With ``paths`` (the files a fixer reported as changed) only those paths
+    are staged, in one ``git add --pathspec-from-file`` spawn, and the
+    ``git status`` probe is skipped: an empty list returns False without
+    touching git, and a non-empty one goes straight to ``git commit``. The
+    committed paths are recorded on ``handle.ledger``.
+
+    ``contents`` maps some of ``paths`` to the text to commit for them
+    instead of what is on disk. That text is written as a blob and put in
+    the index directly, so a file whose later edits belong to another
+    commit can be committed at an intermediate state.
+
+    Without ``paths`` everything in the worktree is staged (``git add -A``)
+    and the ledger is dropped, since we no longer know what was committed.
+    """
+    cwd = handle.worktree_path
+    if paths is None:
+        handle.ledger = None
+        subprocess.run(["git", "add", "-A"], cwd=cwd, check=True)
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+        )
+        if not status.stdout.strip():
+            return False
         subprocess.run(
-            ["git", "add", "--", *rels], cwd=handle.worktree_path, check=True
+            ["git", "commit", "-m", message], cwd=cwd, check=True, capture_output=True
         )
-    else:
-        subprocess.run(["git", "add", "-A"], cwd=handle.worktree_path, check=True)
+        return True
 
-    status = subprocess.run(
-        ["git", "status", "--porcelain"],
-        cwd=handle.worktree_path,
-        capture_output=True,
-        text=True,
-    )
-    if not status.stdout.strip():
+    rels = sorted({str(p.relative_to(cwd)) for p in paths})
+    if not rels:
         return False
 
-    subprocess.run(
-        ["git", "commit", "-m", message],
-        cwd=handle.worktree_path,
-        check=True,
-        capture_output=True,
+    contents = contents or {}
+    from_disk = sorted({str(p.relative_to(cwd)) for p in paths if p not in contents})
+    if from_disk:
+        subprocess.run(
+            [
+                "git",
+                "--literal-pathspecs",
+                "add",
+                "--pathspec-from-file=-",
+                "--pathspec-file-nul",
+            ],
+            cwd=cwd,
+            input="\0".join(from_disk).encode("utf-8"),
+            check=True,
+            capture_output=True,
+        )
+    if contents:
+        _stage_contents(cwd, contents)
+    commit = subprocess.run(
+        ["git", "commit", "-m", message], cwd=cwd, capture_output=True
     )
+    if commit.returncode != 0:
+        # A fixer can report a file whose changes an earlier category
+        # already committed. Only then is "nothing staged" not an error.
+        staged = subprocess.run(["git", "diff", "--cached", "--quiet"], cwd=cwd)
+        if staged.returncode == 0:
+            return False
+        raise subprocess.CalledProcessError(
+            commit.returncode, commit.args, commit.stdout, commit.stderr
+        )
+
+    if handle.ledger is not None:
+        handle.ledger.commits += 1
+        handle.ledger.paths.update(rels)
     return True
 
 
@@ -453,6 +552,7 @@ async def run_mode_with_sdk(
 
     vault = Path(vault).expanduser().resolve()
     audit = preflight(vault)
+    search_index = load_or_build(vault, audit.index)
 
     if apply and handle is None:
         handle = enter_worktree(vault)
@@ -469,6 +569,7 @@ async def run_mode_with_sdk(
         "Grep",
         "TodoWrite",
         "Task",
+        SEARCH_TOOL_NAME,
     ]
 
     options = ClaudeAgentOptions(
@@ -477,6 +578,7 @@ async def run_mode_with_sdk(
         max_turns=60,
         allowed_tools=allowed_tools,
         permission_mode="acceptEdits",
+        mcp_servers={MCP_SERVER_NAME: create_search_server(search_index)},
         agents={
             name: defn for name, defn in ALL_DEFINITIONS.items() if defn is not None
         },
@@ -535,6 +637,9 @@ async def run_mode_with_sdk(
 
     from vault_agent.worktree import worktree_commit_count
 
+    # The LLM commits on its own, so the deterministic ledger no longer
+    # covers the branch — count from git from here on.
+    handle.ledger = None
     return OrchestratorResult(
         mode=mode,
         dry_run=not apply,
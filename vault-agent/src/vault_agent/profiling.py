@@ -0,0 +1,189 @@
+"""Per-stage timing for ``--profile`` runs.
+
+Stages are named blocks (``scan``, ``analyze.links``, ``fix.links``,
+``git.commit``, ``sdk``), marked with the :func:`stage` context manager
+or the :func:`timed` decorator. Outside a profiled run both reduce to a
+global lookup, so the instrumentation can stay in place.
+
+Inside :func:`profiled`, every stage records wall time
+(``perf_counter``), process CPU time (``process_time``) and the process
+memory high-water mark (``ru_maxrss``) when it ends. Stages with the same
+name are aggregated — ``git.commit`` runs once per category — and the
+:class:`Profile` renders as the ``profile`` block of the
+``--log-format json`` summary. Nested stages are recorded on their own,
+so a parent's time includes its children.
+
+``profile_out`` additionally runs ``cProfile`` for the duration of the
+block and writes a ``pstats`` file (``python -m pstats FILE``). The CLI
+only wraps the deterministic phases in it; SDK time is network-bound
+and shows up as the ``sdk`` stage instead.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ParamSpec, TypeVar
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+_NULL_STAGE = nullcontext()
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def _max_rss_mb() -> float | None:
+    """Process memory high-water mark in MiB, or None where unavailable."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+@dataclass
+class StageStats:
+    """Aggregated timings for every run of one stage name."""
+
+    calls: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    max_rss_mb: float | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "wall_s": round(self.wall_s, 4),
+            "cpu_s": round(self.cpu_s, 4),
+            "max_rss_mb": (
+                round(self.max_rss_mb, 1) if self.max_rss_mb is not None else None
+            ),
+        }
+
+
+@dataclass
+class Profile:
+    """Stage timings for one run, in first-seen order."""
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    pstats_path: Path | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, name: str, wall_s: float, cpu_s: float) -> None:
+        rss = _max_rss_mb()
+        with self._lock:
+            stats = self.stages.setdefault(name, StageStats())
+            stats.calls += 1
+            stats.wall_s += wall_s
+            stats.cpu_s += cpu_s
+            if rss is not None:
+                stats.max_rss_mb = max(stats.max_rss_mb or 0.0, rss)
+
+    def to_dict(self) -> dict:
+        return {
+            "wall_s": round(self.wall_s, 4),
+            "cpu_s": round(self.cpu_s, 4),
+            "max_rss_mb": _max_rss_mb(),
+            "stages": {name: s.to_dict() for name, s in self.stages.items()},
+            "pstats": str(self.pstats_path) if self.pstats_path else None,
+        }
+
+    def render(self) -> str:
+        """Plain-text table for the terminal."""
+        lines = [
+            f"{'stage':<24} {'calls':>5} {'wall s':>9} {'cpu s':>9} {'rss MiB':>8}"
+        ]
+        for name, s in self.stages.items():
+            rss = f"{s.max_rss_mb:8.1f}" if s.max_rss_mb is not None else f"{'-':>8}"
+            lines.append(
+                f"{name:<24} {s.calls:>5} {s.wall_s:>9.3f} {s.cpu_s:>9.3f} {rss}"
+            )
+        lines.append(f"{'total':<24} {'':>5} {self.wall_s:>9.3f} {self.cpu_s:>9.3f}")
+        if self.pstats_path:
+            lines.append(f"cProfile stats: {self.pstats_path}")
+        return "\n".join(lines)
+
+
+_ACTIVE: Profile | None = None
+
+
+@contextmanager
+def _timed(profile: Profile, name: str) -> Iterator[None]:
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        profile.record(name, time.perf_counter() - wall0, time.process_time() - cpu0)
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+    """Time the enclosed block as ``name`` when a profile is active."""
+    profile = _ACTIVE
+    if profile is None:
+        return _NULL_STAGE
+    return _timed(profile, name)
+
+
+def timed(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator form of :func:`stage` for whole functions."""
+
+    def decorate(fn: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(fn)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _ACTIVE is None:
+                return fn(*args, **kwargs)
+            with _timed(_ACTIVE, name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+@contextmanager
+def profiled(enabled: bool = True) -> Iterator[Profile | None]:
+    """Activate stage recording for the enclosed run; yields the :class:`Profile`."""
+    global _ACTIVE
+    if not enabled:
+        yield None
+        return
+    profile = Profile()
+    previous, _ACTIVE = _ACTIVE, profile
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        yield profile
+    finally:
+        profile.wall_s = time.perf_counter() - wall0
+        profile.cpu_s = time.process_time() - cpu0
+        _ACTIVE = previous
+
+
+@contextmanager
+def cprofile_to(path: Path | None) -> Iterator[None]:
+    """Run the block under ``cProfile`` and dump ``pstats`` to ``path`` (if given)."""
+    if path is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(path))
+        if _ACTIVE is not None:
+            _ACTIVE.pstats_path = path
@@ -7,11 +7,15 @@ vault-agent subagent. Same pattern as git-repo-agent's compiler.
 
 from __future__ import annotations
 
+import hashlib
 import re
 import sys
 from functools import lru_cache
 from pathlib import Path
 
+from vault_agent.prompts import cache as prompt_cache
+from vault_agent.prompts.sections import parse_sections
+
 _MODULE_DIR = Path(__file__).resolve().parent  # prompts/
 _REPO_ROOT = _MODULE_DIR.parent.parent.parent  # vault-agent/
 _PLUGINS_ROOT = _REPO_ROOT.parent  # claude-plugins/
@@ -111,31 +115,6 @@ def strip_frontmatter(content: str) -> str:
     return FRONTMATTER_RE.sub("", content, count=1)
 
 
-def parse_sections(content: str) -> list[tuple[str, str, str]]:
-    """Parse markdown into (heading, level_marker, body) triples.
-
-    The first triple may have an empty heading — that's the intro text
-    before any heading. Level marker is the literal ``#`` / ``##`` / ``###``.
-    """
-    sections: list[tuple[str, str, str]] = []
-    current_heading = ""
-    current_marker = ""
-    current_lines: list[str] = []
-
-    for line in content.splitlines(keepends=True):
-        heading_match = re.match(r"^(#{1,3})\s+(.+?)(\s*#*)?\s*$", line)
-        if heading_match:
-            sections.append((current_heading, current_marker, "".join(current_lines)))
-            current_marker = heading_match.group(1)
-            current_heading = heading_match.group(2).strip()
-            current_lines = []
-        else:
-            current_lines.append(line)
-
-    sections.append((current_heading, current_marker, "".join(current_lines)))
-    return sections
-
-
 def filter_sections(sections: list[tuple[str, str, str]]) -> str:
     """Keep domain-knowledge sections, drop metadata sections."""
     parts: list[str] = []
@@ -179,6 +158,30 @@ def compile_skill(skill_path: Path) -> str:
     return content.strip()
 
 
+@lru_cache(maxsize=1)
+def _compiler_digest() -> bytes:
+    """Hash of the compiler + section parser source — part of every cache key."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update((_MODULE_DIR / "sections.py").read_bytes())
+    return digest.digest()
+
+
+def _compile_skill_cached(skill_path: Path) -> str:
+    """``compile_skill`` backed by the on-disk prompt cache (see ``cache.py``).
+
+    Keyed by the compiler source and the input bytes, so editing either
+    one misses and recompiles.
+    """
+    inputs = [_compiler_digest(), skill_path.read_bytes()]
+    key = prompt_cache.make_key(*inputs)
+    cached = prompt_cache.load(key)
+    if cached is not None:
+        return cached
+    compiled = compile_skill(skill_path)
+    prompt_cache.store(key, compiled)
+    return compiled
+
+
 def compile_subagent(name: str, skill_paths: list[str]) -> str:
     """Compile all skills for a subagent into a combined prompt."""
     fragments: list[str] = []
@@ -189,7 +192,7 @@ def compile_subagent(name: str, skill_paths: list[str]) -> str:
             print(f"  WARNING: {rel_path} not found, skipping", file=sys.stderr)
             continue
 
-        fragment = compile_skill(skill_path)
+        fragment = _compile_skill_cached(skill_path)
         if fragment:
             skill_name = skill_path.parent.name
             fragments.append(f"## {skill_name}\n\n{fragment}")
@@ -206,6 +209,9 @@ def get_compiled_prompt(subagent_name: str) -> str:
     ``prompts/generated/<subagent>_skills.md`` shipped with the package
     (standalone install mode). Returns an empty string if the subagent has
     no configured skills, no sources, and no pre-compiled fallback.
+
+    Live-compiled skill fragments are also persisted in the on-disk prompt
+    cache, so later processes skip the section parsing.
     """
     skill_paths = SUBAGENT_SKILLS.get(subagent_name)
     if not skill_paths:
@@ -235,7 +241,7 @@ def get_compiled_skill(skill_relpath: str) -> str:
     """
     skill_path = _PLUGINS_ROOT / skill_relpath
     if skill_path.exists():
-        return compile_skill(skill_path)
+        return _compile_skill_cached(skill_path)
     fallback = _generated_skill_path(skill_relpath)
     if fallback.exists():
         return fallback.read_text(encoding="utf-8")
@@ -0,0 +1,73 @@
+"""Fence-aware markdown section parser for the prompt compiler.
+
+``parse_sections`` used to run an uncompiled ``re.match`` against every
+line of every skill and had no notion of fenced code blocks, so a shell
+comment like ``# install deps`` inside a fence started a new "section"
+and could be dropped or mis-filtered along with the rest of the block.
+
+This module walks the text once: a line is only tried against the
+precompiled heading pattern when it starts with ``#`` and no fence is
+open. Fences follow CommonMark — up to three spaces of indent, three or
+more backticks or tildes, closed by a run of the same character at least
+as long as the opener.
+
+Same module as git-repo-agent's ``prompts/sections.py``; benchmark with
+``git-repo-agent/scripts/bench_sections.py``.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+# Levels 1-3 only: deeper headings stay inside their parent section.
+HEADING_RE = re.compile(r"(#{1,3})\s+(.+?)(\s*#*)?\s*$")
+FENCE_RE = re.compile(r" {0,3}(`{3,}|~{3,})")
+
+
+class Section(NamedTuple):
+    """One heading and the text under it (a plain 3-tuple to callers)."""
+
+    heading: str  # "" for the intro before the first heading
+    marker: str  # the literal "#" / "##" / "###"
+    body: str
+
+
+def _closes_fence(line: str, fence: str) -> bool:
+    """True when ``line`` closes a fence opened with ``fence``."""
+    stripped = line.strip()
+    return stripped.startswith(fence) and not stripped.strip(fence[0])
+
+
+def parse_sections(content: str) -> list[Section]:
+    """Split ``content`` at level 1-3 headings outside fenced code blocks.
+
+    The first section may have an empty heading — that's the intro text
+    before any heading.
+    """
+    sections: list[Section] = []
+    heading = ""
+    marker = ""
+    lines: list[str] = []
+    fence = ""  # the opening run while inside a fenced block
+
+    for line in content.splitlines(keepends=True):
+        if fence:
+            if _closes_fence(line, fence):
+                fence = ""
+        elif line[:1] == "#":
+            match = HEADING_RE.match(line)
+            if match:
+                sections.append(Section(heading, marker, "".join(lines)))
+                marker = match.group(1)
+                heading = match.group(2).strip()
+                lines = []
+                continue
+        elif line[:1] in " `~":
+            opener = FENCE_RE.match(line)
+            if opener:
+                fence = opener.group(1)
+        lines.append(line)
+
+    sections.append(Section(heading, marker, "".join(lines)))
+    return sections
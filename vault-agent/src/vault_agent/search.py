@@ -0,0 +1,268 @@
+"""Local BM25 full-text index over the vault.
+
+The vault-links, vault-stubs and vault-mocs subagents need "notes related
+to X" candidates. Answering that with ``Grep``/``Glob`` over the whole
+vault costs several tool turns per question and reads every file again.
+This module builds an inverted index from the :class:`VaultIndex` the
+audit already scanned, ranks with BM25, and answers in milliseconds.
+
+Each note is one document made of three fields, folded into one bag of
+terms with per-field weights: the basename (title) counts
+``_TITLE_WEIGHT`` times, each tag ``_TAG_WEIGHT`` times, body terms once.
+
+The index is persisted as JSON in the user cache directory, one file per
+vault, together with a stat fingerprint (relative path, size, mtime) of
+every note. ``load_or_build`` reuses the stored index while the
+fingerprint still matches and rebuilds otherwise, so
+``vault-agent search`` skips the YAML/body parse on an unchanged vault.
+
+Exposed two ways: the ``vault-agent search`` command, and an in-process
+MCP tool (``mcp__vault__search``) registered on the SDK session by
+``orchestrator.run_mode_with_sdk``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from vault_agent.analyzers.vault_index import VaultIndex, _iter_markdown, scan
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout or tokenization changes.
+_FORMAT_VERSION = 1
+
+# BM25 parameters (the usual defaults).
+_K1 = 1.2
+_B = 0.75
+
+_TITLE_WEIGHT = 3
+_TAG_WEIGHT = 2
+
+_TOKEN_RE = re.compile(r"\w+")
+_STOPWORDS: frozenset[str] = frozenset(
+    {"an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it"}
+    | {"of", "on", "or", "that", "the", "this", "to", "with"}
+)
+
+# SDK names: server "vault", tool "search" → ``mcp__vault__search``.
+MCP_SERVER_NAME = "vault"
+SEARCH_TOOL_NAME = f"mcp__{MCP_SERVER_NAME}__search"
+
+
+def tokenize(text: str) -> list[str]:
+    """Casefolded word tokens, minus one-letter tokens and stopwords."""
+    return [
+        t
+        for t in _TOKEN_RE.findall(text.casefold())
+        if len(t) > 1 and t not in _STOPWORDS
+    ]
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked note."""
+
+    rel_path: str
+    score: float
+
+    def to_dict(self) -> dict:
+        return {"path": self.rel_path, "score": round(self.score, 4)}
+
+
+@dataclass
+class SearchIndex:
+    """Inverted index: term → [(doc id, weighted term frequency), ...]."""
+
+    doc_paths: list[str]
+    doc_lengths: list[int]
+    postings: dict[str, list[tuple[int, int]]]
+    fingerprint: str = ""
+    avg_length: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        total = sum(self.doc_lengths)
+        self.avg_length = total / len(self.doc_lengths) if self.doc_lengths else 0.0
+
+    def search(self, query: str, limit: int = 10) -> list[SearchHit]:
+        """Top ``limit`` notes for ``query`` by BM25 score."""
+        n_docs = len(self.doc_paths)
+        if not n_docs or limit <= 0:
+            return []
+        scores: dict[int, float] = {}
+        for term in dict.fromkeys(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc, tf in postings:
+                norm = _K1 * (1 - _B + _B * self.doc_lengths[doc] / self.avg_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (_K1 + 1) / (tf + norm)
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [SearchHit(self.doc_paths[doc], score) for doc, score in best]
+
+    def to_dict(self) -> dict:
+        return {
+            "version": _FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "doc_paths": self.doc_paths,
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SearchIndex:
+        return cls(
+            doc_paths=list(data["doc_paths"]),
+            doc_lengths=list(data["doc_lengths"]),
+            postings={
+                term: [(doc, tf) for doc, tf in entries]
+                for term, entries in data["postings"].items()
+            },
+            fingerprint=data.get("fingerprint", ""),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Build
+# ---------------------------------------------------------------------------
+
+
+def _fingerprint(vault_root: Path, paths: list[Path]) -> str:
+    """Hash of (relative path, size, mtime) for every note — cheap staleness check."""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        rel = path.relative_to(vault_root).as_posix()
+        digest.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def build_index(index: VaultIndex) -> SearchIndex:
+    """Build the BM25 index from an already-scanned vault."""
+    doc_paths: list[str] = []
+    doc_lengths: list[int] = []
+    postings: dict[str, list[tuple[int, int]]] = {}
+
+    for doc, note in enumerate(index.notes):
+        terms: Counter[str] = Counter()
+        for term in tokenize(note.basename):
+            terms[term] += _TITLE_WEIGHT
+        for tag in note.tags:
+            for term in tokenize(tag):
+                terms[term] += _TAG_WEIGHT
+        terms.update(tokenize(note.body))
+
+        doc_paths.append(note.rel_path.as_posix())
+        doc_lengths.append(sum(terms.values()))
+        for term, tf in terms.items():
+            postings.setdefault(term, []).append((doc, tf))
+
+    return SearchIndex(
+        doc_paths=doc_paths,
+        doc_lengths=doc_lengths,
+        postings=postings,
+        fingerprint=_fingerprint(index.vault_root, [n.path for n in index.notes]),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+def cache_path(vault_root: Path | str) -> Path:
+    """Where the index for ``vault_root`` is stored (one JSON file per vault)."""
+    root = Path(vault_root).expanduser().resolve()
+    base = os.environ.get("XDG_CACHE_HOME")
+    cache_root = Path(base).expanduser() if base else Path.home() / ".cache"
+    key = hashlib.sha256(str(root).encode()).hexdigest()[:16]
+    return cache_root / "vault-agent" / "search" / f"{key}.json"
+
+
+def save_index(search_index: SearchIndex, vault_root: Path | str) -> None:
+    """Persist the index. Failures are logged, never raised — it's a cache."""
+    path = cache_path(vault_root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(search_index.to_dict()), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as exc:
+        logger.debug("Search index write to %s failed: %s", path, exc)
+
+
+def _load_cached(vault_root: Path) -> SearchIndex | None:
+    try:
+        data = json.loads(cache_path(vault_root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+        return None
+    return SearchIndex.from_dict(data)
+
+
+def load_or_build(
+    vault_root: Path | str, index: VaultIndex | None = None
+) -> SearchIndex:
+    """Return the persisted index if the vault is unchanged, else rebuild it.
+
+    Pass ``index`` when the caller already scanned the vault (the audit
+    has); otherwise the vault is scanned only on a cache miss.
+    """
+    root = Path(vault_root).expanduser().resolve()
+    current = _fingerprint(root, list(_iter_markdown(root)))
+    cached = _load_cached(root)
+    if cached is not None and cached.fingerprint == current:
+        return cached
+    search_index = build_index(index if index is not None else scan(root))
+    save_index(search_index, root)
+    return search_index
+
+
+# ---------------------------------------------------------------------------
+# In-process MCP tool
+# ---------------------------------------------------------------------------
+
+
+def create_search_server(search_index: SearchIndex) -> Any:
+    """In-process SDK MCP server exposing ``search`` over ``search_index``.
+
+    Imports the SDK lazily, like ``orchestrator.run_mode_with_sdk``.
+    """
+    from claude_agent_sdk import create_sdk_mcp_server, tool
+
+    @tool(
+        "search",
+        "Rank vault notes by BM25 relevance to a free-text query (titles, "
+        "tags and bodies). Returns relative paths with scores, best first. "
+        "Use before Grep/Glob when looking for related or canonical notes.",
+        {"query": str, "limit": int},
+    )
+    async def search(args: dict[str, Any]) -> dict[str, Any]:
+        limit = int(args.get("limit") or 10)
+        hits = search_index.search(str(args.get("query", "")), limit=limit)
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": json.dumps([h.to_dict() for h in hits], indent=2),
+                }
+            ]
+        }
+
+    return create_sdk_mcp_server(name=MCP_SERVER_NAME, tools=[search])
@@ -60,7 +60,7 @@ def plan_stubs(audit: VaultAudit) -> StubsPlan:
     )
 
 
-def run_stubs(vault: Path, *, apply: bool = False) -> StubsResult:
+def run_stubs(vault: Path, *, apply: bool = False, sparse: bool = False) -> StubsResult:
     vault = Path(vault).expanduser().resolve()
     audit = run_audit(vault)
     plan = plan_stubs(audit)
@@ -70,19 +70,20 @@ def run_stubs(vault: Path, *, apply: bool = False) -> StubsResult:
             dry_run=True, plan=plan, audit=audit, handle=None, commits=[]
         )
 
-    handle = enter_worktree(vault)
+    handle = enter_worktree(vault, sparse=sparse)
     commits: list[str] = []
 
     # Rewrite broken redirects inside the worktree.
     wt_index = scan(handle.worktree_path)
     results = rewrite_broken_redirects(wt_index, audit.config)
-    changed = sum(1 for r in results if r.changed)
+    changed_paths = [r.path for r in results if r.changed]
+    changed = len(changed_paths)
     if changed:
         msg = (
             f"fix(stubs): restore canonical redirect body in "
             f"{changed} work-namespace files"
         )
-        if commit_all(handle, msg):
+        if commit_all(handle, msg, paths=changed_paths):
             commits.append(msg)
 
     return StubsResult(
@@ -0,0 +1,234 @@
+"""Deterministic synthetic vaults for benchmarks and scale tests.
+
+The unit tests run on hand-written vaults of a few notes, which cannot
+show how ``scan``, the analyzers or the fixers behave on a real vault of
+tens of thousands of notes. :func:`generate_vault` writes a vault with the
+same layout the analyzers expect — ``Zettelkasten/`` articles, ``Notes/``
+daily notes, MOCs tagged ``📝/moc``, and redirect stubs under the work
+namespace — shaped by a :class:`SyntheticSpec`:
+
+* ``links_per_note`` — mean outgoing wikilinks per article; targets are
+  skewed towards low-numbered notes so a few hubs collect most backlinks.
+* ``broken_link_rate`` — share of links pointing at notes that do not
+  exist. Half of those targets appear in the generated
+  ``.vault-agent.toml`` rewrite table, so ``links --fix`` has work to do.
+* ``tag_vocabulary`` / ``tag_skew`` — tags are drawn from a Zipf-like
+  distribution over a fixed vocabulary.
+* ``stub_rate`` — share of articles mirrored under the work namespace, as
+  clean, broken or stale redirect stubs.
+* ``lint_rate`` — share of notes carrying a legacy ``id:``, a bare ``📝``
+  tag or Templater leakage (what ``lint --fix`` repairs).
+
+The same spec and seed always produce byte-identical files, so timings
+from different commits are comparable. ``scripts/bench_vault.py`` is the
+main consumer.
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+from vault_agent.config import DEFAULT_CONFIG
+
+_WORDS = (
+    "alpha anchor archive atlas beacon binary bridge cache canvas carbon "
+    "cipher cluster compass delta drift echo ember engine falcon fiber "
+    "forest fractal garden glacier graph harbor helix horizon index kernel "
+    "lantern lattice ledger matrix meadow mirror nebula network orbit "
+    "packet pattern pixel prism quartz radius relay ridge river schema "
+    "signal socket spiral stream summit syntax thread tide vector vertex "
+    "voyage wave willow window zenith"
+).split()
+
+_TAG_ROOTS = ("🛠️", "💻", "📚", "🌍", "🧠")
+
+_DAILY_START = date(2020, 1, 1)
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Shape of a generated vault. ``notes`` counts Zettelkasten articles."""
+
+    notes: int = 1000
+    seed: int = 0
+    links_per_note: float = 4.0
+    broken_link_rate: float = 0.05
+    tag_vocabulary: int = 60
+    tag_skew: float = 1.1
+    max_tags_per_note: int = 3
+    stub_rate: float = 0.05
+    daily_rate: float = 0.1
+    notes_per_moc: int = 50
+    lint_rate: float = 0.05
+    body_paragraphs: int = 3
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class GeneratedVault:
+    """What :func:`generate_vault` wrote, for sanity checks in callers."""
+
+    root: Path
+    spec: SyntheticSpec
+    articles: int = 0
+    daily_notes: int = 0
+    mocs: int = 0
+    stubs: int = 0
+    links: int = 0
+    broken_links: int = 0
+    lint_issues: int = 0
+
+    @property
+    def total_notes(self) -> int:
+        return self.articles + self.daily_notes + self.mocs + self.stubs
+
+
+def _title(i: int) -> str:
+    """Unique, stable title for article ``i``."""
+    n = len(_WORDS)
+    return f"{_WORDS[i % n].title()} {_WORDS[(i // n) % n].title()} {i}"
+
+
+def _tag_vocabulary(size: int) -> list[str]:
+    vocab = []
+    for k in range(size):
+        root = _TAG_ROOTS[k % len(_TAG_ROOTS)]
+        word, lap = _WORDS[k % len(_WORDS)], k // len(_WORDS)
+        vocab.append(f"{root}/{word}{lap or ''}")
+    return vocab
+
+
+def _paragraph(rng: random.Random, words: int = 40) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _frontmatter(tags: list[str], extra: dict[str, str] | None = None) -> str:
+    lines = ["---"]
+    for key, value in (extra or {}).items():
+        lines.append(f"{key}: {value}")
+    lines.append("tags:")
+    lines.extend(f"  - {tag}" for tag in tags)
+    lines.append("---")
+    return "\n".join(lines) + "\n"
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def generate_vault(
+    root: Path | str, spec: SyntheticSpec | None = None
+) -> GeneratedVault:
+    """Write a synthetic vault under ``root`` (created if missing)."""
+    spec = spec or SyntheticSpec()
+    rng = random.Random(spec.seed)
+    root = Path(root)
+    (root / ".obsidian").mkdir(parents=True, exist_ok=True)
+    out = GeneratedVault(root=root, spec=spec)
+
+    vocab = _tag_vocabulary(spec.tag_vocabulary)
+    tag_weights = [1 / (k + 1) ** spec.tag_skew for k in range(len(vocab))]
+    titles = [_title(i) for i in range(spec.notes)]
+    missing = [f"Missing {w.title()}" for w in _WORDS[:20]]
+    rewrites = {old: titles[k % spec.notes] for k, old in enumerate(missing[::2])}
+
+    def link_target() -> str:
+        if rng.random() < spec.broken_link_rate:
+            out.broken_links += 1
+            return rng.choice(missing)
+        # Squaring a uniform variate skews towards low ids: hub notes.
+        return titles[int(spec.notes * rng.random() ** 2)]
+
+    def lint_noise(fm: dict[str, str], tags: list[str], body: str) -> str:
+        if rng.random() >= spec.lint_rate:
+            return body
+        out.lint_issues += 1
+        kind = rng.randrange(3)
+        if kind == 0:
+            fm["id"] = f"{rng.getrandbits(48):012x}"
+        elif kind == 1:
+            tags.append("📝")
+        else:
+            body = "<% tp.file.cursor(1) %>\n\n" + body
+        return body
+
+    # Zettelkasten articles
+    for i, title in enumerate(titles):
+        tags = list(
+            dict.fromkeys(
+                rng.choices(
+                    vocab, tag_weights, k=rng.randint(1, spec.max_tags_per_note)
+                )
+            )
+        )
+        n_links = rng.randint(0, int(2 * spec.links_per_note))
+        links = [f"[[{link_target()}]]" for _ in range(n_links)]
+        out.links += n_links
+        paragraphs = [_paragraph(rng) for _ in range(spec.body_paragraphs)]
+        body = "\n\n".join(paragraphs)
+        if links:
+            body += "\n\n## Related\n\n" + "\n".join(f"- {link}" for link in links)
+        fm: dict[str, str] = {"created": str(_DAILY_START + timedelta(days=i % 1500))}
+        body = lint_noise(fm, tags, f"# {title}\n\n{body}\n")
+        _write(root / "Zettelkasten" / f"{title}.md", _frontmatter(tags, fm) + body)
+        out.articles += 1
+
+    # MOCs: one per ``notes_per_moc`` articles, linking a contiguous slice.
+    for m in range(0, spec.notes, max(1, spec.notes_per_moc)):
+        members = titles[m : m + spec.notes_per_moc]
+        body = "\n".join(f"- [[{t}]]" for t in members)
+        _write(
+            root / "Zettelkasten" / f"MOC {m // spec.notes_per_moc}.md",
+            _frontmatter(["📝/moc"]) + f"# MOC {m // spec.notes_per_moc}\n\n{body}\n",
+        )
+        out.mocs += 1
+
+    # Daily notes
+    for d in range(int(spec.notes * spec.daily_rate)):
+        day = _DAILY_START + timedelta(days=d)
+        body = f"# {day}\n\n{_paragraph(rng, 20)}\n\n- [[{link_target()}]]\n"
+        out.links += 1
+        _write(root / "Notes" / f"{day}.md", _frontmatter(["📅"]) + body)
+        out.daily_notes += 1
+
+    # Work-namespace stubs: clean redirects, oversized (broken) redirects,
+    # and stale full copies without the redirect tag.
+    ns = Path(*DEFAULT_CONFIG.work_namespace)
+    context = {"context": DEFAULT_CONFIG.context_value}
+    for i in range(spec.notes):
+        if rng.random() >= spec.stub_rate:
+            continue
+        title = titles[i]
+        redirect = f"See [[Zettelkasten/{title}|{title}]] in the main knowledge base.\n"
+        kind = rng.randrange(3)
+        if kind == 0:
+            text = _frontmatter(["redirect"], context) + redirect
+        elif kind == 1:
+            text = _frontmatter(["redirect"], context) + redirect + _paragraph(rng, 80)
+        else:
+            text = _frontmatter([rng.choice(vocab)], context) + _paragraph(rng, 80)
+        _write(root / ns / f"{title}.md", text)
+        out.stubs += 1
+
+    if rewrites:
+        table = "\n".join(f'"{old}" = "{new}"' for old, new in rewrites.items())
+        _write(root / ".vault-agent.toml", f"[vault.broken_link_rewrites]\n{table}\n")
+    return out
+
+
+def init_git(root: Path | str) -> None:
+    """Make ``root`` a git repository with one commit (write modes need it)."""
+    env_args = ["-c", "user.name=vault-agent", "-c", "user.email=vault-agent@localhost"]
+    for args in (
+        ["init", "-q", "-b", "main"],
+        ["add", "-A"],
+        [*env_args, "commit", "-q", "-m", "chore: synthetic vault"],
+    ):
+        subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
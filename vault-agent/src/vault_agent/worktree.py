@@ -3,6 +3,24 @@
 Simpler than git-repo-agent's because vault-agent has no GitHub remote.
 After a write run we leave the branch on disk and print the review/merge
 commands for the user to run manually.
+
+Sparse worktrees
+----------------
+A full ``git worktree add`` checks out every blob, including the
+attachments under ``Files/`` that no deterministic fixer reads — on a
+multi-GB vault that dominates a lint or links run. With ``sparse=True``
+the worktree is added with ``--no-checkout`` and a non-cone
+sparse-checkout (:func:`sparse_patterns`) that materializes only markdown
+and the vault config, minus :data:`EXCLUDED_DIRS` and
+:data:`EXCLUDED_TOP` — the same trees ``scan`` skips. Files outside the
+pattern set stay in the index with the skip-worktree bit, so they are
+neither shown as deleted nor touched by commits on the branch.
+
+Git records the sparse settings in the worktree's own config, which turns
+on ``extensions.worktreeConfig`` in the vault repository. When it was
+off before, :data:`_OWNED_CONFIG_KEY` records that vault-agent turned it
+on, and :func:`cleanup_worktree` unsets both once no worktree has a
+``config.worktree`` left. A setting the user made is never touched.
 """
 
 from __future__ import annotations
@@ -12,14 +30,19 @@ import json
 import logging
 import os
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 
+from vault_agent.analyzers.vault_index import EXCLUDED_DIRS, EXCLUDED_TOP
+from vault_agent.profiling import timed
+
 logger = logging.getLogger(__name__)
 
 _LOCK_RELATIVE = Path(".claude") / "worktrees" / ".vault-agent.lock"
 _BRANCH_PREFIX = "vault-agent"
+# Set alongside extensions.worktreeConfig when a sparse checkout turned it on.
+_OWNED_CONFIG_KEY = "vault-agent.worktreeConfig"
 
 
 def timestamped_branch(prefix: str = _BRANCH_PREFIX) -> str:
@@ -90,6 +113,20 @@ def _pid_alive(pid: int) -> bool:
 # ---------------------------------------------------------------------------
 
 
+@dataclass
+class CommitLedger:
+    """Commits and paths recorded by ``orchestrator.commit_all``.
+
+    Lets reporting derive commit/file counts from the fixer results instead
+    of re-querying git. Only valid while every commit on the branch went
+    through ``commit_all``; anything else (an SDK session, a bare
+    ``git add -A`` commit) drops the ledger and reporting falls back to git.
+    """
+
+    commits: int = 0
+    paths: set[str] = field(default_factory=set)
+
+
 @dataclass
 class WorktreeHandle:
     """Result of create_worktree — paths and branch for later reporting."""
@@ -98,6 +135,8 @@ class WorktreeHandle:
     worktree_path: Path
     branch: str
     base_branch: str
+    ledger: CommitLedger | None = None
+    sparse: bool = False
 
 
 def get_base_branch(vault_path: Path) -> str:
@@ -111,7 +150,75 @@ def get_base_branch(vault_path: Path) -> str:
     ).stdout.strip()
 
 
-def create_worktree(vault_path: Path, branch: str) -> WorktreeHandle:
+def sparse_patterns() -> list[str]:
+    """Non-cone sparse-checkout patterns: markdown and config, minus excluded trees.
+
+    Later patterns win, so the ``!`` exclusions override ``*.md``.
+    :data:`EXCLUDED_DIRS` are excluded at any depth, as ``scan`` does.
+    """
+    patterns = ["*.md", "/.vault-agent.toml"]
+    patterns += [f"!/{top}/**" for top in sorted(EXCLUDED_TOP)]
+    patterns += [f"!**/{name}/**" for name in sorted(EXCLUDED_DIRS)]
+    return patterns
+
+
+def _config_is_true(cwd: Path, key: str) -> bool:
+    result = subprocess.run(
+        ["git", "config", "--bool", "--get", key],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() == "true"
+
+
+def _worktree_configs_in_use(repo_path: Path) -> bool:
+    """Does any worktree (main included) still have a ``config.worktree``?"""
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-common-dir"],
+        cwd=repo_path,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return True  # can't tell; leave the setting alone
+    common = repo_path / result.stdout.strip()
+    configs = [common / "config.worktree", *common.glob("worktrees/*/config.worktree")]
+    return any(path.is_file() and path.stat().st_size for path in configs)
+
+
+def _sparse_checkout(worktree_path: Path) -> None:
+    """Restrict a ``--no-checkout`` worktree to :func:`sparse_patterns`, then check out."""
+    enabled_before = _config_is_true(worktree_path, "extensions.worktreeConfig")
+    subprocess.run(
+        ["git", "sparse-checkout", "set", "--no-cone", "--stdin"],
+        cwd=worktree_path,
+        input="\n".join(sparse_patterns()) + "\n",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    subprocess.run(
+        ["git", "checkout", "--quiet"],
+        cwd=worktree_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    if not enabled_before:
+        subprocess.run(
+            ["git", "config", _OWNED_CONFIG_KEY, "true"],
+            cwd=worktree_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+
+@timed("git.worktree")
+def create_worktree(
+    vault_path: Path, branch: str, *, sparse: bool = False
+) -> WorktreeHandle:
     """Create an isolated worktree on ``branch`` branched off HEAD.
 
     Removes any stale *clean* worktree at the same path and deletes any
@@ -119,6 +226,8 @@ def create_worktree(vault_path: Path, branch: str) -> WorktreeHandle:
     worktree that has uncommitted or untracked changes, since branch names
     are minute-timestamped and two runs within the same minute would
     otherwise destroy the first's agent output.
+
+    ``sparse=True`` checks out markdown only (see the module docstring).
     """
     worktree_path = vault_path / ".claude" / "worktrees" / branch.replace("/", "-")
     worktree_path.parent.mkdir(parents=True, exist_ok=True)
@@ -152,13 +261,12 @@ def create_worktree(vault_path: Path, branch: str) -> WorktreeHandle:
         text=True,
     )
 
-    subprocess.run(
-        ["git", "worktree", "add", "-b", branch, str(worktree_path), base],
-        cwd=vault_path,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
+    add = ["git", "worktree", "add", "-b", branch, str(worktree_path), base]
+    if sparse:
+        add.insert(3, "--no-checkout")
+    subprocess.run(add, cwd=vault_path, capture_output=True, text=True, check=True)
+    if sparse:
+        _sparse_checkout(worktree_path)
 
     logger.info("Created worktree at %s on %s (base: %s)", worktree_path, branch, base)
     return WorktreeHandle(
@@ -166,11 +274,14 @@ def create_worktree(vault_path: Path, branch: str) -> WorktreeHandle:
         worktree_path=worktree_path,
         branch=branch,
         base_branch=base,
+        sparse=sparse,
     )
 
 
 def worktree_commit_count(handle: WorktreeHandle) -> int:
     """How many commits has the worktree added on top of the base branch?"""
+    if handle.ledger is not None:
+        return handle.ledger.commits
     result = subprocess.run(
         ["git", "rev-list", "--count", f"{handle.base_branch}..HEAD"],
         cwd=handle.worktree_path,
@@ -187,6 +298,8 @@ def worktree_commit_count(handle: WorktreeHandle) -> int:
 
 def worktree_file_change_count(handle: WorktreeHandle) -> int:
     """How many files changed vs. the base branch?"""
+    if handle.ledger is not None:
+        return len(handle.ledger.paths)
     result = subprocess.run(
         ["git", "diff", "--name-only", f"{handle.base_branch}..HEAD"],
         cwd=handle.worktree_path,
@@ -199,13 +312,26 @@ def worktree_file_change_count(handle: WorktreeHandle) -> int:
 
 
 def cleanup_worktree(handle: WorktreeHandle) -> None:
-    """Remove the worktree (branch stays). Safe if already removed."""
+    """Remove the worktree (branch stays). Safe if already removed.
+
+    Also unsets ``extensions.worktreeConfig`` if a sparse checkout turned
+    it on and no remaining worktree relies on it.
+    """
     subprocess.run(
         ["git", "worktree", "remove", "--force", str(handle.worktree_path)],
         cwd=handle.repo_path,
         capture_output=True,
         text=True,
     )
+    repo = handle.repo_path
+    if _config_is_true(repo, _OWNED_CONFIG_KEY) and not _worktree_configs_in_use(repo):
+        for key in ("extensions.worktreeConfig", _OWNED_CONFIG_KEY):
+            subprocess.run(
+                ["git", "config", "--unset", key],
+                cwd=repo,
+                capture_output=True,
+                text=True,
+            )
 
 
 def format_review_instructions(handle: WorktreeHandle) -> str:
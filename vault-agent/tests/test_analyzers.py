@@ -8,6 +8,7 @@ specific analyzer's report. Uses a ``_make_vault`` helper mirroring the
 from __future__ import annotations
 
 import textwrap
+import unicodedata
 from pathlib import Path
 
 
@@ -128,6 +129,51 @@ class TestVaultIndex:
         # Missing target
         assert index.is_broken("NoSuchNote")
 
+    def test_resolve_ignores_case_and_unicode_form(self, tmp_path: Path) -> None:
+        nfd = unicodedata.normalize("NFD", "Café Notes")
+        vault = _make_vault(tmp_path, {f"Zettelkasten/{nfd}.md": "body\n"})
+        index = scan(vault)
+        assert len(index.resolve("Café Notes")) == 1  # NFC link, NFD file
+        assert len(index.resolve("café notes")) == 1
+        assert len(index.resolve("zettelkasten/CAFÉ NOTES")) == 1
+
+    def test_exact_basename_wins_over_case_variant(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path, {"a/Docker.md": "one\n", "b/docker.md": "two\n"})
+        index = scan(vault)
+        assert [n.rel_path.as_posix() for n in index.resolve("Docker")] == [
+            "a/Docker.md"
+        ]
+        assert index.is_ambiguous("DOCKER")
+
+    def test_resolve_unique_path_suffix(self, tmp_path: Path) -> None:
+        vault = _make_vault(
+            tmp_path,
+            {
+                "Projects/Infra/Kanban/Main.md": "board\n",
+                "Projects/Web/Kanban/Main.md": "board\n",
+                "Projects/Infra/Notes/Plan.md": "plan\n",
+            },
+        )
+        index = scan(vault)
+        assert len(index.resolve("Notes/Plan")) == 1
+        assert len(index.resolve("Infra/Kanban/Main")) == 1
+        assert index.is_ambiguous("Kanban/Main")
+        # A suffix must match whole segments.
+        assert index.is_broken("otes/Plan")
+        assert index.is_broken("Other/Plan")
+
+    def test_broken_link_report_uses_normalized_resolution(
+        self, tmp_path: Path
+    ) -> None:
+        vault = _make_vault(
+            tmp_path,
+            {
+                "Zettelkasten/Kubernetes.md": "body\n",
+                "Notes/Today.md": "[[kubernetes]] and [[Zettelkasten/KUBERNETES]]\n",
+            },
+        )
+        assert analyze_links(scan(vault)).broken == []
+
 
 # ---------------------------------------------------------------------------
 # Frontmatter analyzer
@@ -274,6 +320,23 @@ class TestLinks:
         top = report.top_broken()
         assert top[0] == ("Gone", 3)
 
+    def test_records_share_index_paths(self, tmp_path: Path) -> None:
+        vault = _make_vault(
+            tmp_path,
+            {
+                "Zettelkasten/Docker.md": "# main\n",
+                "work/z/Docker.md": "# stub\n",
+                "Zettelkasten/Note.md": "See [[Docker]] and [[Gone]].\n",
+            },
+        )
+        index = scan(vault)
+        report = analyze_links(index)
+        note_paths = {id(n.path) for n in index.notes}
+        assert id(report.broken[0].source_path) in note_paths
+        amb = report.ambiguous[0]
+        assert {id(p) for p in [amb.source_path, *amb.candidate_paths]} <= note_paths
+        assert not hasattr(report.broken[0], "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # Graph analyzer
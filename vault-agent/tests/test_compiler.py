@@ -5,7 +5,6 @@ from __future__ import annotations
 from pathlib import Path
 
 import pytest
-
 from vault_agent.prompts.compiler import (
     SUBAGENT_SKILLS,
     compile_skill,
@@ -37,6 +36,23 @@ class TestParseSections:
         assert sections[1][1] == "##"
         assert sections[2][0] == "Second"
 
+    def test_hash_lines_inside_fence_stay_in_section(self) -> None:
+        content = "## Setup\n```bash\n# install deps\nuv sync\n```\n## Next\nb\n"
+        sections = parse_sections(content)
+        assert [s[0] for s in sections] == ["", "Setup", "Next"]
+        assert "# install deps" in sections[1][2]
+
+    def test_fence_closes_only_on_matching_run(self) -> None:
+        content = "~~~~\n```\n# still code\n~~~~\n# Heading\n"
+        sections = parse_sections(content)
+        assert [s[0] for s in sections] == ["", "Heading"]
+        assert "# still code" in sections[0][2]
+
+    def test_level_four_heading_is_body(self) -> None:
+        sections = parse_sections("## Top\n#### Deep\ntext\n")
+        assert len(sections) == 2
+        assert sections[1][2] == "#### Deep\ntext\n"
+
 
 class TestFilterSections:
     def test_drops_when_to_use(self) -> None:
@@ -115,3 +131,46 @@ class TestGetCompiledPrompt:
         for name in SUBAGENT_SKILLS:
             out = get_compiled_prompt(name)
             assert out, f"{name} compiled to empty string"
+
+
+class TestPromptCache:
+    """Compiled skills persist on disk, keyed by compiler + source content."""
+
+    @pytest.fixture
+    def skill(self, tmp_path: Path, monkeypatch) -> Path:
+        from vault_agent.prompts import compiler
+
+        monkeypatch.setenv("CLAUDE_PLUGINS_PROMPT_CACHE", str(tmp_path / "cache"))
+        monkeypatch.setattr(compiler, "_PLUGINS_ROOT", tmp_path)
+        path = tmp_path / "obsidian-plugin" / "skills" / "demo" / "SKILL.md"
+        path.parent.mkdir(parents=True)
+        path.write_text("---\nname: demo\n---\n\n## Core Operations\nfirst\n")
+        return path
+
+    def test_second_compile_is_served_from_disk(self, skill: Path, monkeypatch) -> None:
+        from vault_agent.prompts import compiler
+
+        first = compiler._compile_skill_cached(skill)
+        assert "first" in first
+
+        def _boom(_path: Path) -> str:
+            raise AssertionError("recompiled despite a cache hit")
+
+        monkeypatch.setattr(compiler, "compile_skill", _boom)
+        assert compiler._compile_skill_cached(skill) == first
+
+    def test_source_edit_invalidates(self, skill: Path) -> None:
+        from vault_agent.prompts import compiler
+
+        compiler._compile_skill_cached(skill)
+        skill.write_text("## Core Operations\nsecond\n")
+        assert "second" in compiler._compile_skill_cached(skill)
+
+    def test_disabled_cache_writes_nothing(
+        self, skill: Path, tmp_path: Path, monkeypatch
+    ) -> None:
+        from vault_agent.prompts import compiler
+
+        monkeypatch.setenv("CLAUDE_PLUGINS_PROMPT_CACHE", "off")
+        assert "first" in compiler._compile_skill_cached(skill)
+        assert not (tmp_path / "cache").exists()
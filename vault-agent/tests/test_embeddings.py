@@ -0,0 +1,142 @@
+"""Tests for the optional embedding cache and nearest-note queries.
+
+Skipped unless numpy (the ``embeddings`` extra) is installed. A tiny
+deterministic bag-of-words embedder stands in for the CPU model.
+"""
+
+from __future__ import annotations
+
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from vault_agent.analyzers import scan
+from vault_agent.analyzers.audit import run_audit
+from vault_agent.embeddings import cache_path, embed_vault
+from vault_agent.fixers.link_patcher import (
+    propose_rewrites,
+    semantic_basename_candidates,
+)
+from vault_agent.mocs_mode import suggest_placements
+
+np = pytest.importorskip("numpy")
+
+_VOCAB = ["kubernetes", "pod", "helm", "bread", "sourdough", "starter", "moc"]
+
+
+class _BagOfWords:
+    name = "test-bag-of-words"
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        return np.array(
+            [[t.lower().count(w) for w in _VOCAB] for t in texts], dtype=np.float32
+        )
+
+
+def _make_vault(tmp_path: Path, files: dict[str, str]) -> Path:
+    for rel, content in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(content).lstrip("\n"), encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    return _make_vault(
+        tmp_path / "vault",
+        {
+            "Zettelkasten/Kubernetes MOC.md": """
+                ---
+                tags: [📝/moc]
+                ---
+                kubernetes pod helm
+            """,
+            "Zettelkasten/Baking MOC.md": """
+                ---
+                tags: [📝/moc]
+                ---
+                bread sourdough
+            """,
+            "Zettelkasten/Pods.md": "A kubernetes pod runs containers.\n",
+            "Zettelkasten/Starter.md": "Feed the sourdough starter before bread.\n",
+        },
+    )
+
+
+class TestEmbedVault:
+    def test_vectors_are_cached_by_content(self, vault: Path) -> None:
+        embedder = _BagOfWords()
+        embed_vault(scan(vault), embedder)
+        assert len(embedder.encoded) == 4
+        assert cache_path(embedder.name, vault).is_file()
+
+        (vault / "Zettelkasten" / "Pods.md").write_text("helm charts deploy pods\n")
+        embed_vault(scan(vault), embedder)
+        assert len(embedder.encoded) == 5  # only the edited note re-embedded
+
+    def test_cache_keeps_only_current_notes(self, vault: Path) -> None:
+        embedder = _BagOfWords()
+        embed_vault(scan(vault), embedder)
+        (vault / "Zettelkasten" / "Pods.md").write_text("helm charts deploy pods\n")
+        (vault / "Zettelkasten" / "Starter.md").unlink()
+        embed_vault(scan(vault), embedder)
+
+        with np.load(cache_path(embedder.name, vault)) as data:
+            assert len(data["digests"]) == 3
+
+    def test_vaults_sharing_a_model_keep_their_vectors(
+        self, vault: Path, tmp_path: Path
+    ) -> None:
+        other = _make_vault(tmp_path / "other", {"Bread.md": "bread starter\n"})
+        embedder = _BagOfWords()
+        embed_vault(scan(vault), embedder)
+        embed_vault(scan(other), embedder)
+        embed_vault(scan(vault), embedder)
+        embed_vault(scan(other), embedder)
+        assert len(embedder.encoded) == 5  # each note embedded once
+
+    def test_related_excludes_self(self, vault: Path) -> None:
+        emb = embed_vault(scan(vault), _BagOfWords())
+        related = emb.related("Zettelkasten/Pods.md", k=1)
+        assert related[0][0] == "Zettelkasten/Kubernetes MOC.md"
+
+
+class TestSuggestions:
+    def test_orphans_ranked_against_mocs(self, vault: Path) -> None:
+        audit = run_audit(vault)
+        emb = embed_vault(audit.index, _BagOfWords())
+        placements = suggest_placements(audit, emb, k=1)
+        assert placements["Zettelkasten/Pods.md"][0][0] == "Kubernetes MOC"
+        assert placements["Zettelkasten/Starter.md"][0][0] == "Baking MOC"
+
+    def test_semantic_link_candidates(self, vault: Path) -> None:
+        embedder = _BagOfWords()
+        emb = embed_vault(scan(vault), embedder)
+        matches = semantic_basename_candidates("sourdough", emb, embedder, limit=2)
+        assert {m.basename for m in matches} == {"Baking MOC", "Starter"}
+
+    def test_triage_adds_semantic_candidates(self, vault: Path) -> None:
+        for i in range(3):
+            # The link is the only baking word in an otherwise k8s note.
+            (vault / f"Ref{i}.md").write_text(
+                "[[Sourdough]] kubernetes pod helm\n", encoding="utf-8"
+            )
+        audit = run_audit(vault)
+        proposals = propose_rewrites(
+            audit.links.top_broken(20), audit.index, embedder=_BagOfWords()
+        )
+        sourdough = next(p for p in proposals if p.target == "Sourdough")
+        assert sourdough.semantic_candidates[0].basename == "Baking MOC"
+        top = sourdough.to_dict()["semantic_candidates"][0]
+        assert top["basename"] == "Baking MOC"
@@ -5,13 +5,16 @@ from __future__ import annotations
 import textwrap
 from pathlib import Path
 
-
 from vault_agent.fixers import (
+    LEGACY_ID_TRANSFORM,
+    TAG_TRANSFORM,
+    TEMPLATER_TRANSFORM,
     clean_templater_leakage,
     normalize_tags,
     strip_legacy_id,
 )
 from vault_agent.fixers._frontmatter_io import load, save
+from vault_agent.fixers.executor import FixerSpec, run_fixers
 
 
 def _write(path: Path, content: str) -> None:
@@ -198,3 +201,123 @@ class TestTemplaterCleaner:
         _write(p, "---\ntags: []\n---\n\nclean body\n")
         results = clean_templater_leakage([p])
         assert not results[0].changed
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+
+class TestRunFixers:
+    def _specs(self, ids: list[Path], tags: list[Path], tpl: list[Path]):
+        return [
+            FixerSpec(LEGACY_ID_TRANSFORM, ids),
+            FixerSpec(TAG_TRANSFORM, tags),
+            FixerSpec(TEMPLATER_TRANSFORM, tpl),
+        ]
+
+    def test_merges_edits_on_shared_file(self, tmp_path: Path) -> None:
+        p = tmp_path / "n.md"
+        _write(p, "---\nid: 1\ntags: [📝, a]\n---\n\n<% tp.file.cursor(1) %>\nbody\n")
+        result = run_fixers(self._specs([p], [p], [p]))
+        assert result.changed == {"frontmatter": [p], "tags": [p], "templates": [p]}
+        assert result.written == [p]
+        stages = result.stages[p]
+        assert list(stages) == ["frontmatter", "tags", "templates"]
+        assert "id:" not in stages["frontmatter"]
+        assert "tags: [📝, a]" in stages["frontmatter"]
+        out = p.read_text()
+        assert stages["templates"] == out
+        assert "id:" not in out
+        assert "tags: [a]" in out
+        assert "<% tp." not in out
+
+    def test_reports_only_changed_files(self, tmp_path: Path) -> None:
+        dirty = tmp_path / "dirty.md"
+        clean = tmp_path / "clean.md"
+        _write(dirty, "---\nid: 1\n---\nbody\n")
+        _write(clean, "---\ntags: [a]\n---\nbody\n")
+        result = run_fixers(self._specs([dirty, clean], [clean], []))
+        assert result.changed == {"frontmatter": [dirty], "tags": [], "templates": []}
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        paths = []
+        for i in range(40):
+            p = tmp_path / "pool" / f"n{i:02d}.md"
+            _write(p, f"---\nid: {i}\ntags: [🗺️]\n---\n\n# {{{{title}}}}\n")
+            paths.append(p)
+        serial = tmp_path / "serial"
+        for p in paths:
+            _write(serial / p.name, p.read_text())
+        serial_paths = [serial / p.name for p in paths]
+
+        par = run_fixers(self._specs(paths, paths, paths), max_workers=4)
+        ser = run_fixers(
+            self._specs(serial_paths, serial_paths, serial_paths), max_workers=1
+        )
+
+        assert {k: len(v) for k, v in par.changed.items()} == {
+            k: len(v) for k, v in ser.changed.items()
+        }
+        for p, s in zip(paths, serial_paths):
+            assert p.read_text() == s.read_text()
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+
+class TestPipeline:
+    TRANSFORMS = (LEGACY_ID_TRANSFORM, TAG_TRANSFORM, TEMPLATER_TRANSFORM)
+
+    def _run(self, paths: list[Path]):
+        """Every transform targets every path, as in a full lint pass."""
+        return run_fixers([FixerSpec(t, paths) for t in self.TRANSFORMS])
+
+    def test_single_write_per_file(self, tmp_path: Path, monkeypatch) -> None:
+        from vault_agent.fixers import pipeline
+
+        p = tmp_path / "n.md"
+        _write(p, "---\nid: 1\ntags: [📝, a]\n---\n\n{{title}}\n")
+        saves: list[Path] = []
+        real_save = pipeline.save
+        monkeypatch.setattr(
+            pipeline, "save", lambda ff: (saves.append(ff.path), real_save(ff))
+        )
+
+        result = self._run([p])
+
+        assert saves == [p]
+        assert result.changed == {"frontmatter": [p], "tags": [p], "templates": [p]}
+        assert result.count("tags") == 1
+        out = p.read_text()
+        assert out == "---\ntags: [a]\n---\n\nn\n"
+
+    def test_records_per_transform_changes(self, tmp_path: Path) -> None:
+        a = tmp_path / "a.md"
+        b = tmp_path / "b.md"
+        c = tmp_path / "c.md"
+        _write(a, "---\nid: 1\n---\nbody\n")
+        _write(b, "---\ntags: [🗺️]\n---\nbody\n")
+        _write(c, "---\ntags: [a]\n---\nclean\n")
+
+        result = self._run([a, b, c, a])
+
+        assert result.changed == {"frontmatter": [a], "tags": [b], "templates": []}
+        assert result.written == [a, b]
+        assert c.read_text() == "---\ntags: [a]\n---\nclean\n"
+
+    def test_matches_sequential_fixers(self, tmp_path: Path) -> None:
+        content = "---\nid: 7\ntags:\n  - 📝\n  - 🗺️\n---\n\n<% tp.date %>\n{{title}}\n"
+        piped = tmp_path / "piped" / "Note.md"
+        seq = tmp_path / "seq" / "Note.md"
+        _write(piped, content)
+        _write(seq, content)
+
+        self._run([piped])
+        strip_legacy_id([seq])
+        normalize_tags([seq])
+        clean_templater_leakage([seq])
+
+        assert piped.read_text() == seq.read_text()
@@ -9,6 +9,7 @@ import pytest
 
 from vault_agent.analyzers.audit import run_audit
 from vault_agent.analyzers.vault_index import scan
+from vault_agent.embeddings import EmbeddingsUnavailable
 from vault_agent.fixers.link_patcher import (
     BasenameMatch,
     ConfidenceTier,
@@ -142,3 +143,20 @@ class TestProposeRewrites:
         for p in proposals:
             s = json.dumps(p.to_dict())
             assert "Pythn" in s or "target" in s
+
+    def test_semantic_candidates_empty_without_extra(self, tmp_path: Path) -> None:
+        class _Missing:
+            name = "missing"
+
+            def encode(self, texts):
+                raise EmbeddingsUnavailable("not installed")
+
+        files = {"Zettelkasten/Python.md": "# python\n"}
+        for i in range(5):
+            files[f"Zettelkasten/Ref{i}.md"] = "[[Pythn]]\n"
+        audit = run_audit(_make_vault(tmp_path, files))
+        proposals = propose_rewrites(
+            audit.links.top_broken(20), audit.index, embedder=_Missing()
+        )
+        assert proposals[0].top_canonical == "Python"
+        assert proposals[0].semantic_candidates == []
@@ -16,7 +16,6 @@ from unittest import mock
 
 import pytest
 from typer.testing import CliRunner
-
 from vault_agent.main import app
 from vault_agent.non_interactive import (
     EXIT_CONFIG_ERROR,
@@ -123,6 +122,73 @@ class TestLockAcquisition:
         assert not lock_path.exists(), "lock should be released after successful run"
 
 
+def _json_lines(stdout: str) -> list[dict]:
+    out = []
+    for line in stdout.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("{") and stripped.endswith("}"):
+            out.append(json.loads(stripped))
+    return out
+
+
+class TestBatchVaults:
+    def test_analyze_emits_one_line_per_vault(self, tmp_path: Path) -> None:
+        vaults = [_init_vault(tmp_path / name) for name in ("a", "b", "c")]
+        result = CliRunner().invoke(
+            app, ["analyze", "--vaults", *map(str, vaults), "--jobs", "2"]
+        )
+        assert result.exit_code == EXIT_SUCCESS
+        lines = _json_lines(result.stdout)
+        assert sorted(line["vault"] for line in lines) == sorted(map(str, vaults))
+        assert {line["status"] for line in lines} == {"ok"}
+        assert all("total" in line["health"] for line in lines)
+
+    def test_maintain_locked_vault_does_not_stop_batch(self, tmp_path: Path) -> None:
+        free, busy = _init_vault(tmp_path / "free"), _init_vault(tmp_path / "busy")
+        lock_path = busy / ".claude" / "worktrees" / ".vault-agent.lock"
+        lock_path.parent.mkdir(parents=True)
+        lock_path.write_text(json.dumps({"pid": os.getpid()}), encoding="utf-8")
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "maintain",
+                "--vaults",
+                str(free),
+                str(busy),
+                "--modes",
+                "lint",
+                "--fix",
+                "--non-interactive",
+            ],
+        )
+        assert result.exit_code == EXIT_LOCKED
+        by_vault = {line["vault"]: line for line in _json_lines(result.stdout)}
+        assert by_vault[str(free)]["status"] == "ok"
+        assert by_vault[str(free)]["mode"] == "maintain"
+        assert by_vault[str(busy)]["status"] == "locked"
+        assert not (free / ".claude" / "worktrees" / ".vault-agent.lock").exists()
+
+    @pytest.mark.parametrize(
+        "flags", [["--profile"], ["--profile-out", "maintain.prof"]]
+    )
+    def test_maintain_batch_rejects_profile(
+        self, tmp_path: Path, flags: list[str]
+    ) -> None:
+        a, b = _init_vault(tmp_path / "a"), _init_vault(tmp_path / "b")
+        result = CliRunner().invoke(
+            app, ["maintain", "--vaults", str(a), str(b), "--dry-run", *flags]
+        )
+        assert result.exit_code == EXIT_CONFIG_ERROR
+        assert "--vaults" in result.stdout
+        assert _json_lines(result.stdout) == []  # no vault was run
+
+    def test_several_vaults_without_flag_is_config_error(self, tmp_path: Path) -> None:
+        a, b = _init_vault(tmp_path / "a"), _init_vault(tmp_path / "b")
+        result = CliRunner().invoke(app, ["analyze", str(a), str(b)])
+        assert result.exit_code == EXIT_CONFIG_ERROR
+
+
 class TestJsonLogFormat:
     def test_emits_single_line_json_summary(self, vault: Path) -> None:
         """#1074 acceptance test: --log-format=json writes a parseable summary line."""
@@ -148,6 +214,37 @@ class TestJsonLogFormat:
         assert "health_before" in summary
         assert "branch" in summary
 
+    def test_profile_adds_stage_block(self, vault: Path, tmp_path: Path) -> None:
+        out = tmp_path / "lint.pstats"
+        result = CliRunner().invoke(
+            app,
+            [
+                "lint",
+                str(vault),
+                "--fix",
+                "--non-interactive",
+                "--log-format",
+                "json",
+                "--profile-out",
+                str(out),
+            ],
+        )
+        assert result.exit_code == EXIT_SUCCESS
+        (summary,) = _json_lines(result.stdout)
+        stages = summary["profile"]["stages"]
+        assert {"scan", "analyze.links", "git.worktree"} <= set(stages)
+        assert stages["scan"]["calls"] >= 1
+        assert summary["profile"]["pstats"] == str(out)
+        assert out.exists()
+
+    def test_no_profile_block_by_default(self, vault: Path) -> None:
+        result = CliRunner().invoke(
+            app,
+            ["lint", str(vault), "--fix", "--non-interactive", "--log-format", "json"],
+        )
+        (summary,) = _json_lines(result.stdout)
+        assert "profile" not in summary
+
     def test_text_format_emits_no_json_line(self, vault: Path) -> None:
         """When log_format is text/plain there's no JSON summary."""
         runner = CliRunner()
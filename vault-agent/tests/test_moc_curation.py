@@ -6,13 +6,18 @@ subagent calls — no LLM interaction.
 
 from __future__ import annotations
 
+import random
 import textwrap
+from pathlib import Path
 
 import pytest
 
 from vault_agent.fixers.moc_curation import (
     MocProposal,
+    LinkInsertion,
     insert_link_alphabetically,
+    insert_links,
+    insert_links_in_file,
     is_dataview_moc,
     parse_moc_sections,
     render_new_moc,
@@ -126,6 +131,74 @@ class TestInsertLinkAlphabetically:
             insert_link_alphabetically(DATAVIEW_MOC, "anything", "Foo")
 
 
+class TestInsertLinks:
+    def _sequential(self, body: str, insertions: list[LinkInsertion]) -> str:
+        for ins in insertions:
+            body = insert_link_alphabetically(
+                body, ins.heading, ins.target, alias=ins.alias
+            )
+        return body
+
+    def test_matches_sequential_inserts(self) -> None:
+        insertions = [
+            LinkInsertion("Languages", "Zig"),
+            LinkInsertion("Tools", "Make"),
+            LinkInsertion("Languages", "Go", "golang"),
+            LinkInsertion("Languages", "Python"),  # already present
+            LinkInsertion("Tools", "Docker"),
+            LinkInsertion("Languages", "Go"),  # added earlier in the batch
+            LinkInsertion("Tools", "tmux"),
+        ]
+        assert insert_links(BASIC_MOC, insertions) == self._sequential(
+            BASIC_MOC, insertions
+        )
+
+    def test_random_batches_match_sequential(self) -> None:
+        rng = random.Random(0)
+        words = ["Ada", "Bash", "C", "Dart", "Elm", "F#", "Go", "Haskell", "Io"]
+        unsorted = textwrap.dedent(
+            """
+            ## Languages
+            - [[Rust]]
+            - [[Python]]
+
+            ## Empty
+
+            ## Tools
+            Intro line without links.
+            - [[Git]]
+            - [[Neovim]]
+            """
+        ).lstrip()
+        for body in (BASIC_MOC, unsorted):
+            headings = [s.heading for s in parse_moc_sections(body).sections]
+            for _ in range(50):
+                batch = [
+                    LinkInsertion(rng.choice(headings), rng.choice(words))
+                    for _ in range(rng.randint(1, 8))
+                ]
+                assert insert_links(body, batch) == self._sequential(body, batch)
+
+    def test_accepts_plain_tuples(self) -> None:
+        out = insert_links(BASIC_MOC, [("Tools", "Make")])
+        assert out == insert_link_alphabetically(BASIC_MOC, "Tools", "Make")
+
+    def test_missing_section_rejects_whole_batch(self) -> None:
+        with pytest.raises(ValueError, match="section"):
+            insert_links(BASIC_MOC, [("Languages", "Go"), ("Nonexistent", "X")])
+
+    def test_no_change_returns_input(self) -> None:
+        assert insert_links(BASIC_MOC, [("Languages", "Rust")]) is BASIC_MOC
+
+    def test_file_written_once_only_when_changed(self, tmp_path: Path) -> None:
+        path = tmp_path / "Dev MOC.md"
+        path.write_text(BASIC_MOC, encoding="utf-8")
+        assert insert_links_in_file(path, [("Languages", "Go"), ("Tools", "Make")])
+        text = path.read_text(encoding="utf-8")
+        assert "[[Go]]" in text and "[[Make]]" in text
+        assert not insert_links_in_file(path, [("Languages", "Go")])
+
+
 class TestRenderNewMoc:
     def test_shape_matches_convention(self) -> None:
         proposal = MocProposal(
@@ -0,0 +1,71 @@
+"""Tests for ``--profile`` stage timing."""
+
+from __future__ import annotations
+
+import pstats
+from pathlib import Path
+
+from vault_agent import profiling
+from vault_agent.analyzers import scan
+from vault_agent.profiling import cprofile_to, profiled, stage, timed
+
+
+class TestStages:
+    def test_stage_is_noop_outside_profiled_run(self) -> None:
+        assert profiling._ACTIVE is None
+        with stage("scan"):
+            pass
+        assert profiling._ACTIVE is None
+
+    def test_records_calls_and_times(self) -> None:
+        with profiled() as prof:
+            for _ in range(3):
+                with stage("work"):
+                    sum(range(1000))
+        stats = prof.stages["work"]
+        assert stats.calls == 3
+        assert stats.wall_s > 0
+        assert prof.wall_s >= stats.wall_s
+        assert profiling._ACTIVE is None
+
+    def test_disabled_yields_none(self) -> None:
+        with profiled(False) as prof:
+            with stage("work"):
+                pass
+        assert prof is None
+
+    def test_timed_decorator_records_function(self, tmp_path: Path) -> None:
+        (tmp_path / "Note.md").write_text("body\n", encoding="utf-8")
+        with profiled() as prof:
+            index = scan(tmp_path)
+        assert len(index.notes) == 1
+        assert prof.stages["scan"].calls == 1
+
+    def test_timed_preserves_metadata(self) -> None:
+        @timed("x")
+        def helper() -> int:
+            """Doc."""
+            return 1
+
+        assert helper() == 1
+        assert helper.__name__ == "helper"
+        assert helper.__doc__ == "Doc."
+
+    def test_to_dict_shape(self) -> None:
+        with profiled() as prof:
+            with stage("scan"):
+                pass
+        data = prof.to_dict()
+        assert set(data) == {"wall_s", "cpu_s", "max_rss_mb", "stages", "pstats"}
+        assert set(data["stages"]["scan"]) == {"calls", "wall_s", "cpu_s", "max_rss_mb"}
+        assert "scan" in prof.render()
+
+
+class TestCProfile:
+    def test_dumps_pstats(self, tmp_path: Path) -> None:
+        out = tmp_path / "prof" / "run.pstats"
+        with profiled() as prof:
+            with cprofile_to(out):
+                sum(range(1000))
+        assert prof.pstats_path == out
+        assert pstats.Stats(str(out)).total_calls > 0
@@ -87,3 +87,22 @@ class TestUnknownToolPassthrough:
     def test_unknown_tool_allowed(self) -> None:
         decision = validate_tool_use("RandomTool", {"anything": True})
         assert decision.allow
+
+
+class TestCompiledRules:
+    def test_segment_match_is_whole_segment(self) -> None:
+        assert validate_tool_use(
+            "Write", {"file_path": "Notes/.gitignore-tips.md"}
+        ).allow
+        assert not validate_tool_use(
+            "Write", {"file_path": "vault\\.git\\config"}
+        ).allow
+
+    def test_reason_names_the_rule_that_fired(self) -> None:
+        decision = validate_tool_use("Bash", {"command": "ls && git clean -xfd"})
+        assert "git\\s+clean" in decision.reason
+
+    def test_repeated_command_is_memoized(self) -> None:
+        first = validate_tool_use("Bash", {"command": "git push --force"})
+        again = validate_tool_use("Bash", {"command": "git push --force"})
+        assert first is again
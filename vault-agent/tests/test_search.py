@@ -0,0 +1,109 @@
+"""Tests for the BM25 search index and the ``search`` command."""
+
+from __future__ import annotations
+
+import json
+import textwrap
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+from vault_agent.analyzers import scan
+from vault_agent.main import app
+from vault_agent.search import (
+    build_index,
+    cache_path,
+    load_or_build,
+    tokenize,
+)
+
+
+def _make_vault(tmp_path: Path, files: dict[str, str]) -> Path:
+    """Build a vault at ``tmp_path`` with the given ``rel_path → content`` dict."""
+    for rel, content in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(content).lstrip("\n"), encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def vault(tmp_path: Path) -> Path:
+    return _make_vault(
+        tmp_path / "vault",
+        {
+            "Zettelkasten/Kubernetes.md": """
+                ---
+                tags: [devops]
+                ---
+                Container orchestration with pods and deployments.
+            """,
+            "Zettelkasten/Helm Charts.md": """
+                ---
+                tags: [kubernetes]
+                ---
+                Packaging manifests for deployment.
+            """,
+            "Zettelkasten/Sourdough.md": "Bread baking with a starter.\n",
+        },
+    )
+
+
+class TestTokenize:
+    def test_casefolds_and_drops_stopwords(self) -> None:
+        assert tokenize("The Kubernetes API and a Pod") == ["kubernetes", "api", "pod"]
+
+
+class TestSearchIndex:
+    def test_title_outranks_tag_and_body(self, vault: Path) -> None:
+        hits = build_index(scan(vault)).search("kubernetes")
+        assert [h.rel_path for h in hits] == [
+            "Zettelkasten/Kubernetes.md",
+            "Zettelkasten/Helm Charts.md",
+        ]
+        assert hits[0].score > hits[1].score
+
+    def test_body_match_and_limit(self, vault: Path) -> None:
+        index = build_index(scan(vault))
+        assert [h.rel_path for h in index.search("deployment")] == [
+            "Zettelkasten/Helm Charts.md"
+        ]
+        assert len(index.search("kubernetes deployments bread", limit=1)) == 1
+
+    def test_unknown_terms_return_nothing(self, vault: Path) -> None:
+        assert build_index(scan(vault)).search("quantum") == []
+
+
+class TestPersistence:
+    def test_unchanged_vault_reuses_cached_index(
+        self, vault: Path, monkeypatch
+    ) -> None:
+        first = load_or_build(vault)
+        assert cache_path(vault).is_file()
+
+        def _boom(_root):
+            raise AssertionError("rescanned an unchanged vault")
+
+        monkeypatch.setattr("vault_agent.search.scan", _boom)
+        assert load_or_build(vault).doc_paths == first.doc_paths
+
+    def test_edit_triggers_rebuild(self, vault: Path) -> None:
+        load_or_build(vault)
+        (vault / "Zettelkasten" / "Terraform.md").write_text("Infrastructure code.\n")
+        hits = load_or_build(vault).search("infrastructure")
+        assert [h.rel_path for h in hits] == ["Zettelkasten/Terraform.md"]
+
+
+class TestSearchCommand:
+    def test_json_output(self, vault: Path) -> None:
+        result = CliRunner().invoke(
+            app, ["search", str(vault), "sourdough", "--format", "json"]
+        )
+        assert result.exit_code == 0
+        hits = json.loads(result.stdout)
+        assert hits[0]["path"] == "Zettelkasten/Sourdough.md"
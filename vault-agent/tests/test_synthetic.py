@@ -0,0 +1,51 @@
+"""Tests for the synthetic vault generator used by ``scripts/bench_vault.py``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from vault_agent.analyzers.audit import run_audit
+from vault_agent.synthetic import SyntheticSpec, generate_vault
+
+
+def _snapshot(root: Path) -> dict[str, str]:
+    return {
+        p.relative_to(root).as_posix(): p.read_text(encoding="utf-8")
+        for p in sorted(root.rglob("*"))
+        if p.is_file()
+    }
+
+
+class TestGenerateVault:
+    def test_same_seed_is_byte_identical(self, tmp_path: Path) -> None:
+        spec = SyntheticSpec(notes=60, seed=7)
+        generate_vault(tmp_path / "a", spec)
+        generate_vault(tmp_path / "b", spec)
+        assert _snapshot(tmp_path / "a") == _snapshot(tmp_path / "b")
+
+    def test_different_seed_differs(self, tmp_path: Path) -> None:
+        generate_vault(tmp_path / "a", SyntheticSpec(notes=60, seed=1))
+        generate_vault(tmp_path / "b", SyntheticSpec(notes=60, seed=2))
+        assert _snapshot(tmp_path / "a") != _snapshot(tmp_path / "b")
+
+    def test_audit_sees_generated_shape(self, tmp_path: Path) -> None:
+        spec = SyntheticSpec(
+            notes=200, broken_link_rate=0.2, stub_rate=0.2, lint_rate=0.2
+        )
+        generated = generate_vault(tmp_path, spec)
+        audit = run_audit(tmp_path)
+
+        assert len(audit.index.notes) == generated.total_notes
+        assert generated.articles == 200
+        assert audit.mocs.to_dict()["moc_count"] == generated.mocs
+        assert audit.stubs.total_stubs == generated.stubs > 0
+        assert audit.links.to_dict()["broken_count"] > 0
+        assert audit.config.broken_link_rewrites
+
+    def test_zero_rates_produce_clean_vault(self, tmp_path: Path) -> None:
+        spec = SyntheticSpec(
+            notes=50, broken_link_rate=0, stub_rate=0, lint_rate=0, daily_rate=0
+        )
+        generated = generate_vault(tmp_path, spec)
+        assert generated.broken_links == generated.stubs == generated.lint_issues == 0
+        assert not (tmp_path / "work").exists()
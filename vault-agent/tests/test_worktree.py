@@ -11,6 +11,8 @@ from pathlib import Path
 
 import pytest
 
+from vault_agent.lint import LintPlan, apply_lint_plan
+from vault_agent.orchestrator import commit_all, enter_worktree
 from vault_agent.worktree import (
     acquire_lock,
     create_worktree,
@@ -134,3 +136,246 @@ class TestWorktreeCollisionSafety:
         # Second call on a clean worktree is fine.
         handle2 = create_worktree(tmp_path, branch)
         assert handle2.worktree_path.exists()
+
+
+def _init_vault_with_media(path: Path) -> None:
+    _init_repo(path)
+    for rel, content in {
+        "Zettelkasten/Note.md": "# Note\n",
+        "Zettelkasten/img/diagram.png": "png",
+        "Files/scan.pdf": "pdf",
+        "Files/inbox.md": "# attached\n",
+        ".obsidian/app.json": "{}",
+        ".vault-agent.toml": "[vault]\n",
+    }.items():
+        (path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (path / rel).write_text(content)
+    subprocess.run(["git", "add", "-A"], cwd=path, check=True)
+    subprocess.run(["git", "commit", "-qm", "media"], cwd=path, check=True)
+
+
+class TestSparseWorktree:
+    def test_checks_out_markdown_only(self, tmp_path: Path) -> None:
+        _init_vault_with_media(tmp_path)
+        handle = create_worktree(tmp_path, timestamped_branch(), sparse=True)
+        wt = handle.worktree_path
+
+        assert handle.sparse is True
+        files = sorted(
+            p.relative_to(wt).as_posix()
+            for p in wt.rglob("*")
+            if p.is_file() and ".git" not in p.relative_to(wt).parts
+        )
+        assert files == [".vault-agent.toml", "Zettelkasten/Note.md", "seed.md"]
+        cleanup_worktree(handle)
+
+    def test_nested_excluded_dirs_are_skipped(self, tmp_path: Path) -> None:
+        _init_vault_with_media(tmp_path)
+        for rel in ("a/node_modules/x.md", "a/.trash/y.md", "a/kept.md"):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("# note\n")
+        subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True)
+        subprocess.run(["git", "commit", "-qm", "nested"], cwd=tmp_path, check=True)
+
+        handle = create_worktree(tmp_path, timestamped_branch(), sparse=True)
+        wt = handle.worktree_path
+        assert (wt / "a" / "kept.md").exists()
+        assert not (wt / "a" / "node_modules" / "x.md").exists()
+        assert not (wt / "a" / ".trash" / "y.md").exists()
+        cleanup_worktree(handle)
+
+    def test_skipped_files_survive_commits(self, tmp_path: Path) -> None:
+        _init_vault_with_media(tmp_path)
+        handle = enter_worktree(tmp_path, sparse=True)
+        note = handle.worktree_path / "Zettelkasten" / "Note.md"
+        note.write_text("# Note (fixed)\n")
+
+        assert commit_all(handle, "fix: note", paths=[note]) is True
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=handle.worktree_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert status == ""
+        tree = subprocess.run(
+            ["git", "ls-tree", "-r", "--name-only", handle.branch],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        assert "Files/scan.pdf" in tree
+        assert "Zettelkasten/img/diagram.png" in tree
+        assert worktree_file_change_count(handle) == 1
+        cleanup_worktree(handle)
+
+    def test_main_checkout_stays_full(self, tmp_path: Path) -> None:
+        _init_vault_with_media(tmp_path)
+        handle = create_worktree(tmp_path, timestamped_branch(), sparse=True)
+        assert (tmp_path / "Files" / "scan.pdf").exists()
+        listed = subprocess.run(
+            ["git", "sparse-checkout", "list"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+        )
+        assert "*.md" not in listed.stdout
+        cleanup_worktree(handle)
+
+    @staticmethod
+    def _worktree_config(repo: Path) -> str:
+        return subprocess.run(
+            ["git", "config", "--get", "extensions.worktreeConfig"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+    def test_cleanup_reverts_worktree_config(self, tmp_path: Path) -> None:
+        _init_vault_with_media(tmp_path)
+        first = create_worktree(tmp_path, "vault-agent/a", sparse=True)
+        second = create_worktree(tmp_path, "vault-agent/b", sparse=True)
+        assert self._worktree_config(tmp_path) == "true"
+
+        cleanup_worktree(first)  # the second sparse worktree still needs it
+        assert self._worktree_config(tmp_path) == "true"
+        cleanup_worktree(second)
+        assert self._worktree_config(tmp_path) == ""
+        config = (tmp_path / ".git" / "config").read_text()
+        assert "vault-agent" not in config
+
+    def test_cleanup_keeps_preexisting_worktree_config(self, tmp_path: Path) -> None:
+        _init_vault_with_media(tmp_path)
+        subprocess.run(
+            ["git", "config", "extensions.worktreeConfig", "true"],
+            cwd=tmp_path,
+            check=True,
+        )
+        handle = create_worktree(tmp_path, timestamped_branch(), sparse=True)
+        cleanup_worktree(handle)
+        assert self._worktree_config(tmp_path) == "true"
+
+
+class TestCommitAllPaths:
+    """``commit_all(paths=...)`` stages only reported paths and keeps a ledger."""
+
+    def test_empty_paths_skip_git(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        handle = enter_worktree(tmp_path)
+        (handle.worktree_path / "stray.md").write_text("untracked\n")
+
+        assert commit_all(handle, "fix: nothing", paths=[]) is False
+        assert handle.ledger is not None
+        assert handle.ledger.commits == 0
+        cleanup_worktree(handle)
+
+    def test_stages_only_reported_paths(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        handle = enter_worktree(tmp_path)
+        changed = handle.worktree_path / "seed.md"
+        changed.write_text("# seed (fixed)\n")
+        (handle.worktree_path / "stray.md").write_text("untracked\n")
+
+        assert commit_all(handle, "fix(lint): seed", paths=[changed]) is True
+
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=handle.worktree_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert "?? stray.md" in status
+        assert worktree_commit_count(handle) == 1
+        assert worktree_file_change_count(handle) == 1
+        cleanup_worktree(handle)
+
+    def test_already_committed_path_returns_false(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        handle = enter_worktree(tmp_path)
+        changed = handle.worktree_path / "seed.md"
+        changed.write_text("# seed (fixed)\n")
+
+        assert commit_all(handle, "fix(a): first", paths=[changed]) is True
+        assert commit_all(handle, "fix(b): second", paths=[changed]) is False
+        assert worktree_commit_count(handle) == 1
+        cleanup_worktree(handle)
+
+    def test_ledger_counts_match_git(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        handle = enter_worktree(tmp_path)
+        a = handle.worktree_path / "a.md"
+        b = handle.worktree_path / "b.md"
+        a.write_text("a\n")
+        b.write_text("b\n")
+        commit_all(handle, "fix: a", paths=[a])
+        commit_all(handle, "fix: a and b", paths=[a, b])
+
+        ledger_counts = (
+            worktree_commit_count(handle),
+            worktree_file_change_count(handle),
+        )
+        handle.ledger = None
+        git_counts = (
+            worktree_commit_count(handle),
+            worktree_file_change_count(handle),
+        )
+        assert ledger_counts == git_counts == (2, 2)
+        cleanup_worktree(handle)
+
+    def test_stage_all_drops_ledger(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        handle = enter_worktree(tmp_path)
+        (handle.worktree_path / "new.md").write_text("# new\n")
+
+        assert commit_all(handle, "chore: everything") is True
+        assert handle.ledger is None
+        assert worktree_commit_count(handle) == 1
+        cleanup_worktree(handle)
+
+
+class TestLintCommits:
+    """A note fixed by several categories gets each edit in its own commit."""
+
+    def test_shared_note_split_across_category_commits(self, tmp_path: Path) -> None:
+        _init_repo(tmp_path)
+        (tmp_path / "a.md").write_text("---\nid: 1\ntags: [📝, a]\n---\nbody\n")
+        (tmp_path / "b.md").write_text("---\ntags: [📝, b]\n---\nbody\n")
+        subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+        subprocess.run(["git", "commit", "-qm", "notes"], cwd=tmp_path, check=True)
+        handle = enter_worktree(tmp_path)
+        plan = LintPlan(
+            legacy_id=[tmp_path / "a.md"],
+            tag_issues=[tmp_path / "a.md", tmp_path / "b.md"],
+            templater=[],
+        )
+
+        commits = apply_lint_plan(handle, tmp_path, plan)
+
+        assert commits == [
+            "fix(frontmatter): remove legacy id: field from 1 notes",
+            "fix(tags): normalize bare 📝/🌱/🗺️/null in 2 notes",
+        ]
+
+        def git(*args: str) -> str:
+            return subprocess.run(
+                ["git", *args],
+                cwd=handle.worktree_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+
+        assert git("show", "--name-only", "--format=", "HEAD~1").split() == ["a.md"]
+        assert git("show", "HEAD~1:a.md") == "---\ntags: [📝, a]\n---\nbody\n"
+        assert git("show", "--name-only", "--format=", "HEAD").split() == [
+            "a.md",
+            "b.md",
+        ]
+        assert git("show", "HEAD:a.md") == (handle.worktree_path / "a.md").read_text()
+        assert git("status", "--porcelain") == ""
+        assert worktree_commit_count(handle) == 2
+        assert worktree_file_change_count(handle) == 2
+        cleanup_worktree(handle)